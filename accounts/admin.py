@@ -1,6 +1,6 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
-from .models import User, PushSubscription, Proposer, ProposerLevel, LocationHistory, Founder
+from .models import User, PushSubscription, Proposer, ProposerLevel, LocationHistory, LocationPing, Founder
 from .forms import CustomUserChangeForm, CustomAdminUserCreationForm
 
 class CustomUserAdmin(UserAdmin):
@@ -43,4 +43,5 @@ admin.site.register(PushSubscription)
 admin.site.register(Proposer)
 admin.site.register(ProposerLevel)
 admin.site.register(LocationHistory)
+admin.site.register(LocationPing)
 admin.site.register(Founder)
@@ -1,8 +1,17 @@
 import logging
 logger = logging.getLogger("accounts.crons")
 from accounts.management.compute_proposer_levels import compute_proposer_levels
+from accounts.management.flush_location_pings import flush_location_pings
 
 def compute_levels_job():
     logger.info("compute_levels_job: 시작")
     res = compute_proposer_levels()
-    logger.info(f"compute_levels_job: 완료 - users={len(res)}, updated={sum(res.values())}")
\ No newline at end of file
+    logger.info(f"compute_levels_job: 완료 - users={len(res)}, updated={sum(res.values())}")
+
+def flush_location_pings_job():
+    logger.info("flush_location_pings_job: 시작")
+    res = flush_location_pings(verbose=False)
+    logger.info(
+        f"flush_location_pings_job: 완료 - pending={res.pending}, written={res.written}, "
+        f"not_found={res.not_found}, retried={res.retried}, dropped={res.dropped}"
+    )
@@ -0,0 +1,30 @@
+from __future__ import annotations
+import logging
+from accounts.services import LocationPingFlushService, LocationPingFlushResult
+
+logger = logging.getLogger("accounts.crons")
+
+def flush_location_pings(batch_size: int | None = None, verbose: bool = True) -> LocationPingFlushResult:
+    """
+    LocationPing에 접수된 위치기록을 역지오코딩하여 LocationHistory에 저장합니다.
+
+    Args:
+        batch_size: 한 번에 처리할 접수 건수(없으면 settings.LOCATION_PING_BATCH_SIZE)
+        verbose: True면 요약 로그를 print
+
+    Returns:
+        LocationPingFlushResult
+    """
+    service = LocationPingFlushService(batch_size=batch_size) if batch_size else LocationPingFlushService()
+    result = service.run()
+
+    logger.info(
+        "[flush_location_pings] pending=%s, written=%s, not_found=%s, retried=%s, dropped=%s",
+        result.pending, result.written, result.not_found, result.retried, result.dropped,
+    )
+    if verbose:
+        print(
+            f"location pings: pending={result.pending}, written={result.written}, "
+            f"not_found={result.not_found}, retried={result.retried}, dropped={result.dropped}"
+        )
+    return result
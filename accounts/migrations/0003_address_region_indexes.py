@@ -0,0 +1,22 @@
+# Generated by Django 5.2.4 on 2026-10-18 06:20
+
+import django.db.models.fields.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_location_ping'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='locationhistory',
+            index=models.Index(django.db.models.fields.json.KeyTransform('sido', 'address'), django.db.models.fields.json.KeyTransform('sigungu', 'address'), django.db.models.fields.json.KeyTransform('eupmyundong', 'address'), name='location_history_address_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='proposerlevel',
+            index=models.Index(django.db.models.fields.json.KeyTransform('sido', 'address'), django.db.models.fields.json.KeyTransform('sigungu', 'address'), django.db.models.fields.json.KeyTransform('eupmyundong', 'address'), name='proposer_level_address_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-18 06:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_address_region_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='locationping',
+            name='claimed_at',
+            field=models.DateTimeField(blank=True, help_text='배치가 역지오코딩하려고 가져간 시각 (LOCATION_PING_CLAIM_TIMEOUT이 지나면 다른 배치가 다시 가져감)', null=True),
+        ),
+    ]
@@ -3,9 +3,11 @@ from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.db import models
+from django.utils import timezone
 from django_nanoid.models import NANOIDField
 from django.contrib.postgres.fields import ArrayField
 from utils.choices import SexChoices, IndustryChoices, FounderTargetChoices
+from utils.indexes import address_region_index
 from .managers import UserManager
 
 class User(AbstractUser):
@@ -137,6 +139,11 @@ class ProposerLevel(models.Model):
         ],
     )
 
+    class Meta:
+        indexes = [
+            address_region_index('proposer_level_address_idx'),
+        ]
+
     def __str__(self):
         return self.user.user.email
 
@@ -147,7 +154,7 @@ class LocationHistory(models.Model):
         related_name="location_history",
     )
     created_at = models.DateTimeField(
-        auto_now_add=True,
+        default=timezone.now,
     )
     address = models.JSONField(
         default=dict,
@@ -166,11 +173,49 @@ class LocationHistory(models.Model):
                 fields=['user','created_at'],
                 name='unique_user_created_at',
             )
-       ]
+        ]
+        indexes = [
+            address_region_index('location_history_address_idx'),
+        ]
 
     def __str__(self):
         return self.user.user.email
 
+class LocationPing(models.Model):
+    '''
+    위치기록 접수 대기열입니다. 역지오코딩 전의 좌표를 받아 두었다가 배치로 LocationHistory에 저장합니다.
+    '''
+    user = models.ForeignKey(
+        "Proposer",
+        on_delete=models.CASCADE,
+        related_name="location_pings",
+    )
+    created_at = models.DateTimeField()
+    latitude = models.FloatField()
+    longitude = models.FloatField()
+    attempts = models.PositiveSmallIntegerField(
+        default=0,
+    )
+    claimed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text='배치가 역지오코딩하려고 가져간 시각 (LOCATION_PING_CLAIM_TIMEOUT이 지나면 다른 배치가 다시 가져감)',
+    )
+    received_at = models.DateTimeField(
+        auto_now_add=True,
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user','created_at'],
+                name='unique_ping_user_created_at',
+            )
+        ]
+
+    def __str__(self):
+        return f'{self.user_id} {self.created_at}'
+
 class Founder(models.Model):
     id = NANOIDField(
         primary_key=True,
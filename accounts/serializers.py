@@ -230,3 +230,7 @@ class LocationHistoryCreateSerializer(serializers.Serializer):
     longitude = serializers.FloatField(required=True, allow_null=False)
     # 사용은 안 해도 명세상 필수
     accuracy = serializers.FloatField(required=True, allow_null=False)
+
+class LocationHistoryBulkItemSerializer(LocationHistoryCreateSerializer):
+    # 일괄 업로드에서는 정확도를 받지 않아도 됨
+    accuracy = serializers.FloatField(required=False, allow_null=True)
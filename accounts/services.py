@@ -2,12 +2,18 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Dict, Iterable, List, Optional, Tuple, DefaultDict
 from collections import defaultdict
-from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone as dt_timezone
+import logging
 
 from django.apps import apps as django_apps
 from django.conf import settings
-from django.db.models import Q
+from django.db import transaction
+from django.db.models import F, Q
 from django.utils import timezone
+from rest_framework.exceptions import NotFound
+
+logger = logging.getLogger(__name__)
 
 # ── 가중치/캡: 새 정책 ─────────────────────────────────────────────────────
 #  - visits(지역 방문일수) 40%
@@ -258,3 +264,213 @@ class ProposerWeeklyLevelComputer:
                 )
                 updated += 1
         return updated
+
+
+# ── 위치기록 배치 저장 ─────────────────────────────────────────────────────
+#  - "sync": 요청마다 역지오코딩 후 LocationHistory에 바로 저장
+#  - "buffered": 좌표를 LocationPing에 접수만 하고, 크론이 배치로 역지오코딩하여 저장
+LOCATION_HISTORY_INGESTION_MODE = getattr(settings, "LOCATION_HISTORY_INGESTION_MODE", "sync")
+LOCATION_PING_BATCH_SIZE = int(getattr(settings, "LOCATION_PING_BATCH_SIZE", 1000))
+LOCATION_PING_MAX_ATTEMPTS = int(getattr(settings, "LOCATION_PING_MAX_ATTEMPTS", 5))
+LOCATION_PING_GEOCODING_WORKERS = int(getattr(settings, "LOCATION_PING_GEOCODING_WORKERS", 8))
+LOCATION_PING_CLAIM_TIMEOUT = int(getattr(settings, "LOCATION_PING_CLAIM_TIMEOUT", 60 * 10))  # 초, 가져간 배치가 죽으면 10분 뒤 다시 처리
+
+_RETRY = object()
+
+def resolve_legal_addresses(coords: Iterable[Tuple[float, float]],
+                            workers: int = LOCATION_PING_GEOCODING_WORKERS) -> dict:
+    """
+    (latitude, longitude) 좌표마다 법정동 주소를 찾습니다. 캐시에 없는 좌표는 스레드 풀에서 동시에 역지오코딩합니다.
+    Returns:
+        {좌표: 법정동 주소 | None(주소 없음) | _RETRY(지도 서비스 오류)}
+    """
+    from maps.services import ReverseGeocodingService
+
+    coords = set(coords)
+    if not coords:
+        return {}
+    service = ReverseGeocodingService()
+
+    def resolve(coord):
+        latitude, longitude = coord
+        try:
+            return coord, service.get_position_to_legal({"latitude": latitude, "longitude": longitude})
+        except NotFound:
+            return coord, None
+        except Exception as e:
+            logger.warning(f"위치기록 역지오코딩 실패: {coord} {e}")
+            return coord, _RETRY
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(coords)))) as executor:
+        return dict(executor.map(resolve, coords))
+
+@dataclass
+class LocationPingFlushResult:
+    """
+    pending: 처리한 접수 건수
+    written: LocationHistory에 저장을 요청한 건수 (이미 있는 (user, created_at)은 DB에서 무시)
+    not_found: 주소를 찾을 수 없어 버린 건수
+    retried: 지도 서비스 오류로 다음에 다시 시도할 건수
+    dropped: 최대 시도 횟수를 넘겨 버린 건수
+    """
+    pending: int = 0
+    written: int = 0
+    not_found: int = 0
+    retried: int = 0
+    dropped: int = 0
+
+class LocationPingFlushService:
+    """
+    LocationPing에 접수된 좌표를 배치로 역지오코딩하여 LocationHistory에 저장합니다.
+    - 접수를 claimed_at으로 가져가는 트랜잭션과 결과를 저장하는 트랜잭션을 나누어, 네이버 API를 기다리는 동안 행 잠금을 잡지 않습니다.
+    - 여러 크론이 겹쳐 실행되어도 select_for_update(skip_locked=True)와 claimed_at으로 같은 접수를 나눠 가지지 않습니다.
+    - 같은 배치 안의 같은 좌표는 한 번만 역지오코딩합니다.
+    - 지도 서비스 오류로 실패한 접수는 attempts를 늘려 다음 실행에 다시 시도합니다.
+    """
+    def __init__(self,
+                 batch_size: int = LOCATION_PING_BATCH_SIZE,
+                 workers: int = LOCATION_PING_GEOCODING_WORKERS):
+        self.batch_size = batch_size
+        self.workers = workers
+
+        self.LocationPing    = django_apps.get_model("accounts", "LocationPing")
+        self.LocationHistory = django_apps.get_model("accounts", "LocationHistory")
+
+    def _flush_batch(self, after_id: int, result: LocationPingFlushResult) -> int | None:
+        """
+        after_id보다 큰 접수를 한 배치 처리하고, 처리한 마지막 id를 반환합니다. 접수가 없으면 None입니다.
+        1. 짧은 트랜잭션: 아무도 가져가지 않은(또는 가져간 지 LOCATION_PING_CLAIM_TIMEOUT이 지난) 접수에 claimed_at을 적고 커밋
+        2. 트랜잭션 밖: 역지오코딩
+        3. 짧은 트랜잭션: LocationHistory 저장, 끝난 접수 삭제, 다시 시도할 접수 반환
+        """
+        claimed_at = timezone.now()
+        with transaction.atomic():
+            pings = list(
+                self.LocationPing.objects
+                .select_for_update(skip_locked=True)
+                .filter(
+                    Q(claimed_at__isnull=True) | Q(claimed_at__lt=claimed_at - timedelta(seconds=LOCATION_PING_CLAIM_TIMEOUT)),
+                    id__gt=after_id,
+                )
+                .order_by("id")[:self.batch_size]
+            )
+            if not pings:
+                return None
+            self.LocationPing.objects.filter(id__in=[ping.id for ping in pings]).update(claimed_at=claimed_at)
+
+        legals = resolve_legal_addresses({(ping.latitude, ping.longitude) for ping in pings}, self.workers)
+
+        histories, done_ids, retry_ids = list(), list(), list()
+        for ping in pings:
+            legal = legals[(ping.latitude, ping.longitude)]
+            if legal is _RETRY:
+                if ping.attempts + 1 >= LOCATION_PING_MAX_ATTEMPTS:
+                    result.dropped += 1
+                    done_ids.append(ping.id)
+                else:
+                    result.retried += 1
+                    retry_ids.append(ping.id)
+                continue
+            if legal is None:
+                result.not_found += 1
+            else:
+                histories.append(self.LocationHistory(
+                    user_id=ping.user_id,
+                    address=legal,
+                    created_at=ping.created_at,
+                ))
+            done_ids.append(ping.id)
+
+        # 가져간 지 오래되어 다른 배치가 다시 가져간 접수는 그 배치가 정리합니다. (이력은 (user, created_at) 중복이 무시됨)
+        claimed = self.LocationPing.objects.filter(claimed_at=claimed_at)
+        with transaction.atomic():
+            self.LocationHistory.objects.bulk_create(histories, ignore_conflicts=True)
+            claimed.filter(id__in=done_ids).delete()
+            claimed.filter(id__in=retry_ids).update(attempts=F("attempts") + 1, claimed_at=None)
+
+        result.pending += len(pings)
+        result.written += len(histories)
+        return pings[-1].id
+
+    def run(self) -> LocationPingFlushResult:
+        result = LocationPingFlushResult()
+        last_id = 0
+        while last_id is not None:
+            last_id = self._flush_batch(last_id, result)
+        return result
+
+
+LOCATION_HISTORY_BULK_MAX_ITEMS = int(getattr(settings, "LOCATION_HISTORY_BULK_MAX_ITEMS", 1000))
+
+class LocationHistoryBulkService:
+    """
+    오프라인에서 모아 둔 위치기록 여러 건을 한 번에 저장하고, 항목마다 처리 결과를 반환합니다.
+    - (user, created_at)이 요청 안에서 겹치거나 이미 저장되어 있으면 "duplicate"
+    - 역지오코딩 캐시와 같은 geohash 격자 칸의 좌표는 한 번만 법정동 주소를 찾음
+    - 저장할 행은 bulk_create 한 번으로 저장
+    항목 상태: created | duplicate | invalid | not_found | failed(지도 서비스 오류, 다시 보내면 됨)
+    """
+    def __init__(self, proposer, workers: int = LOCATION_PING_GEOCODING_WORKERS):
+        self.proposer = proposer
+        self.workers = workers
+        self.LocationHistory = django_apps.get_model("accounts", "LocationHistory")
+
+    def create(self, items: List[dict]) -> List[dict]:
+        from maps import geohash
+        from maps.caches import REVERSE_GEOCODE_GEOHASH_PRECISION
+        from .serializers import LocationHistoryBulkItemSerializer
+
+        results: List[dict] = [{"index": index} for index in range(len(items))]
+
+        # 1) 항목별 검증 + 요청 안의 중복 제거
+        samples = dict()  # created_at → (index, latitude, longitude)
+        for index, item in enumerate(items):
+            ser = LocationHistoryBulkItemSerializer(data=item)
+            if not ser.is_valid():
+                results[index].update(status="invalid", errors=ser.errors)
+                continue
+            v = ser.validated_data
+            created_at = datetime.fromtimestamp(v["timestamp"] / 1000.0, tz=dt_timezone.utc)
+            if created_at in samples:
+                results[index]["status"] = "duplicate"
+                continue
+            samples[created_at] = (index, v["latitude"], v["longitude"])
+
+        # 2) 이미 저장된 기록 제외
+        if samples:
+            existing = set(
+                self.LocationHistory.objects.filter(
+                    user=self.proposer, created_at__in=list(samples),
+                ).values_list("created_at", flat=True)
+            )
+            for created_at in existing:
+                index, _, _ = samples.pop(created_at)
+                results[index]["status"] = "duplicate"
+
+        # 3) 격자 칸마다 한 좌표로 법정동 주소 찾기
+        cells = dict()  # geohash → 대표 좌표
+        sample_cells = dict()
+        for created_at, (_, latitude, longitude) in samples.items():
+            cell = geohash.encode(latitude, longitude, REVERSE_GEOCODE_GEOHASH_PRECISION)
+            cells.setdefault(cell, (latitude, longitude))
+            sample_cells[created_at] = cell
+        legals = resolve_legal_addresses(cells.values(), self.workers)
+
+        # 4) 한 번에 저장
+        histories = list()
+        for created_at, (index, _, _) in samples.items():
+            legal = legals[cells[sample_cells[created_at]]]
+            if legal is _RETRY:
+                results[index]["status"] = "failed"
+            elif legal is None:
+                results[index]["status"] = "not_found"
+            else:
+                histories.append(self.LocationHistory(
+                    user=self.proposer,
+                    address=legal,
+                    created_at=created_at,
+                ))
+                results[index].update(status="created", address=legal)
+        self.LocationHistory.objects.bulk_create(histories, ignore_conflicts=True)
+
+        return results
@@ -4,7 +4,8 @@ from .views import (
     AccountsAccessTokenRoot,
     AccountsRoot,
     AccountsProfileRoot,
-    AccountsLocationHistoryRoot
+    AccountsLocationHistoryRoot,
+    AccountsLocationHistoryBulk,
 )
 
 app_name = 'accounts'
@@ -14,6 +15,7 @@ urlpatterns = [
     path("access-token", AccountsAccessTokenRoot.as_view(), name="accounts-access-token"),
     path("", AccountsRoot.as_view(), name="accounts-root"),
     path("location-history", AccountsLocationHistoryRoot.as_view()),
+    path("location-history/bulk", AccountsLocationHistoryBulk.as_view()),
     path("<str:profile>", AccountsProfileRoot.as_view(), name="accounts-profile"),
     
 ]
@@ -10,10 +10,16 @@ from rest_framework_simplejwt.tokens import RefreshToken, AccessToken
 from django.utils.crypto import get_random_string
 
 from maps.services import ReverseGeocodingService
+from .services import (
+    LOCATION_HISTORY_INGESTION_MODE,
+    LOCATION_HISTORY_BULK_MAX_ITEMS,
+    LocationHistoryBulkService,
+)
 from .models import (
     Proposer,
     Founder,
-    LocationHistory
+    LocationHistory,
+    LocationPing,
 )
 from .serializers import (
     UserLoginSerializer,
@@ -410,6 +416,7 @@ class AccountsLocationHistoryRoot(APIView):
     """
     POST /accounts/location-history
     - 좌표 → 법정동 변환 후 LocationHistory에 저장
+    - LOCATION_HISTORY_INGESTION_MODE가 "buffered"면 LocationPing에 접수만 하고 202 반환 (크론이 배치로 저장)
     """
     authentication_classes = [JWTAuthentication]
     permission_classes = [IsAuthenticated]
@@ -428,17 +435,30 @@ class AccountsLocationHistoryRoot(APIView):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        # 3) 좌표 → 법정동 주소 변환
+        # 3) 클라이언트 timestamp(ms) → created_at 설정
+        created_at = datetime.fromtimestamp(v["timestamp"] / 1000.0, tz=dt_timezone.utc)
+
+        # 4) 접수 모드(buffered): 좌표만 대기열에 넣고, 역지오코딩과 저장은 크론이 배치로 처리
+        if LOCATION_HISTORY_INGESTION_MODE == "buffered":
+            LocationPing.objects.bulk_create(
+                [LocationPing(
+                    user=proposer,
+                    created_at=created_at,
+                    latitude=v["latitude"],
+                    longitude=v["longitude"],
+                )],
+                ignore_conflicts=True,
+            )
+            return Response({"detail": "위치기록을 접수했어요."}, status=status.HTTP_202_ACCEPTED)
+
+        # 5) 좌표 → 법정동 주소 변환
         svc = ReverseGeocodingService()
         legal = svc.get_position_to_legal(
             {"latitude": v["latitude"], "longitude": v["longitude"]}
         )
         # legal 예: {"sido": ..., "sigungu": ..., "eupmyundong": ...}
 
-        # 4) 클라이언트 timestamp(ms) → created_at 설정
-        created_at = datetime.fromtimestamp(v["timestamp"] / 1000.0, tz=dt_timezone.utc)
-
-        # 5) 저장 (user, created_at 유니크 → 중복시 409)
+        # 6) 저장 (user, created_at 유니크 → 중복시 409)
         try:
             LocationHistory.objects.create(
                 user=proposer,
@@ -452,3 +472,35 @@ class AccountsLocationHistoryRoot(APIView):
             )
 
         return Response({"detail": "위치기록을 추가했어요."}, status=status.HTTP_201_CREATED)
+
+class AccountsLocationHistoryBulk(APIView):
+    """
+    POST /accounts/location-history/bulk
+    - 오프라인에서 모아 둔 위치기록 배열([{latitude, longitude, timestamp}, ...])을 한 번에 저장
+    - 항목마다 status(created | duplicate | invalid | not_found | failed)를 입력 순서대로 반환
+    """
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        items = request.data
+        if not isinstance(items, list) or not items:
+            return Response(
+                {"detail": "위치기록 배열을 보내 주세요."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(items) > LOCATION_HISTORY_BULK_MAX_ITEMS:
+            return Response(
+                {"detail": f"위치기록은 한 번에 {LOCATION_HISTORY_BULK_MAX_ITEMS}개까지 보낼 수 있어요."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        proposer = getattr(request.user, "proposer", None)
+        if proposer is None:
+            return Response(
+                {"detail": "proposer 프로필이 존재하지 않습니다. 먼저 생성하세요."},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        results = LocationHistoryBulkService(proposer).create(items)
+        return Response({"results": results}, status=status.HTTP_200_OK)
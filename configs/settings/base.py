@@ -177,6 +177,14 @@ SIMPLE_JWT = {
 CRONJOBS = [
     ('0 0 * * *',  'fundings.crons.settle_fundings_job'),  # 매일 자정(00:00)
     ('0 0 * * 1',  'accounts.crons.compute_levels_job'),    # 매주 월요일 자정(00:00)
+    ('*/10 * * * *',  'recommendations.crons.embed_proposals_job'),  # 10분마다
+    ('5-59/10 * * * *',  'recommendations.crons.sync_proposal_ann_index_job'),  # 10분마다 (임베딩 5분 뒤)
+    ('* * * * *',  'recommendations.crons.refresh_recommendation_feeds_job'),  # 1분마다
+    ('0 * * * *',  'maps.crons.warm_geocode_cache_job'),  # 매시 정각
+    ('* * * * *',  'accounts.crons.flush_location_pings_job'),  # 1분마다
+    ('30 3 * * *',  'proposals.crons.reconcile_proposal_counters_job'),  # 매일 03:30
+    ('40 3 * * *',  'fundings.crons.reconcile_funding_counters_job'),  # 매일 03:40
+    ('45 3 * * *',  'maps.crons.rebuild_region_counts_job'),  # 매일 03:45
 ]
 
 CRONJOBS_TIMEZONE = 'Asia/Seoul'
@@ -275,4 +283,7 @@ LOGGING["loggers"].update({
     "accounts.tasks":  {"handlers": ["cron_file", "console"], "level": "INFO", "propagate": False},
     "fundings.crons":  {"handlers": ["cron_file", "console"], "level": "INFO", "propagate": False},
     "fundings.tasks":  {"handlers": ["cron_file", "console"], "level": "INFO", "propagate": False},
+    "proposals.crons":  {"handlers": ["cron_file", "console"], "level": "INFO", "propagate": False},
+    "recommendations.crons":  {"handlers": ["cron_file", "console"], "level": "INFO", "propagate": False},
+    "maps.crons":  {"handlers": ["cron_file", "console"], "level": "INFO", "propagate": False},
 })
@@ -1,7 +1,31 @@
 from django.contrib import admin
+from django.db import transaction
 from .models import Funding, Reward, ProposerReward, ProposerLikeFunding, ProposerScrapFunding, FounderScrapFunding
+from .services import record_funding_region_change
+
+@admin.register(Funding)
+class FundingAdmin(admin.ModelAdmin):
+    """
+    펀딩은 관리자에서 만들고 상태를 바꾸므로, 저장/삭제할 때 지도 클러스터 집계도 함께 고칩니다.
+    """
+    def save_model(self, request, obj, form, change):
+        before = Funding.objects.select_related("proposal").filter(pk=obj.pk).first() if change else None
+        with transaction.atomic():
+            super().save_model(request, obj, form, change)
+            record_funding_region_change(before, obj)
+
+    def delete_model(self, request, obj):
+        with transaction.atomic():
+            super().delete_model(request, obj)
+            record_funding_region_change(obj, None)
+
+    def delete_queryset(self, request, queryset):
+        with transaction.atomic():
+            fundings = list(queryset.select_related("proposal"))
+            super().delete_queryset(request, queryset)
+            for funding in fundings:
+                record_funding_region_change(funding, None)
 
-admin.site.register(Funding)
 admin.site.register(Reward)
 admin.site.register(ProposerReward)
 admin.site.register(ProposerLikeFunding)
@@ -2,11 +2,15 @@ from __future__ import annotations
 import logging
 logger = logging.getLogger("fundings.crons")
 from fundings.management.settle_fundings import settle_fundings
+from fundings.management.reconcile_funding_counters import reconcile_funding_counters
+from recommendations.models import FundingSuccessCentroid
+from recommendations.services import refresh_funding_success_centroids
 
 def settle_fundings_job() -> None:
     """
     - 마감된(IN_PROGRESS) 펀딩을 SUCCEEDED/FAILED로 정산하고
       성공 시 구매 리워드를 발급합니다.
+    - 새로 성공한 펀딩이 있으면 펀딩 성공 추천용 중심 벡터를 다시 계산합니다.
     """
     logger.info("settle_fundings_job: 시작")
     result = settle_fundings(verbose=False)
@@ -14,4 +18,20 @@ def settle_fundings_job() -> None:
         "settle_fundings_job: 완료 - "
         f"updated={result.updated}, succeeded={result.succeeded}, "
         f"failed={result.failed}, skipped={result.skipped}"
-    )
\ No newline at end of file
+    )
+
+    if result.succeeded > 0 or not FundingSuccessCentroid.objects.exists():
+        try:
+            count = refresh_funding_success_centroids()
+            logger.info(f"settle_fundings_job: 펀딩 성공 중심 벡터 갱신 - centroids={count}")
+        except Exception as e:
+            logger.error(f"settle_fundings_job: 펀딩 성공 중심 벡터 갱신 실패 - {e}")
+
+
+def reconcile_funding_counters_job() -> None:
+    """
+    좋아요/스크랩 수 카운터 컬럼의 어긋남을 고칩니다.
+    """
+    logger.info("reconcile_funding_counters_job: 시작")
+    fixed = reconcile_funding_counters(verbose=False)
+    logger.info(f"reconcile_funding_counters_job: 완료 - fixed={fixed}")
@@ -0,0 +1,22 @@
+from __future__ import annotations
+from fundings.services import reconcile_funding_counters as reconcile
+import logging
+
+logger = logging.getLogger("fundings.crons")
+
+def reconcile_funding_counters(verbose: bool = True) -> int:
+    """
+    펀딩의 좋아요/스크랩 수 컬럼을 실제 값으로 맞춥니다.
+
+    Args:
+        verbose: True면 요약 로그를 print
+
+    Returns:
+        고친 펀딩 수
+    """
+    fixed = reconcile()
+    logger.info("reconciled funding counters: fixed=%s", fixed)
+
+    if verbose:
+        print(f"reconciled funding counters: fixed={fixed}")
+    return fixed
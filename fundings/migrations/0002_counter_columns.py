@@ -0,0 +1,45 @@
+# Generated by Django 5.2.4 on 2026-10-18 06:17
+
+from django.db import migrations, models
+
+
+def backfill_counter_columns(apps, schema_editor):
+    from utils.counters import count_subquery, reconcile_counters
+
+    Funding = apps.get_model('fundings', 'Funding')
+    ProposerLikeFunding = apps.get_model('fundings', 'ProposerLikeFunding')
+    ProposerScrapFunding = apps.get_model('fundings', 'ProposerScrapFunding')
+    FounderScrapFunding = apps.get_model('fundings', 'FounderScrapFunding')
+    reconcile_counters(Funding.objects.all(), {
+        'likes_count': count_subquery(ProposerLikeFunding.objects.all(), 'funding'),
+        'scraps_count': (
+            count_subquery(ProposerScrapFunding.objects.all(), 'funding')
+            + count_subquery(FounderScrapFunding.objects.all(), 'funding')
+        ),
+    })
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fundings', '0001_initial'),
+        ('proposals', '0003_counter_columns'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='funding',
+            name='likes_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='funding',
+            name='scraps_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='funding',
+            index=models.Index(fields=['-likes_count', '-id'], name='funding_likes_count_idx'),
+        ),
+        migrations.RunPython(backfill_counter_columns, migrations.RunPython.noop),
+    ]
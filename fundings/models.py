@@ -146,9 +146,24 @@ class Funding(models.Model):
         null=True,
         blank=True,
     )
+    # 좋아요/스크랩 수 (서비스에서 F 식으로 갱신, reconcile_funding_counters로 보정)
+    likes_count = models.PositiveIntegerField(
+        default=0,
+    )
+    scraps_count = models.PositiveIntegerField(
+        default=0,
+    )
 
     objects = FundingQuerySet.as_manager()
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['-likes_count','-id'],
+                name='funding_likes_count_idx',
+            ),
+        ]
+
     def __str__(self):
         return self.title
 
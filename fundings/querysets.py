@@ -1,6 +1,8 @@
 from django.db import models
-from django.db.models import Q, Count, Sum, OuterRef, Exists, BooleanField, Value, Max
-from utils.choices import PaymentStatusChoices, IndustryChoices
+from django.db.models.functions import Coalesce
+from django.db.models import Q, Sum, OuterRef, Exists, BooleanField, Value, Max
+from utils.choices import IndustryChoices, PaymentStatusChoices
+from utils.counters import add_counts
 from django.apps import apps as django_apps
 
 class FundingQuerySet(models.QuerySet):
@@ -10,15 +12,23 @@ class FundingQuerySet(models.QuerySet):
         )
 
     def with_analytics(self):
+        """
+        좋아요/스크랩 수는 컬럼(likes_count, scraps_count)에 유지됩니다.
+        결제 금액(amount)은 정산과 같게 완료된 결제를 바로 합산합니다.
+        """
         return self.annotate(
-            likes_count=Count('proposer_like_funding', distinct=True),
-            scraps_count=Count('proposer_scrap_funding', distinct=True)+Count('founder_scrap_funding', distinct=True),
             amount=Sum(
                 'payment__total_amount',
                 filter=Q(payment__status=PaymentStatusChoices.DONE),
             ),
         )
 
+    def add_counts(self, **deltas) -> int:
+        """
+        좋아요/스크랩 수 컬럼에 F 식으로 값을 더합니다. 예: .filter(id=funding_id).add_counts(likes_count=1)
+        """
+        return add_counts(self, **deltas)
+
     def filter_address(self, sido, sigungu, eupmyundong):
         if not (sido and sigungu and eupmyundong):
             return self
@@ -41,14 +51,14 @@ class FundingQuerySet(models.QuerySet):
     # 레벨 정렬용 
     def with_level_area(self, *, sido: str, sigungu: str, eupmyundong: str):
         return self.annotate(
-            level_area=Max(
+            level_area=Coalesce(Max(
                 'proposal__user__proposer_level__level',
                 filter=Q(
                     proposal__user__proposer_level__address__sido=sido,
                     proposal__user__proposer_level__address__sigungu=sigungu,
                     proposal__user__proposer_level__address__eupmyundong=eupmyundong,
                 ),
-            )
+            ), 0),  # 레벨이 없으면 0 (NULL은 내림차순 맨 앞에 옴)
         )
 
     # 정렬 공통
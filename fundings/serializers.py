@@ -13,11 +13,6 @@ class FundingIdSerializer(serializers.Serializer):
         min_value=1,
     )
 
-    def validate_funding_id(self, value):
-        if not Funding.objects.filter(id=value).exists():
-            raise serializers.ValidationError('존재하지 않는 펀딩이에요.')
-        return value
-    
 
 class FundingListSerializer(serializers.ModelSerializer):
     industry = serializers.SerializerMethodField()
@@ -175,7 +170,7 @@ class FundingMapSerializer(FundingListSerializer):
         addr = (obj.proposal.address or {})
         full_addr = " ".join(filter(None, [addr.get("sido"), addr.get("sigungu"), addr.get("eupmyundong")]))
         try:
-            pos = geocoder.get_address_to_position(query_address=full_addr)
+            pos = geocoder.get_cached_address_to_position(query_address=full_addr)
         except Exception:
             pos = {"latitude": None, "longitude": None}
         return {"latitude": pos.get("latitude"), "longitude": pos.get("longitude")}
@@ -295,13 +290,9 @@ class FundingDetailBaseSerializer(FundingListSerializer):
             req = self.context.get("request")
             profile_image = rel if rel.startswith("http") or not req else req.build_absolute_uri(rel)
 
-        # 제안글 집계(제안글 좋아요/스크랩)
-        try:
-            prop_likes_count = prop.proposer_like_proposal.count()
-            prop_scraps_count = prop.proposer_scrap_proposal.count() + prop.founder_scrap_proposal.count()
-        except Exception:
-            prop_likes_count = 0
-            prop_scraps_count = 0
+        # 제안글 집계(제안글 좋아요/스크랩) - 카운터 컬럼
+        prop_likes_count = getattr(prop, "likes_count", 0) or 0
+        prop_scraps_count = getattr(prop, "scraps_count", 0) or 0
 
         # created_at → "방금 전/20분 전/…"로 변환
         humanized = HumanizedDateTimeField().to_representation(getattr(prop, "created_at", None))
@@ -1,6 +1,6 @@
 from __future__ import annotations
 from typing import List, Dict, Optional
-from django.db.models import QuerySet, Count, Max, Sum
+from django.db.models import QuerySet, F, Max, Sum
 from dataclasses import dataclass
 from datetime import datetime
 from django.utils import timezone
@@ -8,10 +8,14 @@ from datetime import timedelta
 from django.http import HttpRequest
 from django.db import transaction
 from collections import defaultdict
-from rest_framework.exceptions import PermissionDenied
-from utils.choices import ProfileChoices, FundingStatusChoices, PaymentStatusChoices, IndustryChoices, RewardCategoryChoices, RewardStatusChoices
+from rest_framework.exceptions import PermissionDenied, ValidationError
+from utils.choices import ProfileChoices, FundingStatusChoices, PaymentStatusChoices, RewardCategoryChoices, RewardStatusChoices, RegionCountKindChoices, RegionLevelChoices
 from utils.decorators import require_profile
 from utils.helpers import resolve_viewer_addr
+from utils.toggles import load_toggle_target, toggle_row
+from utils.pagination import paginate_keyset
+from utils.counters import count_subquery, reconcile_counters
+from maps.rollups import adjust_region_counts, region_counts
 from django.apps import apps as django_apps  
 from django.core.exceptions import FieldError, ImproperlyConfigured
 from .models import Funding, ProposerLikeFunding, ProposerScrapFunding, FounderScrapFunding, ProposerReward, Reward
@@ -27,7 +31,6 @@ class ProposerLikeFundingService:
     def __init__(self, request:HttpRequest):
         self.request = request
 
-    @require_profile(ProfileChoices.proposer)
     def post(self, funding_id:int) -> bool:
         '''
         Args:
@@ -37,25 +40,25 @@ class ProposerLikeFundingService:
                 - `True`: 좋아요 추가
                 - `False`: 좋아요 삭제
         '''
-        funding = Funding.objects.get(id=funding_id)
-        if funding.user.user == self.request.user:
+        # 작성자 확인, 존재 확인, 프로필 조회를 한 번의 조회로 합니다.
+        target = load_toggle_target(Funding.objects.filter(id=funding_id), 'user__user_id', self.request.user, ProfileChoices.proposer)
+        if target is None:
+            raise ValidationError({'funding_id': ['존재하지 않는 펀딩이에요.']})
+        owner_id, proposer_id = target
+        if owner_id == self.request.user.id:
             raise PermissionDenied('자신의 펀딩을 좋아할 수 없어요.')
 
-        obj, created = ProposerLikeFunding.objects.get_or_create(
-            user=self.request.user.proposer,
-            funding=funding,
-        )
-        if created:
-            return True
-        else:
-            obj.delete()
-            return False
+        # 관계 행과 카운터 컬럼을 한 트랜잭션에서 바꿉니다.
+        with transaction.atomic():
+            delta = toggle_row(ProposerLikeFunding, user_id=proposer_id, funding_id=funding_id)
+            if delta:
+                Funding.objects.filter(id=funding_id).add_counts(likes_count=delta)
+        return delta >= 0
 
 class ProposerScrapFundingService:
     def __init__(self, request:HttpRequest):
         self.request = request
 
-    @require_profile(ProfileChoices.proposer)
     def post(self, funding_id:int) -> bool:
         '''
         Args:
@@ -65,19 +68,20 @@ class ProposerScrapFundingService:
                 - `True`: 스크랩 추가
                 - `False`: 스크랩 삭제
         '''
-        funding = Funding.objects.get(id=funding_id)
-        if funding.user.user == self.request.user:
+        # 작성자 확인, 존재 확인, 프로필 조회를 한 번의 조회로 합니다.
+        target = load_toggle_target(Funding.objects.filter(id=funding_id), 'user__user_id', self.request.user, ProfileChoices.proposer)
+        if target is None:
+            raise ValidationError({'funding_id': ['존재하지 않는 펀딩이에요.']})
+        owner_id, proposer_id = target
+        if owner_id == self.request.user.id:
             raise PermissionDenied('자신의 펀딩을 스크랩할 수 없어요.')
 
-        obj, created = ProposerScrapFunding.objects.get_or_create(
-            user=self.request.user.proposer,
-            funding=funding,
-        )
-        if created:
-            return True
-        else:
-            obj.delete()
-            return False
+        # 관계 행과 카운터 컬럼을 한 트랜잭션에서 바꿉니다.
+        with transaction.atomic():
+            delta = toggle_row(ProposerScrapFunding, user_id=proposer_id, funding_id=funding_id)
+            if delta:
+                Funding.objects.filter(id=funding_id).add_counts(scraps_count=delta)
+        return delta >= 0
 
     @require_profile(ProfileChoices.proposer)
     def get(self, sido:str|None=None, sigungu:str|None=None, eupmyundong:str|None=None):
@@ -92,17 +96,19 @@ class ProposerScrapFundingService:
         ).with_flags(
             user=self.request.user, 
             profile="proposer"
+        ).annotate(
+            scrapped_at=F('proposer_scrap_funding__created_at'),
         ).order_by(
-            '-proposer_scrap_funding__created_at',
+            '-scrapped_at', '-id',
         )
-        serializer = FundingListSerializer(fundings, many=True, context={"request": self.request, "profile": "proposer"})
-        return serializer.data
+        page = paginate_keyset(fundings, self.request.query_params)
+        serializer = FundingListSerializer(page.items, many=True, context={"request": self.request, "profile": "proposer"})
+        return page.to_response(serializer.data)
 
 class FounderScrapFundingService:
     def __init__(self, request:HttpRequest):
         self.request = request
 
-    @require_profile(ProfileChoices.founder)
     def post(self, funding_id:int) -> bool:
         '''
         Args:
@@ -112,19 +118,20 @@ class FounderScrapFundingService:
                 - `True`: 스크랩 추가
                 - `False`: 스크랩 삭제
         '''
-        funding = Funding.objects.get(id=funding_id)
-        if funding.user.user == self.request.user:
+        # 작성자 확인, 존재 확인, 프로필 조회를 한 번의 조회로 합니다.
+        target = load_toggle_target(Funding.objects.filter(id=funding_id), 'user__user_id', self.request.user, ProfileChoices.founder)
+        if target is None:
+            raise ValidationError({'funding_id': ['존재하지 않는 펀딩이에요.']})
+        owner_id, founder_id = target
+        if owner_id == self.request.user.id:
             raise PermissionDenied('자신의 펀딩을 스크랩할 수 없어요.')
 
-        obj, created = FounderScrapFunding.objects.get_or_create(
-            user=self.request.user.founder,
-            funding=funding,
-        )
-        if created:
-            return True
-        else:
-            obj.delete()
-            return False
+        # 관계 행과 카운터 컬럼을 한 트랜잭션에서 바꿉니다.
+        with transaction.atomic():
+            delta = toggle_row(FounderScrapFunding, user_id=founder_id, funding_id=funding_id)
+            if delta:
+                Funding.objects.filter(id=funding_id).add_counts(scraps_count=delta)
+        return delta >= 0
 
     @require_profile(ProfileChoices.founder)
     def get(self, sido:str|None=None, sigungu:str|None=None, eupmyundong:str|None=None):
@@ -138,11 +145,14 @@ class FounderScrapFundingService:
         ).with_proposal(
         ).with_flags(user=self.request.user, 
                      profile="founder"
+        ).annotate(
+            scrapped_at=F('founder_scrap_funding__created_at'),
         ).order_by(
-            '-founder_scrap_funding__created_at',
+            '-scrapped_at', '-id',
         )
-        serializer = FundingListSerializer(fundings, many=True, context={"request": self.request, "profile": "founder"})
-        return serializer.data
+        page = paginate_keyset(fundings, self.request.query_params)
+        serializer = FundingListSerializer(page.items, many=True, context={"request": self.request, "profile": "founder"})
+        return page.to_response(serializer.data)
 
 class FundingMapService:
     """
@@ -153,31 +163,30 @@ class FundingMapService:
     def __init__(self, request: HttpRequest):
         self.request = request
 
-    def _group_counts(self, base_qs, group: str, industry: Optional[str]) -> List[Dict]:
-        base = base_qs.filter(status=FundingStatusChoices.IN_PROGRESS)
-        if industry:
-            valid = {c for c, _ in IndustryChoices.choices}
-            if industry not in valid:
-                base = base.none()
-            else:
-                base = base.filter(proposal__industry=industry)
-        base = base.exclude(**{f"{group}__isnull": True}).exclude(**{group: ""})
-        rows = base.values(group).annotate(number=Count("id")).order_by(group)
-        return [{"address": r[group], "number": r["number"]} for r in rows]
-
     def cluster_counts_sido(self, industry: Optional[str]) -> List[Dict]:
-        return self._group_counts(Funding.objects.all(), "proposal__address__sido", industry)
+        # 진행 중인 펀딩, 집계 테이블에서 조회
+        return region_counts(RegionCountKindChoices.FUNDING, RegionLevelChoices.SIDO, industry)
 
     def cluster_counts_sigungu(self, sido: str, industry: Optional[str]) -> List[Dict]:
-        base = Funding.objects.filter(proposal__address__sido=sido)
-        return self._group_counts(base, "proposal__address__sigungu", industry)
+        return region_counts(RegionCountKindChoices.FUNDING, RegionLevelChoices.SIGUNGU, industry, sido=sido)
 
     def cluster_counts_eupmyundong(self, sido: str, sigungu: str, industry: Optional[str]) -> List[Dict]:
-        base = Funding.objects.filter(
-            proposal__address__sido=sido,
-            proposal__address__sigungu=sigungu,
-        )
-        return self._group_counts(base, "proposal__address__eupmyundong", industry)
+        return region_counts(RegionCountKindChoices.FUNDING, RegionLevelChoices.EUPMYUNDONG, industry, sido=sido, sigungu=sigungu)
+
+
+def record_funding_region_change(before: Funding | None, after: Funding | None) -> None:
+    """
+    펀딩 생성/수정/삭제 전후 상태로 지도 클러스터 집계(maps.RegionCount)를 고칩니다. 같은 트랜잭션 안에서 호출해 주세요.
+    - 진행 중(IN_PROGRESS)인 펀딩은 펀딩 집계에 들어갑니다.
+    - 펀딩이 달린 제안은 제안 집계에서 빠집니다.
+    """
+    for funding, sign in ((before, -1), (after, 1)):
+        if funding is None:
+            continue
+        proposal = funding.proposal
+        if funding.status == FundingStatusChoices.IN_PROGRESS:
+            adjust_region_counts(RegionCountKindChoices.FUNDING, proposal.address, proposal.industry, sign)
+        adjust_region_counts(RegionCountKindChoices.PROPOSAL, proposal.address, proposal.industry, -sign)
 
 
 CANCELABLE_WINDOW = timedelta(days=7) # 승인 후 7일 내 취소 가능
@@ -365,6 +374,35 @@ class FundingDetailService:
         return ser.data
     
 
+# 내 펀딩 목록(상태별) 응답 키 → 펀딩 상태
+MY_FUNDING_STATUS_GROUPS = {
+    "in_progress": FundingStatusChoices.IN_PROGRESS,
+    "succeeded": FundingStatusChoices.SUCCEEDED,
+    "failed": FundingStatusChoices.FAILED,
+}
+
+
+def paginate_status_groups(qs: QuerySet[Funding], query_params) -> dict:
+    """
+    정렬된 펀딩 목록을 상태별로 나눠 각각 커서 페이지로 반환합니다.
+    - status: 특정 상태만 조회 (in_progress|succeeded|failed, 없으면 전부)
+    - <상태>_cursor: 그 상태의 다음 페이지 커서 (예: in_progress_cursor)
+    - page_size: 상태마다 가져올 개수
+    Returns:
+        {상태: {"results": [...], "next_cursor": str|None}, ...}
+    """
+    status = query_params.get("status")
+    if status is not None and status not in MY_FUNDING_STATUS_GROUPS:
+        raise ValidationError({"status": f"{list(MY_FUNDING_STATUS_GROUPS)} 중 하나를 입력해 주세요."})
+    keys = [status] if status else list(MY_FUNDING_STATUS_GROUPS)
+
+    result = {}
+    for key in keys:
+        page = paginate_keyset(qs.filter(status=MY_FUNDING_STATUS_GROUPS[key]), query_params, cursor_param=f"{key}_cursor")
+        result[key] = page.to_response(FundingMyCreatedItemSerializer(page.items, many=True).data)
+    return result
+
+
 class FounderMyCreatedFundingService:
     def __init__(self, request: HttpRequest):
         self.request = request
@@ -377,25 +415,13 @@ class FounderMyCreatedFundingService:
         return qs
 
     def _order_latest(self, qs: QuerySet[Funding]) -> QuerySet[Funding]:
-        # 가능하면 제안글 생성일 기준 최신, 없으면 id 기반
-        try:
-            return qs.order_by("-proposal__created_at", "-id")
-        except FieldError:
-            return qs.order_by("-id")
+        # 제안글 생성일 기준 최신 (커서에 쓰도록 정렬 키를 annotate)
+        return qs.annotate(proposal_created_at=F("proposal__created_at")).order_by("-proposal_created_at", "-id")
 
     @require_profile(ProfileChoices.founder)
     def get(self) -> dict:
-        qs = self._base_qs()
-
-        in_progress_qs = self._order_latest(qs.filter(status=FundingStatusChoices.IN_PROGRESS))
-        succeeded_qs   = self._order_latest(qs.filter(status=FundingStatusChoices.SUCCEEDED))
-        failed_qs      = self._order_latest(qs.filter(status=FundingStatusChoices.FAILED))
-
-        return {
-            "in_progress": FundingMyCreatedItemSerializer(in_progress_qs, many=True).data,
-            "succeeded":   FundingMyCreatedItemSerializer(succeeded_qs, many=True).data,
-            "failed":      FundingMyCreatedItemSerializer(failed_qs, many=True).data,
-        }
+        qs = self._order_latest(self._base_qs())
+        return paginate_status_groups(qs, self.request.query_params)
     
 class ProposerMyPaidFundingService:
     def __init__(self, request: HttpRequest):
@@ -422,18 +448,7 @@ class ProposerMyPaidFundingService:
     
     @require_profile(ProfileChoices.proposer)
     def get(self) -> dict:
-        qs = self._base_qs()
-        return {
-            "in_progress": FundingMyCreatedItemSerializer(
-                qs.filter(status=FundingStatusChoices.IN_PROGRESS), many=True
-            ).data,
-            "succeeded": FundingMyCreatedItemSerializer(
-                qs.filter(status=FundingStatusChoices.SUCCEEDED), many=True
-            ).data,
-            "failed": FundingMyCreatedItemSerializer(
-                qs.filter(status=FundingStatusChoices.FAILED), many=True
-            ).data,
-        }
+        return paginate_status_groups(self._base_qs(), self.request.query_params)
     
 class ProposerMyRewardsService:
     def __init__(self, request: HttpRequest):
@@ -574,6 +589,9 @@ class FundingSettlementService:
         if not updated:
             return None
 
+        # 진행 중 펀딩 지도 집계에서 빼기
+        adjust_region_counts(RegionCountKindChoices.FUNDING, funding.proposal.address, funding.proposal.industry, -1)
+
         # 4) 성공 시에만 구매 리워드 발급
         if new_status == FundingStatusChoices.SUCCEEDED:
             self._materialize_purchased_rewards_for_funding(funding)
@@ -664,7 +682,9 @@ class FundingSettlementService:
 
     def run(self) -> FundingSettlementResult:
         result = FundingSettlementResult()
-        qs = Funding.objects.only("id", "status", "goal_amount", "schedule").filter(
+        qs = Funding.objects.select_related("proposal").only(
+            "id", "status", "goal_amount", "schedule", "proposal__address", "proposal__industry",
+        ).filter(
             status=FundingStatusChoices.IN_PROGRESS
         )
 
@@ -687,4 +707,23 @@ class FundingSettlementService:
 
         return result
 
-    
\ No newline at end of file
+    
+
+def reconcile_funding_counters(batch_size: int = 1000) -> int:
+    """
+    좋아요/스크랩 수 컬럼을 실제 행에서 다시 계산해 어긋난 펀딩만 고칩니다.
+
+    Returns:
+        고친 펀딩 수
+    """
+    return reconcile_counters(
+        Funding.objects.all(),
+        {
+            "likes_count": count_subquery(ProposerLikeFunding.objects.all(), "funding"),
+            "scraps_count": (
+                count_subquery(ProposerScrapFunding.objects.all(), "funding")
+                + count_subquery(FounderScrapFunding.objects.all(), "funding")
+            ),
+        },
+        batch_size=batch_size,
+    )
@@ -7,6 +7,7 @@ urlpatterns = [
     path('proposer/like', ProposerLike.as_view()),
     path('<str:profile>/scrap', ProfileScrap.as_view()),
     path('<str:profile>/<int:zoom>', FundingMapView.as_view(), name='funding-map'),
+    path('<str:profile>/<int:zoom>/viewport', FundingViewportView.as_view(), name='funding-viewport'),
     path('<int:funding_id>/<str:profile>', FundingDetailView.as_view(), name='funding-detail'),
     path('founder/my-created', FounderMyCreatedView.as_view(), name='funding-my-created'),
     path('proposer/my-paid', ProposerMyPaidView.as_view(), name='funding-my-paid'),
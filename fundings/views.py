@@ -8,8 +8,19 @@ from rest_framework.exceptions import PermissionDenied
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from utils.decorators import validate_path_choices
 from utils.helpers import resolve_viewer_addr
+from utils.pagination import paginate_keyset
 
 from utils.choices import ProfileChoices, ZoomChoices, FundingStatusChoices
+from maps.clusters import (
+    MAP_VIEWPORT_ZOOM_PRECISION,
+    parse_cluster_query,
+    parse_sample_size,
+    build_cluster_response,
+    parse_viewport_query,
+    filter_viewport,
+    viewport_cells,
+    viewport_sample_ids,
+)
 from maps.services import GeocodingService
 from .serializers import FundingIdSerializer, FundingListSerializer
 from .models import Funding
@@ -132,13 +143,16 @@ class FundingMapView(APIView):
         # ── "동 이하 상세" — 제안글의 '자체 좌표'로 그룹핑 (주소 기반 X) ─────────────────
         if zoom == ZoomChoices.M0:
             try:
-                qs = (
+                base = (
                     Funding.objects
                     .filter_address(sido, sigungu, eupmyundong)
                     .filter(status=FundingStatusChoices.IN_PROGRESS)
+                    .filter_industry_choice(industry)
+                )
+                qs = (
+                    base
                     .with_analytics()
                     .with_level_area(sido=sido, sigungu=sigungu, eupmyundong=eupmyundong)
-                    .filter_industry_choice(industry)
                     .with_proposal()
                     .with_flags(user=request.user, profile=profile)
                     .order_by_choice(order)
@@ -146,9 +160,27 @@ class FundingMapView(APIView):
             except ValueError as e:
                 return Response({"detail": str(e)}, status=400)
 
+            # 격자 묶음: precision(묶음 목록) 또는 cluster(묶음 항목 페이지)가 있으면 geohash 칸으로 묶어 응답
+            cluster_query = parse_cluster_query(request.query_params)
+            if cluster_query is not None:
+                def serialize(f):
+                    return FundingListSerializer(
+                        f,
+                        context={
+                            "request": request,
+                            "profile": profile,
+                            "viewer_addr": viewer_addr,
+                        },
+                    ).data
+                data = build_cluster_response(
+                    base, qs, cluster_query, request.query_params, serialize, "fundings", prefix="proposal__",
+                )
+                return Response(data, status=200)
 
+            # 좌표 묶음 목록은 정렬 순서대로 커서 페이지 단위로 만듭니다. (같은 좌표가 다음 페이지에 이어질 수 있음)
+            page = paginate_keyset(qs, request.query_params)
             groups: dict[tuple[float, float], dict] = {}
-            for f in qs:
+            for f in page.items:
                 pos = (getattr(f.proposal, "position", {}) or {})
                 try:
                     lat = float(pos.get("latitude"))
@@ -174,7 +206,7 @@ class FundingMapView(APIView):
                 # 항목 내부에는 position 넣지 않음(명세와 동일)
                 groups[key]["fundings"].append(item)
 
-            return Response(list(groups.values()), status=200)
+            return Response(page.to_response(list(groups.values())), status=200)
 
         # 중심좌표(지오코딩)
         try:
@@ -211,29 +243,30 @@ class FundingMapView(APIView):
             return False
         
 
-        result = []
-        for idx, row in enumerate(grouped, start=1):
+        rows = []
+        for row in grouped:
             addr_text = row["address"]
 
             if zoom == ZoomChoices.M10000:
-                full_addr = addr_text
+                region = (addr_text, None, None)
                 is_addr = _match(viewer_addr, sido=addr_text)
             elif zoom == ZoomChoices.M2000:
-                full_addr = f"{sido} {addr_text}"
+                region = (sido, addr_text, None)
                 is_addr = _match(viewer_addr, sido=sido, sigungu=addr_text)
             else:
-                full_addr = f"{sido} {sigungu} {addr_text}"
+                region = (sido, sigungu, addr_text)
                 is_addr = _match(viewer_addr, sido=sido, sigungu=sigungu, eup=addr_text)
+            rows.append((row, region, is_addr))
 
-            # position 반환
-            try:
-                pos = geocoder.get_address_to_position(query_address=full_addr)
-            except Exception:
-                pos = {}
+        # position 반환 (행정구역 테이블에 없는 행정구역만 지오코딩)
+        positions = geocoder.get_regions_to_positions([region for _, region, _ in rows])
 
+        result = []
+        for idx, ((row, _, is_addr), pos) in enumerate(zip(rows, positions), start=1):
+            pos = pos or {}
             result.append({
                 "id": idx,
-                "address": addr_text,
+                "address": row["address"],
                 "position": {"latitude": pos.get("latitude"), "longitude": pos.get("longitude")},
                 "number": row["number"],
                 "is_address": is_addr,
@@ -242,6 +275,70 @@ class FundingMapView(APIView):
         return Response(result, status=status.HTTP_200_OK)
 
     
+@method_decorator(validate_path_choices(profile=ProfileChoices.values), name='dispatch')
+class FundingViewportView(APIView):
+    """
+    GET /fundings/{profile}/{zoom}/viewport
+    - 지도 화면의 경계 상자 안의 진행 중 펀딩을 제안 좌표의 geohash 칸으로 묶어 반환
+    - 0m에서는 칸마다 최신 펀딩을 sample개까지 함께 반환
+    """
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request: HttpRequest, profile: str, zoom: int):
+        if zoom not in ZoomChoices.values:
+            return Response(
+                {"detail": f"Invalid zoom. Use one of: {ZoomChoices.values}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        bbox = parse_viewport_query(request.query_params)
+        industry = request.query_params.get("industry")
+        precision = MAP_VIEWPORT_ZOOM_PRECISION[zoom]
+
+        try:
+            base = filter_viewport(
+                Funding.objects
+                .filter(status=FundingStatusChoices.IN_PROGRESS)
+                .filter_industry_choice(industry),
+                bbox,
+                prefix="proposal__",
+            )
+        except ValueError as e:
+            return Response({"detail": str(e)}, status=400)
+
+        cells = viewport_cells(base, precision, prefix="proposal__")
+        if zoom != ZoomChoices.M0:
+            return Response(cells, status=200)
+
+        # 0m: 칸마다 최신 펀딩 sample개
+        sample = parse_sample_size(request.query_params)
+        samples = viewport_sample_ids(base, precision, [cell["geohash"] for cell in cells], sample, prefix="proposal__")
+        ids = [id for cell_ids in samples.values() for id in cell_ids]
+
+        viewer_addr = resolve_viewer_addr(request.user, profile)
+        qs = (
+            Funding.objects
+            .filter(id__in=ids)
+            .with_analytics()
+            .with_proposal()
+            .with_flags(user=request.user, profile=profile)
+        )
+        items = {
+            f.id: FundingListSerializer(
+                f,
+                context={
+                    "request": request,
+                    "profile": profile,
+                    "viewer_addr": viewer_addr,
+                },
+            ).data
+            for f in qs
+        }
+        for cell in cells:
+            cell["fundings"] = [items[id] for id in samples.get(cell["geohash"], []) if id in items]
+
+        return Response(cells, status=200)
+
 @method_decorator(validate_path_choices(profile=ProfileChoices.values), name='dispatch')
 class FundingDetailView(APIView):
     authentication_classes = [JWTAuthentication] 
@@ -263,6 +360,7 @@ class FounderMyCreatedView(APIView):
     """
     GET /fundings/founder/my-created
     현재 로그인한 Founder가 작성한 펀딩을 상태별(진행/성공/실패) 최신순으로 반환
+    상태마다 커서 페이지로 반환 (status, <상태>_cursor, page_size 쿼리 파라미터)
     """
     permission_classes = [IsAuthenticated]
 
@@ -1,3 +1,6 @@
 from django.contrib import admin
+from .models import GeocodeCache, Region, RegionCount
 
-# Register your models here.
+admin.site.register(GeocodeCache)
+admin.site.register(Region)
+admin.site.register(RegionCount)
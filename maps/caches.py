@@ -0,0 +1,150 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from django.conf import settings
+from django.core.cache import cache
+from utils.constants import CacheKey
+from . import geohash
+
+logger = logging.getLogger(__name__)
+
+GEOCODE_LRU_SIZE = getattr(settings, 'GEOCODE_LRU_SIZE', 4096)
+GEOCODE_NOT_FOUND_TTL = getattr(settings, 'GEOCODE_NOT_FOUND_TTL', 60*60*24*7) # 좌표를 찾을 수 없는 주소는 7일 뒤 다시 조회
+REVERSE_GEOCODE_GEOHASH_PRECISION = getattr(settings, 'REVERSE_GEOCODE_GEOHASH_PRECISION', 8) # 약 38m x 19m 격자 (법정동 주소)
+REVERSE_GEOCODE_FULL_GEOHASH_PRECISION = getattr(settings, 'REVERSE_GEOCODE_FULL_GEOHASH_PRECISION', 10) # 약 1.2m x 0.6m 격자 (지번/도로명까지 있는 전체 주소)
+REVERSE_GEOCODE_LRU_SIZE = getattr(settings, 'REVERSE_GEOCODE_LRU_SIZE', 8192)
+REVERSE_GEOCODE_LRU_TTL = getattr(settings, 'REVERSE_GEOCODE_LRU_TTL', 60*10)            # 10분
+REVERSE_GEOCODE_CACHE_TIMEOUT = getattr(settings, 'REVERSE_GEOCODE_CACHE_TIMEOUT', 60*60*24*7) # 7일
+REVERSE_GEOCODE_STATS_LOG_INTERVAL = getattr(settings, 'REVERSE_GEOCODE_STATS_LOG_INTERVAL', 1000) # 조회 1000번마다 적중률 기록
+
+MISSING = object()
+
+def normalize_address(address:str) -> str:
+    '''
+    캐시 키로 사용할 수 있도록 주소의 앞뒤 공백을 없애고 연속된 공백을 하나로 합칩니다.
+    '''
+    return ' '.join((address or '').split())
+
+class LRUCache:
+    '''
+    프로세스 안에서 공유하는 최대 크기가 정해진 LRU 캐시입니다. 여러 스레드에서 사용할 수 있습니다.
+    ttl(초)을 주면 저장한 지 ttl이 지난 값은 없는 것으로 봅니다.
+    '''
+    def __init__(self, maxsize:int, ttl:float|None=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=MISSING):
+        with self._lock:
+            item = self._data.get(key, MISSING)
+            if item is MISSING:
+                return default
+            expires_at, value = item
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl:float|None=None) -> None:
+        '''
+        ttl(초)을 주면 이 값만 캐시의 ttl 대신 ttl 뒤에 만료합니다.
+        '''
+        ttl = ttl if ttl is not None else self.ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+class ReverseGeocodeCache:
+    '''
+    역지오코딩 결과를 geohash 격자 칸 단위로 캐시합니다. 같은 칸 안의 좌표는 같은 결과를 사용합니다.
+    - 1단계: 프로세스 안의 TTL LRU 캐시
+    - 2단계: 워커끼리 공유하는 Django 캐시 (CacheKey.REVERSE_GEOCODE)
+    값이 None이면 "주소를 찾을 수 없음"을 캐시한 것입니다. (정상 응답에 결과가 없을 때만 저장하고, 오류 응답은 저장하지 않습니다)
+    '''
+    def __init__(
+            self,
+            precision:int=REVERSE_GEOCODE_GEOHASH_PRECISION,
+            maxsize:int=REVERSE_GEOCODE_LRU_SIZE,
+            ttl:float=REVERSE_GEOCODE_LRU_TTL,
+            timeout:int=REVERSE_GEOCODE_CACHE_TIMEOUT,
+        ):
+        self.precision = precision
+        self.timeout = timeout
+        self.local = LRUCache(maxsize, ttl=ttl)
+        self._stats_lock = threading.Lock()
+        self.reset_stats()
+
+    def key(self, kind:str, x:float, y:float) -> str:
+        return CacheKey.REVERSE_GEOCODE.format(
+            kind=kind,
+            geohash=geohash.encode(x, y, self.precision),
+        )
+
+    def _count(self, name:str) -> None:
+        with self._stats_lock:
+            self._stats[name] += 1
+            total = sum(self._stats.values())
+        if REVERSE_GEOCODE_STATS_LOG_INTERVAL and total % REVERSE_GEOCODE_STATS_LOG_INTERVAL == 0:
+            logger.info(f"역지오코딩 캐시: {self.stats()}")
+
+    def get(self, kind:str, x:float, y:float):
+        '''
+        캐시된 결과를 반환합니다. 캐시에 없으면 MISSING을 반환합니다.
+        '''
+        key = self.key(kind, x, y)
+        value = self.local.get(key)
+        if value is not MISSING:
+            self._count('local_hits')
+            return value
+
+        value = cache.get(key, MISSING)
+        if value is not MISSING:
+            self.local.set(key, value)
+            self._count('shared_hits')
+            return value
+
+        self._count('misses')
+        return MISSING
+
+    def set(self, kind:str, x:float, y:float, value) -> None:
+        key = self.key(kind, x, y)
+        self.local.set(key, value)
+        cache.set(key, value, self.timeout)
+
+    def stats(self) -> dict:
+        '''
+        이 프로세스의 캐시 적중 횟수와 적중률을 반환합니다.
+        '''
+        with self._stats_lock:
+            stats = dict(self._stats)
+        total = sum(stats.values())
+        stats['hit_rate'] = (stats['local_hits'] + stats['shared_hits']) / total if total else None
+        return stats
+
+    def reset_stats(self) -> None:
+        with self._stats_lock:
+            self._stats = {'local_hits': 0, 'shared_hits': 0, 'misses': 0}
+
+# 정규화된 주소 → 좌표(찾을 수 없으면 None, GEOCODE_NOT_FOUND_TTL 동안만)
+geocode_lru = LRUCache(GEOCODE_LRU_SIZE)
+
+# 역지오코딩 종류(legal) + geohash → 법정동 주소(찾을 수 없으면 None)
+reverse_geocode_cache = ReverseGeocodeCache()
+
+# 역지오코딩 종류(full) + geohash → 전체 주소(찾을 수 없으면 None)
+# 지번/도로명은 건물마다 다르므로, 옆 건물 주소를 쓰지 않도록 훨씬 작은 격자로 캐시합니다.
+full_reverse_geocode_cache = ReverseGeocodeCache(precision=REVERSE_GEOCODE_FULL_GEOHASH_PRECISION)
@@ -0,0 +1,159 @@
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from django.conf import settings
+from rest_framework.exceptions import APIException
+
+NAVER_MAPS_API_BASE_URL = getattr(settings, 'NAVER_MAPS_API_BASE_URL', 'https://maps.apigw.ntruss.com')
+NAVER_MAPS_POOL_SIZE = getattr(settings, 'NAVER_MAPS_POOL_SIZE', 20)
+NAVER_MAPS_CONNECT_TIMEOUT = getattr(settings, 'NAVER_MAPS_CONNECT_TIMEOUT', 2)   # 초
+NAVER_MAPS_READ_TIMEOUT = getattr(settings, 'NAVER_MAPS_READ_TIMEOUT', 5)         # 초
+NAVER_MAPS_RETRIES = getattr(settings, 'NAVER_MAPS_RETRIES', 2)
+NAVER_MAPS_BACKOFF_FACTOR = getattr(settings, 'NAVER_MAPS_BACKOFF_FACTOR', 0.2)   # 0.2초, 0.4초, ...
+NAVER_MAPS_FAILURE_THRESHOLD = getattr(settings, 'NAVER_MAPS_FAILURE_THRESHOLD', 5)
+NAVER_MAPS_RECOVERY_TIMEOUT = getattr(settings, 'NAVER_MAPS_RECOVERY_TIMEOUT', 30) # 초
+
+class MapsServiceUnavailable(APIException):
+    status_code = 503
+    default_detail = '지도 서비스에 연결할 수 없어요. 잠시 후 다시 시도해 주세요.'
+    default_code = 'maps_service_unavailable'
+
+class CircuitBreaker:
+    '''
+    연속으로 실패한 횟수가 기준을 넘으면 일정 시간 동안 호출하지 않고 바로 실패합니다.
+    - closed: 정상 호출
+    - open: recovery_timeout 동안 바로 실패
+    - half-open: recovery_timeout이 지나면 한 번만 시험 호출하고, 성공하면 closed, 실패하면 다시 open
+    '''
+    def __init__(self, failure_threshold:int, recovery_timeout:float):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return 'closed'
+        if time.monotonic() - self._opened_at < self.recovery_timeout:
+            return 'open'
+        return 'half-open'
+
+    def allow(self) -> bool:
+        with self._lock:
+            state = self.state
+            if state == 'closed':
+                return True
+            if state == 'half-open' and not self._trial:
+                self._trial = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial = False
+
+class NaverMapsClient:
+    '''
+    네이버 지도 API 공용 클라이언트입니다.
+    - 연결을 재사용하는 requests.Session (keep-alive, pool_maxsize 크기의 연결 풀)
+    - 연결/응답 제한 시간
+    - 연결 오류와 429/5xx 응답에 대한 지수 백오프 재시도
+    - 서킷 브레이커: 네이버 지도 API 장애 시 워커를 붙잡지 않고 바로 503으로 실패
+    base_url을 바꾸면 로컬 테스트 서버로 요청을 보낼 수 있습니다.
+    '''
+    def __init__(
+            self,
+            base_url:str=NAVER_MAPS_API_BASE_URL,
+            pool_size:int=NAVER_MAPS_POOL_SIZE,
+            timeout:tuple[float, float]=(NAVER_MAPS_CONNECT_TIMEOUT, NAVER_MAPS_READ_TIMEOUT),
+            retries:int=NAVER_MAPS_RETRIES,
+            backoff_factor:float=NAVER_MAPS_BACKOFF_FACTOR,
+            circuit_breaker:CircuitBreaker|None=None,
+        ):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.circuit_breaker = circuit_breaker or CircuitBreaker(
+            failure_threshold=NAVER_MAPS_FAILURE_THRESHOLD,
+            recovery_timeout=NAVER_MAPS_RECOVERY_TIMEOUT,
+        )
+
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            status=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['GET']),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_size,
+            max_retries=retry,
+        )
+        self.session = requests.Session()
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'x-ncp-apigw-api-key-id': settings.NCLOUD_CLIENT_ID,
+            'x-ncp-apigw-api-key': settings.NCLOUD_CLIENT_SECRET,
+            'Accept': 'application/json',
+        })
+
+    def get(self, path:str, params:dict|None=None) -> dict:
+        '''
+        API를 호출하고 JSON 응답을 반환합니다.
+        Raises:
+            MapsServiceUnavailable: 서킷이 열려 있거나, 재시도 후에도 연결/응답에 실패한 경우
+        '''
+        if not self.circuit_breaker.allow():
+            raise MapsServiceUnavailable()
+
+        try:
+            response = self.session.get(
+                url=f'{self.base_url}{path}',
+                params={key: value for key, value in (params or {}).items() if value is not None},
+                timeout=self.timeout,
+            )
+        except requests.RequestException:
+            self.circuit_breaker.record_failure()
+            raise MapsServiceUnavailable()
+
+        if response.status_code >= 500 or response.status_code == 429:
+            self.circuit_breaker.record_failure()
+            raise MapsServiceUnavailable()
+
+        self.circuit_breaker.record_success()
+        try:
+            return response.json()
+        except ValueError:
+            raise MapsServiceUnavailable('지도 서비스 응답을 읽을 수 없어요.')
+
+_naver_maps_client = None
+_naver_maps_client_lock = threading.Lock()
+
+def get_naver_maps_client() -> NaverMapsClient:
+    '''
+    프로세스마다 하나의 네이버 지도 API 클라이언트를 반환합니다. (연결 풀과 서킷 상태를 공유)
+    '''
+    global _naver_maps_client
+    if _naver_maps_client is None:
+        with _naver_maps_client_lock:
+            if _naver_maps_client is None:
+                _naver_maps_client = NaverMapsClient()
+    return _naver_maps_client
@@ -0,0 +1,170 @@
+from collections.abc import Callable
+from django.conf import settings
+from django.db.models import Avg, Count, F, QuerySet, Window
+from django.db.models.functions import RowNumber, Substr
+from rest_framework.exceptions import ValidationError
+from utils.pagination import paginate_keyset
+from . import geohash
+
+MAP_CLUSTER_MIN_PRECISION = getattr(settings, 'MAP_CLUSTER_MIN_PRECISION', 5)  # 약 4.9km
+MAP_CLUSTER_MAX_PRECISION = getattr(settings, 'MAP_CLUSTER_MAX_PRECISION', 9)  # 약 4.8m
+MAP_CLUSTER_SAMPLE_SIZE = getattr(settings, 'MAP_CLUSTER_SAMPLE_SIZE', 5)
+MAP_VIEWPORT_MAX_CELLS = getattr(settings, 'MAP_VIEWPORT_MAX_CELLS', 500)
+# 지도 범위 조회에서 줌(ZoomChoices)별로 묶을 geohash 길이
+MAP_VIEWPORT_ZOOM_PRECISION = getattr(settings, 'MAP_VIEWPORT_ZOOM_PRECISION', {
+    0: 8,       # 약 38m x 19m
+    500: 7,     # 약 153m
+    2_000: 6,   # 약 1.2km x 0.61km
+    10_000: 5,  # 약 4.9km
+})
+
+def _parse_int(value, name:str, minimum:int, maximum:int|None=None) -> int:
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        raise ValidationError({name: '정수를 입력해 주세요.'})
+    if maximum is None and number < minimum:
+        raise ValidationError({name: f'{minimum} 이상의 값을 입력해 주세요.'})
+    if maximum is not None and not minimum <= number <= maximum:
+        raise ValidationError({name: f'{minimum}~{maximum} 사이의 값을 입력해 주세요.'})
+    return number
+
+def parse_sample_size(query_params) -> int:
+    '''
+    묶음(격자 칸)마다 함께 보낼 항목 개수 sample을 읽습니다. (0~MAP_CLUSTER_SAMPLE_SIZE, 기본값 MAP_CLUSTER_SAMPLE_SIZE)
+    '''
+    return _parse_int(query_params.get('sample', MAP_CLUSTER_SAMPLE_SIZE), 'sample', 0, MAP_CLUSTER_SAMPLE_SIZE)
+
+def parse_cluster_query(query_params) -> dict|None:
+    '''
+    지도(0m) 격자 묶음 조회 쿼리 파라미터를 읽습니다. precision과 cluster가 모두 없으면 None을 반환합니다.
+    - precision: 묶음 목록을 만들 geohash 길이
+    - sample: 묶음마다 함께 보낼 항목 개수 (최대 MAP_CLUSTER_SAMPLE_SIZE)
+    - cluster: 항목을 페이지로 조회할 묶음의 geohash (페이지는 cursor, page_size로 키셋 조회)
+    '''
+    precision = query_params.get('precision')
+    cluster = query_params.get('cluster')
+    if precision is None and cluster is None:
+        return None
+
+    if cluster is not None:
+        if not (MAP_CLUSTER_MIN_PRECISION <= len(cluster) <= MAP_CLUSTER_MAX_PRECISION) or any(char not in geohash.BASE32 for char in cluster):
+            raise ValidationError({'cluster': '올바른 geohash가 아니에요.'})
+        return {'cluster': cluster}
+    return {
+        'precision': _parse_int(precision, 'precision', MAP_CLUSTER_MIN_PRECISION, MAP_CLUSTER_MAX_PRECISION),
+        'sample': parse_sample_size(query_params),
+    }
+
+def parse_viewport_query(query_params) -> dict:
+    '''
+    지도 범위(경계 상자) 쿼리 파라미터를 읽습니다. position과 같은 이름을 사용합니다.
+    - min_latitude, max_latitude: X 좌표(경도) 범위
+    - min_longitude, max_longitude: Y 좌표(위도) 범위
+    '''
+    bbox = dict()
+    for name in ('min_latitude', 'max_latitude', 'min_longitude', 'max_longitude'):
+        try:
+            bbox[name] = float(query_params.get(name))
+        except (TypeError, ValueError):
+            raise ValidationError({name: '숫자를 입력해 주세요.'})
+    if bbox['min_latitude'] > bbox['max_latitude'] or bbox['min_longitude'] > bbox['max_longitude']:
+        raise ValidationError('지도 범위의 최솟값이 최댓값보다 커요.')
+    return bbox
+
+def filter_viewport(queryset:QuerySet, bbox:dict, prefix:str='') -> QuerySet:
+    '''
+    (latitude, longitude) 인덱스로 지도 범위 안의 행만 남깁니다.
+    Args:
+        prefix: 좌표 컬럼이 있는 모델까지의 경로 (예: `proposal__`)
+    '''
+    return queryset.filter(**{
+        f'{prefix}latitude__gte': bbox['min_latitude'],
+        f'{prefix}latitude__lte': bbox['max_latitude'],
+        f'{prefix}longitude__gte': bbox['min_longitude'],
+        f'{prefix}longitude__lte': bbox['max_longitude'],
+    })
+
+def viewport_cells(queryset:QuerySet, precision:int, prefix:str='', limit:int=MAP_VIEWPORT_MAX_CELLS) -> list[dict]:
+    '''
+    geohash 앞 precision자리로 묶어 칸마다 개수와 평균 좌표를 DB에서 집계합니다. 개수가 많은 칸부터 최대 limit개를 반환합니다.
+    Returns:
+        [{geohash, position, count}, ...]
+    '''
+    rows = (
+        queryset
+        .exclude(**{f'{prefix}geohash__isnull': True})
+        .annotate(cell=Substr(f'{prefix}geohash', 1, precision))
+        .values('cell')
+        .annotate(
+            number=Count('id'),
+            center_x=Avg(f'{prefix}latitude'),
+            center_y=Avg(f'{prefix}longitude'),
+        )
+        .order_by('-number', 'cell')[:limit]
+    )
+    return [
+        {
+            'geohash': row['cell'],
+            'position': {'latitude': row['center_x'], 'longitude': row['center_y']},
+            'count': row['number'],
+        }
+        for row in rows
+    ]
+
+def viewport_sample_ids(queryset:QuerySet, precision:int, cells:list[str], sample:int, prefix:str='') -> dict[str, list[int]]:
+    '''
+    칸마다 최신 항목 id를 최대 sample개씩 한 번의 쿼리(ROW_NUMBER 윈도 함수)로 반환합니다.
+    '''
+    if not cells or sample <= 0:
+        return {}
+    cell = Substr(f'{prefix}geohash', 1, precision)
+    rows = (
+        queryset
+        .annotate(
+            cell=cell,
+            cell_rank=Window(RowNumber(), partition_by=[cell], order_by=F('id').desc()),
+        )
+        .filter(cell__in=cells, cell_rank__lte=sample)
+        .order_by('cell_rank')
+        .values_list('cell', 'id')
+    )
+    samples = {key: list() for key in cells}
+    for key, id in rows:
+        samples[key].append(id)
+    return samples
+
+def build_cluster_response(base:QuerySet, queryset:QuerySet, query:dict, query_params, serialize:Callable, items_key:str, prefix:str='') -> dict|list:
+    '''
+    지도(0m) 격자 묶음 응답을 만듭니다. 묶음 개수와 평균 좌표는 geohash 컬럼으로 DB에서 집계하고, 응답에 넣을 항목만 불러옵니다.
+    Args:
+        base: 집계할 행의 쿼리셋 (필터만 걸고 집계 annotate가 없어야 함)
+        queryset: 응답 항목의 쿼리셋 (base와 같은 조건, id로 끝나는 정렬)
+        query: parse_cluster_query 결과
+        query_params: 묶음 항목 페이지의 cursor, page_size
+        serialize: 항목 객체를 직렬화하는 함수
+        items_key: 응답에서 항목 목록의 키 (proposals, fundings)
+        prefix: geohash 컬럼이 있는 모델까지의 경로 (예: `proposal__`)
+    Returns:
+        - precision: [{geohash, position, count, <items_key>: 최신 sample개}, ...] (개수가 많은 칸부터 최대 MAP_VIEWPORT_MAX_CELLS개)
+        - cluster: {geohash, position, count, next_cursor, <items_key>: 해당 페이지 항목}
+    '''
+    if 'cluster' in query:
+        key = query['cluster']
+        in_cluster = {f'{prefix}geohash__startswith': key}
+        cells = viewport_cells(base.filter(**in_cluster), len(key), prefix, limit=1)
+        cell = cells[0] if cells else {'geohash': key, 'position': None, 'count': 0}
+        page = paginate_keyset(queryset.filter(**in_cluster), query_params)
+        return {
+            **cell,
+            'next_cursor': page.next_cursor,
+            items_key: [serialize(obj) for obj in page.items],
+        }
+
+    cells = viewport_cells(base, query['precision'], prefix)
+    samples = viewport_sample_ids(base, query['precision'], [cell['geohash'] for cell in cells], query['sample'], prefix)
+    ids = [id for cell_ids in samples.values() for id in cell_ids]
+    items = {obj.id: serialize(obj) for obj in queryset.filter(id__in=ids)} if ids else {}
+    for cell in cells:
+        cell[items_key] = [items[id] for id in samples.get(cell['geohash'], []) if id in items]
+    return cells
@@ -0,0 +1,25 @@
+from __future__ import annotations
+import logging
+logger = logging.getLogger("maps.crons")
+from maps.management.warm_geocode_cache import warm_geocode_cache
+from maps.management.rebuild_region_counts import rebuild_region_counts
+
+def warm_geocode_cache_job() -> None:
+    """
+    - 제안 주소의 시도/시군구/읍면동 중심 좌표 중 캐시에 없는 주소를 미리 저장합니다.
+    """
+    logger.info("warm_geocode_cache_job: 시작")
+    result = warm_geocode_cache(verbose=False)
+    logger.info(
+        "warm_geocode_cache_job: 완료 - "
+        f"total={result.total}, fetched={result.fetched}, "
+        f"not_found={result.not_found}, failed={result.failed}"
+    )
+
+def rebuild_region_counts_job() -> None:
+    """
+    - 지도 클러스터 집계 테이블을 제안/펀딩 테이블에서 다시 만들어 증분 갱신의 어긋남을 바로잡습니다.
+    """
+    logger.info("rebuild_region_counts_job: 시작")
+    rows = rebuild_region_counts(verbose=False)
+    logger.info(f"rebuild_region_counts_job: 완료 - rows={rows}")
@@ -0,0 +1,63 @@
+BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+
+# 정밀도별 격자 한 칸의 대략적인 크기 (경도 방향 x 위도 방향, 적도 기준)
+CELL_SIZES = {
+    5: '4.9km x 4.9km',
+    6: '1.2km x 0.61km',
+    7: '153m x 153m',
+    8: '38m x 19m',
+    9: '4.8m x 4.8m',
+    10: '1.2m x 0.6m',
+}
+
+def encode(x:float, y:float, precision:int=8) -> str:
+    '''
+    좌표를 geohash 문자열로 변환합니다. 같은 격자 칸 안의 좌표는 같은 문자열이 됩니다.
+    Args:
+        x (float): X 좌표(경도)
+        y (float): Y 좌표(위도)
+        precision (int): geohash 길이
+    Returns:
+        geohash (str)
+    '''
+    x_range = [-180.0, 180.0]
+    y_range = [-90.0, 90.0]
+    chars = list()
+    bits, bit_count, even = 0, 0, True
+
+    while len(chars) < precision:
+        value, interval = (x, x_range) if even else (y, y_range)
+        middle = (interval[0] + interval[1]) / 2
+        bits <<= 1
+        if value >= middle:
+            bits |= 1
+            interval[0] = middle
+        else:
+            interval[1] = middle
+        even = not even
+
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(BASE32[bits])
+            bits, bit_count = 0, 0
+    return ''.join(chars)
+
+def decode(geohash:str) -> tuple[float, float]:
+    '''
+    geohash 격자 칸의 중심 좌표 (x 경도, y 위도)를 반환합니다.
+    '''
+    x_range = [-180.0, 180.0]
+    y_range = [-90.0, 90.0]
+    even = True
+
+    for char in geohash:
+        bits = BASE32.index(char)
+        for shift in range(4, -1, -1):
+            interval = x_range if even else y_range
+            middle = (interval[0] + interval[1]) / 2
+            if (bits >> shift) & 1:
+                interval[0] = middle
+            else:
+                interval[1] = middle
+            even = not even
+    return (x_range[0] + x_range[1]) / 2, (y_range[0] + y_range[1]) / 2
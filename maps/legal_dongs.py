@@ -0,0 +1,182 @@
+import json
+import logging
+import os
+import threading
+import numpy as np
+from django.conf import settings
+from .types import AddressType
+
+logger = logging.getLogger(__name__)
+
+LEGAL_DONG_GEOJSON_PATH = getattr(
+    settings,
+    'LEGAL_DONG_GEOJSON_PATH',
+    os.path.join(settings.BASE_DIR, 'maps', 'data', 'legal_dongs.geojson'),
+)
+LEGAL_DONG_GRID_SIZE = getattr(settings, 'LEGAL_DONG_GRID_SIZE', 0.01) # 격자 한 칸 크기(도), 약 1km
+LEGAL_DONG_PROPERTIES = getattr(settings, 'LEGAL_DONG_PROPERTIES', ('sido', 'sigungu', 'eupmyundong'))
+
+def _feature_rings(geometry:dict) -> list[np.ndarray]:
+    if geometry['type'] == 'Polygon':
+        polygons = [geometry['coordinates']]
+    elif geometry['type'] == 'MultiPolygon':
+        polygons = geometry['coordinates']
+    else:
+        return list()
+    return [
+        np.asarray(ring, dtype=np.float64)[:, :2]
+        for polygon in polygons
+        for ring in polygon
+        if len(ring) >= 3
+    ]
+
+class LegalDongIndex:
+    '''
+    법정동 경계 GeoJSON을 메모리에 올려 좌표 → 법정동 주소를 네트워크 호출 없이 찾습니다.
+    - GeoJSON: Polygon/MultiPolygon Feature의 properties에 LEGAL_DONG_PROPERTIES(시도, 시군구, 읍면동) 이름이 있어야 합니다.
+    - 좌표를 LEGAL_DONG_GRID_SIZE 크기의 격자로 나누고, 격자 칸마다 경계 상자가 겹치는 법정동 후보를 저장합니다.
+    - 경계선이 지나지 않는 칸은 한 법정동 안에 통째로 들어가므로, 그 칸의 좌표는 다각형 검사 없이 바로 답합니다.
+    - 경계선이 지나는 칸만 후보 법정동에 대해 짝홀(ray casting) 규칙으로 포함 여부를 검사합니다. 구멍과 여러 조각도 같은 규칙으로 처리합니다.
+    어느 법정동에도 속하지 않으면 None을 반환하므로, 호출하는 쪽에서 네이버 지도 API로 찾습니다.
+    '''
+    def __init__(self, path:str=LEGAL_DONG_GEOJSON_PATH, grid_size:float=LEGAL_DONG_GRID_SIZE):
+        self.path = path
+        self.grid_size = grid_size
+        self.regions = list()   # 법정동 번호 → AddressType.LegalType
+        self.edges = list()     # 법정동 번호 → (x1, y1, x2, y2) 경계선 배열
+        self.bboxes = np.empty((0, 4), dtype=np.float64)
+        self.cells = dict()     # (ix, iy) → 경계 상자가 겹치는 법정동 번호 목록
+        self.interior = dict()  # (ix, iy) → 칸 전체를 포함하는 법정동 번호
+
+    def __len__(self):
+        return len(self.regions)
+
+    def _cell(self, x:float, y:float) -> tuple[int, int]:
+        return int(np.floor(x / self.grid_size)), int(np.floor(y / self.grid_size))
+
+    def _cell_range(self, x1, y1, x2, y2) -> tuple[range, range]:
+        ix1, iy1 = self._cell(x1, y1)
+        ix2, iy2 = self._cell(x2, y2)
+        return range(ix1, ix2 + 1), range(iy1, iy2 + 1)
+
+    def load(self) -> 'LegalDongIndex':
+        with open(self.path, encoding='utf-8') as file:
+            features = json.load(file).get('features', [])
+
+        regions, edges, bboxes = list(), list(), list()
+        for feature in features:
+            properties = feature.get('properties') or {}
+            rings = _feature_rings(feature.get('geometry') or {'type': None})
+            if not rings:
+                continue
+            sido, sigungu, eupmyundong = (properties.get(key) or None for key in LEGAL_DONG_PROPERTIES)
+            regions.append({'sido': sido, 'sigungu': sigungu, 'eupmyundong': eupmyundong})
+            edges.append(np.vstack([
+                np.column_stack([ring, np.roll(ring, -1, axis=0)])
+                for ring in rings
+            ]))
+            points = np.vstack(rings)
+            bboxes.append((*points.min(axis=0), *points.max(axis=0)))
+
+        self.regions = regions
+        self.edges = edges
+        self.bboxes = np.asarray(bboxes, dtype=np.float64).reshape(-1, 4)
+        self._build_grid()
+        logger.info(f"법정동 경계 {len(regions)}개를 불러왔어요: {self.path}")
+        return self
+
+    def _build_grid(self) -> None:
+        cells = dict()
+        for index, bbox in enumerate(self.bboxes):
+            xs, ys = self._cell_range(*bbox)
+            for ix in xs:
+                for iy in ys:
+                    cells.setdefault((ix, iy), []).append(index)
+
+        # 경계선(의 경계 상자)이 지나는 칸
+        boundary = set()
+        for edges in self.edges:
+            ix1 = np.floor(np.minimum(edges[:, 0], edges[:, 2]) / self.grid_size).astype(np.int64)
+            ix2 = np.floor(np.maximum(edges[:, 0], edges[:, 2]) / self.grid_size).astype(np.int64)
+            iy1 = np.floor(np.minimum(edges[:, 1], edges[:, 3]) / self.grid_size).astype(np.int64)
+            iy2 = np.floor(np.maximum(edges[:, 1], edges[:, 3]) / self.grid_size).astype(np.int64)
+            single = (ix1 == ix2) & (iy1 == iy2)
+            boundary.update(zip(ix1[single].tolist(), iy1[single].tolist()))
+            for x1, x2, y1, y2 in zip(ix1[~single], ix2[~single], iy1[~single], iy2[~single]):
+                boundary.update((ix, iy) for ix in range(x1, x2 + 1) for iy in range(y1, y2 + 1))
+
+        # 경계선이 지나지 않는 칸은 칸 중심을 포함하는 법정동이 칸 전체를 포함합니다.
+        interior = dict()
+        for index, bbox in enumerate(self.bboxes):
+            xs, ys = self._cell_range(*bbox)
+            keys = [(ix, iy) for ix in xs for iy in ys if (ix, iy) not in boundary and (ix, iy) not in interior]
+            if not keys:
+                continue
+            centers = (np.asarray(keys, dtype=np.float64) + 0.5) * self.grid_size
+            inside = self._contains(index, centers[:, 0], centers[:, 1])
+            interior.update((key, index) for key, hit in zip(keys, inside) if hit)
+
+        self.cells = {key: np.asarray(indexes, dtype=np.int64) for key, indexes in cells.items()}
+        self.interior = interior
+
+    def _contains(self, index:int, xs:np.ndarray, ys:np.ndarray) -> np.ndarray:
+        '''
+        짝홀 규칙: 좌표에서 오른쪽으로 그은 반직선이 경계선과 홀수 번 만나면 안쪽입니다.
+        '''
+        edges = self.edges[index]
+        x1, y1, x2, y2 = (edges[:, column] for column in range(4))
+        result = np.zeros(len(xs), dtype=bool)
+        for start in range(0, len(xs), 1024):
+            x = xs[start:start + 1024, None]
+            y = ys[start:start + 1024, None]
+            crosses = (y1 > y) != (y2 > y)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                cross_x = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+            result[start:start + 1024] = np.count_nonzero(crosses & (x < cross_x), axis=1) % 2 == 1
+        return result
+
+    def lookup(self, x:float, y:float) -> AddressType.LegalType|None:
+        '''
+        좌표(경도 x, 위도 y)가 속한 법정동 주소를 반환합니다. 어느 법정동에도 속하지 않으면 None입니다.
+        '''
+        cell = self._cell(x, y)
+        index = self.interior.get(cell)
+        if index is not None:
+            return dict(self.regions[index])
+
+        candidates = self.cells.get(cell)
+        if candidates is None:
+            return None
+        bboxes = self.bboxes[candidates]
+        candidates = candidates[
+            (bboxes[:, 0] <= x) & (x <= bboxes[:, 2]) & (bboxes[:, 1] <= y) & (y <= bboxes[:, 3])
+        ]
+        point_x, point_y = np.asarray([x], dtype=np.float64), np.asarray([y], dtype=np.float64)
+        for index in candidates.tolist():
+            if self._contains(index, point_x, point_y)[0]:
+                return dict(self.regions[index])
+        return None
+
+_legal_dong_index = None
+_legal_dong_index_lock = threading.Lock()
+
+def get_legal_dong_index() -> LegalDongIndex:
+    '''
+    프로세스마다 하나의 법정동 경계 인덱스를 반환합니다.
+    경계 파일이 없거나 읽지 못하면 빈 인덱스를 반환하고, 모든 좌표를 네이버 지도 API로 찾습니다.
+    '''
+    global _legal_dong_index
+    if _legal_dong_index is None:
+        with _legal_dong_index_lock:
+            if _legal_dong_index is None:
+                index = LegalDongIndex()
+                if os.path.exists(index.path):
+                    try:
+                        index.load()
+                    except Exception as e:
+                        logger.error(f"법정동 경계 파일을 읽지 못했어요: {e}")
+                        index = LegalDongIndex()
+                else:
+                    logger.warning(f"법정동 경계 파일이 없어 역지오코딩에 네이버 지도 API만 사용해요: {index.path}")
+                _legal_dong_index = index
+    return _legal_dong_index
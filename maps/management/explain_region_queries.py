@@ -0,0 +1,66 @@
+from __future__ import annotations
+import logging
+from django.db import connection, transaction
+from accounts.models import LocationHistory, ProposerLevel
+from proposals.models import Proposal
+
+logger = logging.getLogger("maps.crons")
+
+def _region_queries(sido: str, sigungu: str, eupmyundong: str) -> dict:
+    # 이름 → (쿼리셋, 타야 하는 인덱스)
+    return {
+        "proposal.filter_address": (
+            Proposal.objects.filter_address(sido, sigungu, eupmyundong).values("id"),
+            "proposal_address_region_idx",
+        ),
+        "proposal.sigungu_cluster": (
+            Proposal.objects.filter(address__sido=sido, address__sigungu=sigungu).values("id"),
+            "proposal_address_region_idx",
+        ),
+        "proposer_level.address": (
+            ProposerLevel.objects.filter(
+                address__sido=sido, address__sigungu=sigungu, address__eupmyundong=eupmyundong,
+            ).values("user_id", "level"),
+            "proposer_level_address_idx",
+        ),
+        "location_history.address": (
+            LocationHistory.objects.filter(
+                address__sido=sido, address__sigungu=sigungu, address__eupmyundong=eupmyundong,
+            ).values("user_id"),
+            "location_history_address_idx",
+        ),
+    }
+
+def explain_region_queries(
+        sido: str = "서울특별시",
+        sigungu: str = "강남구",
+        eupmyundong: str = "역삼동",
+        verbose: bool = True,
+    ) -> dict[str, bool]:
+    """
+    지역(주소 JSON 키) 필터 쿼리의 EXPLAIN을 보고, 주소 식 인덱스를 타는지 확인합니다. (운영 DB 점검용, 회귀 테스트는 proposals.tests)
+    데이터가 적으면 플래너가 순차 스캔을 고르므로, 트랜잭션 안에서만 enable_seqscan을 끄고 확인합니다.
+    (인덱스 식과 쿼리 식이 어긋나면 enable_seqscan을 꺼도 순차 스캔이 나옵니다.)
+
+    Args:
+        sido, sigungu, eupmyundong: EXPLAIN에 넣을 주소
+        verbose: True면 쿼리별 결과와 실행 계획을 print
+
+    Returns:
+        {쿼리 이름: 인덱스 사용 여부}
+    """
+    result = {}
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+        for name, (queryset, index) in _region_queries(sido, sigungu, eupmyundong).items():
+            plan = queryset.explain()
+            result[name] = index in plan
+            if result[name]:
+                logger.info("region query uses index: %s (%s)", name, index)
+            else:
+                logger.warning("region query does not use index: %s (%s)\n%s", name, index, plan)
+            if verbose:
+                print(f"{'OK  ' if result[name] else 'MISS'} {name} ({index})")
+                print(plan)
+    return result
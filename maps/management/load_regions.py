@@ -0,0 +1,37 @@
+from __future__ import annotations
+import logging
+from maps.models import Region
+from maps.regions import REGIONS_CSV_PATH, read_regions_csv, get_region_index
+
+logger = logging.getLogger("maps.crons")
+
+def load_regions(path: str | None = None, batch_size: int = 1000, verbose: bool = True) -> int:
+    """
+    행정구역 중심 좌표 CSV를 Region 테이블에 불러옵니다. 같은 법정동 코드는 이름과 좌표를 갱신합니다.
+    저장소의 전체 법정동 테이블은 마이그레이션(maps 0004)에서 불러오므로, 법정동이 바뀌어 CSV를 고친 뒤에 다시 실행하세요.
+    테이블에 없는 행정구역은 지도 클러스터 응답에서 지오코딩으로 찾습니다.
+
+    Args:
+        path: CSV 경로(없으면 settings.REGIONS_CSV_PATH, 기본 maps/data/regions.csv)
+        batch_size: 한 번에 저장할 행 개수
+        verbose: True면 요약 로그를 print
+
+    Returns:
+        불러온 행 개수
+    """
+    path = path or REGIONS_CSV_PATH
+    rows = read_regions_csv(path)
+
+    for start in range(0, len(rows), batch_size):
+        Region.objects.bulk_create(
+            [Region(**row) for row in rows[start:start + batch_size]],
+            update_conflicts=True,
+            unique_fields=['legal_code'],
+            update_fields=['sido', 'sigungu', 'eupmyundong', 'position'],
+        )
+    get_region_index().reload()
+
+    logger.info("loaded regions: path=%s, rows=%s", path, len(rows))
+    if verbose:
+        print(f"loaded regions: {len(rows)} ({path})")
+    return len(rows)
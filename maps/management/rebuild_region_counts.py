@@ -0,0 +1,23 @@
+from __future__ import annotations
+import logging
+from maps.rollups import rebuild_region_counts as rebuild
+
+logger = logging.getLogger("maps.crons")
+
+def rebuild_region_counts(verbose: bool = True) -> int:
+    """
+    지도 클러스터 집계 테이블(RegionCount)을 제안/펀딩 테이블에서 다시 만듭니다.
+    평소에는 제안/펀딩 생성과 상태 변경 때 증분으로 갱신되고, 이 작업은 어긋난 값을 바로잡습니다.
+
+    Args:
+        verbose: True면 요약 로그를 print
+
+    Returns:
+        집계 행 수
+    """
+    rows = rebuild()
+    logger.info("rebuilt region counts: rows=%s", rows)
+
+    if verbose:
+        print(f"rebuilt region counts: rows={rows}")
+    return rows
@@ -0,0 +1,31 @@
+from __future__ import annotations
+import logging
+from maps.services import GeocodeCacheWarmService
+
+logger = logging.getLogger("maps.crons")
+
+def warm_geocode_cache(verbose: bool = True):
+    """
+    제안 주소에 있는 모든 시도/시군구/읍면동의 중심 좌표를 DB 캐시에 미리 저장합니다.
+    이미 저장된 주소는 다시 호출하지 않으므로 여러 번 실행해도 됩니다.
+
+    Args:
+        verbose: True면 요약 로그를 print
+
+    Returns:
+        GeocodeCacheWarmResult  (total/cached/fetched/not_found/failed 필드 포함)
+    """
+    svc = GeocodeCacheWarmService()
+    result = svc.run()
+
+    logger.info(
+        "warmed: total=%s, cached=%s, fetched=%s, not_found=%s, failed=%s",
+        result.total, result.cached, result.fetched, result.not_found, result.failed
+    )
+
+    if verbose:
+        print(
+            f"warmed: {result.fetched}/{result.total - result.cached} "
+            f"(cached={result.cached}, not_found={result.not_found}, failed={result.failed})"
+        )
+    return result
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.4 on 2026-10-18 06:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GeocodeCache',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('address', models.CharField(help_text='정규화된 전체 주소 (공백 하나로 구분)', max_length=100, unique=True)),
+                ('position', models.JSONField(blank=True, help_text='\n        {\n            "latitude": 126.978388,\n            "longitude": 37.56661\n        }\n        좌표를 찾을 수 없는 주소는 null\n        ', null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
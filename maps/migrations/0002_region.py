@@ -0,0 +1,27 @@
+# Generated by Django 5.2.4 on 2026-10-18 06:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('maps', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Region',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('legal_code', models.CharField(help_text='법정동 코드 (10자리)', max_length=10, unique=True)),
+                ('sido', models.CharField(help_text='시도', max_length=20)),
+                ('sigungu', models.CharField(blank=True, help_text='시군구 (시도 행이면 null)', max_length=20, null=True)),
+                ('eupmyundong', models.CharField(blank=True, help_text='읍면동 (시도/시군구 행이면 null)', max_length=20, null=True)),
+                ('position', models.JSONField(default=dict, help_text='\n        행정구역 중심 좌표\n        {\n            "latitude": 126.978388,\n            "longitude": 37.56661\n        }\n        ')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['sido', 'sigungu', 'eupmyundong'], name='region_name_idx')],
+            },
+        ),
+    ]
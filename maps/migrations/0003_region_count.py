@@ -0,0 +1,46 @@
+# Generated by Django 5.2.4 on 2026-10-18 06:23
+
+from django.db import migrations, models
+
+
+def backfill_region_counts(apps, schema_editor):
+    from maps.rollups import compute_region_counts
+
+    RegionCount = apps.get_model('maps', 'RegionCount')
+    counts = compute_region_counts(apps.get_model('proposals', 'Proposal'), apps.get_model('fundings', 'Funding'))
+    RegionCount.objects.bulk_create(
+        [
+            RegionCount(kind=kind, industry=industry, level=level, sido=sido, sigungu=sigungu, eupmyundong=eupmyundong, number=number)
+            for (kind, industry, level, sido, sigungu, eupmyundong), number in counts.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fundings', '0002_counter_columns'),
+        ('maps', '0002_region'),
+        ('proposals', '0004_address_region_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RegionCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('PROPOSAL', '제안'), ('FUNDING', '펀딩')], max_length=10)),
+                ('industry', models.CharField(blank=True, default='', max_length=24)),
+                ('level', models.CharField(choices=[('SIDO', '시도'), ('SIGUNGU', '시군구'), ('EUPMYUNDONG', '읍면동')], max_length=15)),
+                ('sido', models.CharField(max_length=50)),
+                ('sigungu', models.CharField(blank=True, default='', max_length=50)),
+                ('eupmyundong', models.CharField(blank=True, default='', max_length=50)),
+                ('number', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('kind', 'industry', 'level', 'sido', 'sigungu', 'eupmyundong'), name='unique_region_count')],
+            },
+        ),
+        migrations.RunPython(backfill_region_counts, migrations.RunPython.noop),
+    ]
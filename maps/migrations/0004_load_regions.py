@@ -0,0 +1,32 @@
+from django.db import migrations
+
+
+def load_bundled_regions(apps, schema_editor):
+    # 저장소에 들어 있는 전체 법정동(시도/시군구/읍면동) 중심 좌표 테이블을 불러옵니다.
+    # settings.REGIONS_CSV_PATH로 다른 파일을 쓰더라도 마이그레이션은 항상 저장소의 파일을 씁니다.
+    import os
+    from maps.regions import read_regions_csv
+
+    Region = apps.get_model('maps', 'Region')
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'regions.csv')
+    rows = read_regions_csv(path)
+    Region.objects.bulk_create(
+        [Region(**row) for row in rows],
+        update_conflicts=True,
+        unique_fields=['legal_code'],
+        update_fields=['sido', 'sigungu', 'eupmyundong', 'position'],
+        batch_size=1000,
+    )
+    # 말소된 코드(예: 세종 3611000000을 시도 행으로 쓰던 것)는 지웁니다.
+    Region.objects.exclude(legal_code__in=[row['legal_code'] for row in rows]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('maps', '0003_region_count'),
+    ]
+
+    operations = [
+        migrations.RunPython(load_bundled_regions, migrations.RunPython.noop),
+    ]
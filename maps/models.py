@@ -1,3 +1,124 @@
 from django.db import models
+from utils.choices import RegionCountKindChoices, RegionLevelChoices
 
-# Create your models here.
+class GeocodeCache(models.Model):
+    address = models.CharField(
+        max_length=100,
+        unique=True,
+        help_text='정규화된 전체 주소 (공백 하나로 구분)',
+    )
+    position = models.JSONField(
+        null=True,
+        blank=True,
+        help_text='''
+        {
+            "latitude": 126.978388,
+            "longitude": 37.56661
+        }
+        좌표를 찾을 수 없는 주소는 null
+        '''
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+    )
+
+    def __str__(self):
+        return self.address
+
+class Region(models.Model):
+    legal_code = models.CharField(
+        max_length=10,
+        unique=True,
+        help_text='법정동 코드 (10자리)',
+    )
+    sido = models.CharField(
+        max_length=20,
+        help_text='시도',
+    )
+    sigungu = models.CharField(
+        max_length=20,
+        null=True,
+        blank=True,
+        help_text='시군구 (시도 행이면 null)',
+    )
+    eupmyundong = models.CharField(
+        max_length=20,
+        null=True,
+        blank=True,
+        help_text='읍면동 (시도/시군구 행이면 null)',
+    )
+    position = models.JSONField(
+        default=dict,
+        help_text='''
+        행정구역 중심 좌표
+        {
+            "latitude": 126.978388,
+            "longitude": 37.56661
+        }
+        '''
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["sido", "sigungu", "eupmyundong"],
+                name="region_name_idx",
+            )
+        ]
+
+    def __str__(self):
+        return ' '.join(filter(None, [self.sido, self.sigungu, self.eupmyundong]))
+
+class RegionCount(models.Model):
+    '''
+    지도 클러스터(10km/2km/500m)용 행정구역별 개수 집계 테이블입니다.
+    - PROPOSAL: 펀딩이 없는 제안, FUNDING: 진행 중(IN_PROGRESS)인 펀딩
+    - 상위 행정구역 이름을 함께 저장하고, 그 단계보다 아래 이름은 빈 문자열입니다.
+    - industry가 빈 문자열인 행은 업종 전체 합계입니다.
+    제안/펀딩 생성과 상태 변경 시 maps.rollups.adjust_region_counts로 늘리고 줄이며, rebuild_region_counts로 다시 만듭니다.
+    '''
+    kind = models.CharField(
+        max_length=10,
+        choices=RegionCountKindChoices.choices,
+    )
+    industry = models.CharField(
+        max_length=24,
+        blank=True,
+        default='',
+    )
+    level = models.CharField(
+        max_length=15,
+        choices=RegionLevelChoices.choices,
+    )
+    sido = models.CharField(
+        max_length=50,
+    )
+    sigungu = models.CharField(
+        max_length=50,
+        blank=True,
+        default='',
+    )
+    eupmyundong = models.CharField(
+        max_length=50,
+        blank=True,
+        default='',
+    )
+    number = models.PositiveIntegerField(
+        default=0,
+    )
+
+    class Meta:
+        constraints = [
+            # 클러스터 조회(kind, industry, level, 상위 행정구역)가 이 유니크 인덱스의 앞부분을 그대로 씁니다.
+            models.UniqueConstraint(
+                fields=['kind','industry','level','sido','sigungu','eupmyundong'],
+                name='unique_region_count',
+            )
+        ]
+
+    def __str__(self):
+        region = ' '.join(filter(None, [self.sido, self.sigungu, self.eupmyundong]))
+        return f'{self.get_kind_display()} {region} {self.industry or "전체"}: {self.number}'
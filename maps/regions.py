@@ -0,0 +1,99 @@
+import csv
+import os
+import threading
+import time
+from django.conf import settings
+from .caches import normalize_address
+from .types import PositionType
+
+REGIONS_CSV_PATH = getattr(
+    settings,
+    'REGIONS_CSV_PATH',
+    os.path.join(settings.BASE_DIR, 'maps', 'data', 'regions.csv'),
+)
+REGION_INDEX_TTL = getattr(settings, 'REGION_INDEX_TTL', 60*60) # 다른 프로세스가 불러온 행정구역을 1시간마다 반영
+
+def region_key(sido:str|None, sigungu:str|None=None, eupmyundong:str|None=None) -> tuple:
+    '''
+    행정구역 이름 (시도, 시군구, 읍면동)을 비교할 수 있도록 정규화합니다. 없는 단계는 None입니다.
+    '''
+    return tuple(normalize_address(name) or None for name in (sido, sigungu, eupmyundong))
+
+def read_regions_csv(path:str=REGIONS_CSV_PATH) -> list[dict]:
+    '''
+    행정구역 CSV를 읽습니다.
+    - 열: legal_code, sido, sigungu, eupmyundong, x(경도), y(위도)
+    - 시도 행은 sigungu/eupmyundong, 시군구 행은 eupmyundong을 비워 둡니다. (시군구가 없는 세종은 읍면동 행도 sigungu가 비어 있습니다)
+    '''
+    with open(path, encoding='utf-8-sig', newline='') as file:
+        return [
+            {
+                'legal_code': row['legal_code'].strip(),
+                'sido': normalize_address(row['sido']),
+                'sigungu': normalize_address(row['sigungu']) or None,
+                'eupmyundong': normalize_address(row['eupmyundong']) or None,
+                'position': {
+                    'latitude': float(row['x']),
+                    'longitude': float(row['y']),
+                },
+            }
+            for row in csv.DictReader(file)
+        ]
+
+class RegionIndex:
+    '''
+    행정구역 테이블(Region) 전체를 메모리에 올려 (시도, 시군구, 읍면동) → 중심 좌표를 딕셔너리로 찾습니다.
+    수천 행이므로 프로세스마다 한 번 읽고, REGION_INDEX_TTL마다 다시 읽습니다.
+    '''
+    def __init__(self, ttl:float=REGION_INDEX_TTL):
+        self.ttl = ttl
+        self._positions = dict()
+        self._loaded_at = None
+        self._lock = threading.Lock()
+
+    def reload(self) -> None:
+        from .models import Region
+
+        positions = {
+            region_key(sido, sigungu, eupmyundong): position
+            for sido, sigungu, eupmyundong, position in Region.objects.values_list(
+                'sido', 'sigungu', 'eupmyundong', 'position',
+            )
+        }
+        with self._lock:
+            self._positions = positions
+            self._loaded_at = time.monotonic()
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded_at is None or time.monotonic() - self._loaded_at > self.ttl:
+            self.reload()
+
+    def __len__(self):
+        self._ensure_loaded()
+        return len(self._positions)
+
+    def get_position(self, sido:str|None, sigungu:str|None=None, eupmyundong:str|None=None) -> PositionType|None:
+        self._ensure_loaded()
+        return self._positions.get(region_key(sido, sigungu, eupmyundong))
+
+    def get_positions(self, regions:list[tuple]) -> list[PositionType|None]:
+        '''
+        (시도, 시군구, 읍면동) 목록의 중심 좌표를 입력 순서대로 반환합니다. 테이블에 없는 행정구역은 None입니다.
+        '''
+        self._ensure_loaded()
+        positions = self._positions
+        return [positions.get(region_key(*region)) for region in regions]
+
+_region_index = None
+_region_index_lock = threading.Lock()
+
+def get_region_index() -> RegionIndex:
+    '''
+    프로세스마다 하나의 행정구역 인덱스를 반환합니다.
+    '''
+    global _region_index
+    if _region_index is None:
+        with _region_index_lock:
+            if _region_index is None:
+                _region_index = RegionIndex()
+    return _region_index
@@ -0,0 +1,136 @@
+import logging
+from collections import Counter
+from django.db import connection, transaction
+from django.db.models import Count
+from utils.choices import FundingStatusChoices, IndustryChoices, RegionCountKindChoices, RegionLevelChoices
+from .models import RegionCount
+
+logger = logging.getLogger(__name__)
+
+REGION_KEYS = ('sido', 'sigungu', 'eupmyundong')
+REGION_LEVELS = (RegionLevelChoices.SIDO, RegionLevelChoices.SIGUNGU, RegionLevelChoices.EUPMYUNDONG)
+
+def _name(value) -> str:
+    return value if isinstance(value, str) else ''
+
+def region_count_keys(address:dict, industry:str|None) -> list[tuple[str, str, str, str, str]]:
+    '''
+    주소 하나가 늘리거나 줄일 집계 행의 키 목록 (industry, level, sido, sigungu, eupmyundong)
+    단계마다 업종별 행과 업종 전체('') 행이 하나씩 있습니다. 이름이 비어 있는 단계는 건너뜁니다.
+    '''
+    names = [_name((address or {}).get(key) if isinstance(address, dict) else None) for key in REGION_KEYS]
+    keys = set()
+    for depth, level in enumerate(REGION_LEVELS, start=1):
+        if not names[depth - 1]:
+            continue
+        region = (*names[:depth], *([''] * (len(REGION_KEYS) - depth)))
+        keys.add(('', level, *region))
+        keys.add((industry or '', level, *region))
+    return sorted(keys)
+
+def adjust_region_counts(kind:str, address:dict, industry:str|None, delta:int) -> None:
+    '''
+    제안/펀딩 하나가 늘거나 줄 때 집계 행을 한 문장(INSERT ... ON CONFLICT DO UPDATE)으로 고칩니다.
+    호출하는 쪽의 트랜잭션 안에서 실행되고, 개수는 0 아래로 내려가지 않습니다.
+    '''
+    keys = region_count_keys(address, industry)
+    if not delta or not keys:
+        return
+    quote = connection.ops.quote_name
+    table = quote(RegionCount._meta.db_table)
+    key_columns = ', '.join(quote(name) for name in ('kind', 'industry', 'level', 'sido', 'sigungu', 'eupmyundong'))
+    params = list()
+    for key in keys:
+        # 새 행에는 음수를 넣을 수 없으므로(PositiveIntegerField CHECK) 0부터 시작합니다.
+        params.extend([kind, *key, max(delta, 0)])
+    params.append(delta)
+    sql = (
+        f'INSERT INTO {table} ({key_columns}, {quote("number")}) '
+        f'VALUES {", ".join(["(%s, %s, %s, %s, %s, %s, %s)"] * len(keys))} '
+        f'ON CONFLICT ({key_columns}) '
+        f'DO UPDATE SET {quote("number")} = GREATEST({table}.{quote("number")} + %s, 0)'
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+
+def region_counts(kind:str, level:str, industry:str|None=None, sido:str|None=None, sigungu:str|None=None) -> list[dict]:
+    '''
+    지도 클러스터 개수를 집계 테이블에서 바로 읽습니다. (유니크 인덱스 앞부분으로 조회)
+    Returns:
+        [{"address": 행정구역 이름, "number": 개수}, ...] (이름순)
+    '''
+    if industry and industry not in IndustryChoices.values:
+        return []
+    filters = {'kind': kind, 'industry': industry or '', 'level': level}
+    if sido is not None:
+        filters['sido'] = sido
+    if sigungu is not None:
+        filters['sigungu'] = sigungu
+    name = REGION_KEYS[REGION_LEVELS.index(level)]
+    rows = (
+        RegionCount.objects
+        .filter(**filters, number__gt=0)
+        .order_by(name)
+        .values_list(name, 'number')
+    )
+    return [{'address': address, 'number': number} for address, number in rows]
+
+def compute_region_counts(Proposal, Funding) -> Counter:
+    '''
+    제안/펀딩 테이블에서 집계 행을 처음부터 계산합니다. (모델을 인자로 받아 마이그레이션에서도 씁니다)
+    Returns:
+        Counter{(kind, industry, level, sido, sigungu, eupmyundong): 개수}
+    '''
+    sources = {
+        RegionCountKindChoices.PROPOSAL: (Proposal.objects.filter(funding__isnull=True), 'address', 'industry'),
+        RegionCountKindChoices.FUNDING: (
+            Funding.objects.filter(status=FundingStatusChoices.IN_PROGRESS),
+            'proposal__address',
+            'proposal__industry',
+        ),
+    }
+    counts = Counter()
+    for kind, (queryset, address, industry) in sources.items():
+        for depth, level in enumerate(REGION_LEVELS, start=1):
+            fields = [f'{address}__{key}' for key in REGION_KEYS[:depth]]
+            rows = (
+                queryset
+                .exclude(**{f'{fields[-1]}__isnull': True})
+                .exclude(**{fields[-1]: ''})
+                .values(*fields, industry)
+                .annotate(number=Count('id'))
+                .order_by()
+            )
+            for row in rows:
+                names = [_name(row[field]) for field in fields]
+                if not names[-1]:
+                    continue
+                region = (*names, *([''] * (len(REGION_KEYS) - depth)))
+                counts[(kind, '', level, *region)] += row['number']
+                counts[(kind, row[industry] or '', level, *region)] += row['number']
+    return counts
+
+def rebuild_region_counts() -> int:
+    '''
+    집계 테이블을 제안/펀딩 테이블에서 다시 만듭니다. 증분 갱신이 빠진 경우(관리자 일괄 수정 등)를 바로잡습니다.
+    다시 만드는 동안에는 증분 갱신이 잠깐 기다립니다.
+    Returns:
+        집계 행 수
+    '''
+    from fundings.models import Funding
+    from proposals.models import Proposal
+
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(f'LOCK TABLE {connection.ops.quote_name(RegionCount._meta.db_table)} IN SHARE ROW EXCLUSIVE MODE')
+        counts = compute_region_counts(Proposal, Funding)
+        RegionCount.objects.all().delete()
+        RegionCount.objects.bulk_create(
+            [
+                RegionCount(kind=kind, industry=industry, level=level, sido=sido, sigungu=sigungu, eupmyundong=eupmyundong, number=number)
+                for (kind, industry, level, sido, sigungu, eupmyundong), number in counts.items()
+            ],
+            batch_size=1000,
+        )
+    logger.info(f"지역 집계 테이블을 다시 만들었어요: rows={len(counts)}")
+    return len(counts)
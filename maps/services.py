@@ -1,9 +1,29 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import timedelta
 from typing import Literal
-import requests
+import logging
 from django.conf import settings
-from rest_framework.exceptions import NotFound
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework.exceptions import NotFound, ValidationError
+from .clients import MapsServiceUnavailable, get_naver_maps_client
+from .caches import GEOCODE_NOT_FOUND_TTL, MISSING, full_reverse_geocode_cache, geocode_lru, normalize_address, reverse_geocode_cache
+from .legal_dongs import get_legal_dong_index
+from .models import GeocodeCache
+from .regions import get_region_index
 from .types import PositionType, AddressType, NaverGeocodingAPIType, NaverReverseGeocodingAPIType
 
+logger = logging.getLogger(__name__)
+
+GEOCODING_MAX_WORKERS = getattr(settings, 'GEOCODING_MAX_WORKERS', 8)
+
+def fresh_geocode_cache() -> Q:
+    '''
+    아직 쓸 수 있는 GeocodeCache 행 조건: 좌표가 있거나, null이어도 저장한 지 GEOCODE_NOT_FOUND_TTL이 지나지 않은 행
+    '''
+    return Q(position__isnull=False) | Q(updated_at__gt=timezone.now() - timedelta(seconds=GEOCODE_NOT_FOUND_TTL))
+
 class GeocodingService:
     def get_geocoding(
             self,
@@ -31,8 +51,8 @@ class GeocodingService:
         Returns:
             response (NaverGeocodingAPIType.ResponseType)
         '''
-        response = requests.get(
-            url='https://maps.apigw.ntruss.com/map-geocode/v2/geocode',
+        return get_naver_maps_client().get(
+            path='/map-geocode/v2/geocode',
             params={
                 'query': query,
                 'coordinate': coordinate,
@@ -41,13 +61,7 @@ class GeocodingService:
                 'page': page,
                 'count': count,
             },
-            headers={
-                'x-ncp-apigw-api-key-id': settings.NCLOUD_CLIENT_ID,
-                'x-ncp-apigw-api-key': settings.NCLOUD_CLIENT_SECRET,
-                'Accept': 'application/json'
-            }
         )
-        return response.json()
 
     def get_address_to_position(self, query_address:str) -> PositionType:
         '''
@@ -57,14 +71,29 @@ class GeocodingService:
         Returns:
             position (PositionType): 좌표
         '''
+        position = self._fetch_address_to_position(query_address)
+
+        if position is None:
+            raise NotFound('좌표를 찾을 수 없어요.')
+        return position
+
+    def _fetch_address_to_position(self, query_address:str) -> PositionType|None:
+        '''
+        정상 응답에 결과가 없으면 None을 반환합니다. (캐시해도 되는 "찾을 수 없음")
+        오류 응답(인증 실패, 잘못된 요청 등)은 캐시하지 않도록 NotFound를 냅니다.
+        '''
         response = self.get_geocoding(
             query=query_address,
             count=1,
         )
 
-        if not response.get('addresses'):
+        if response.get('status') != 'OK':
+            logger.warning(f"지오코딩 오류 응답: {query_address}, {response}")
             raise NotFound('좌표를 찾을 수 없어요.')
 
+        if not response.get('addresses'):
+            return None
+
         first_address = response['addresses'][0]
 
         return  {
@@ -72,6 +101,127 @@ class GeocodingService:
             'longitude': float(first_address['y'])
         }
 
+    def _cache_position(self, address:str, position:PositionType|None, updated_at=None) -> None:
+        '''
+        프로세스 LRU 캐시에 저장합니다. null은 DB 행과 같은 시각에 만료되도록 남은 GEOCODE_NOT_FOUND_TTL 동안만 저장합니다.
+        '''
+        if position is None:
+            elapsed = (timezone.now() - updated_at).total_seconds() if updated_at else 0
+            geocode_lru.set(address, None, ttl=max(GEOCODE_NOT_FOUND_TTL - elapsed, 0))
+        else:
+            geocode_lru.set(address, position)
+
+    def _save_positions(self, positions:dict[str, PositionType|None]) -> None:
+        '''
+        정규화된 주소별 좌표를 DB와 프로세스 LRU 캐시에 저장합니다. 이미 있는 주소는 좌표를 갱신합니다.
+        '''
+        GeocodeCache.objects.bulk_create(
+            [GeocodeCache(address=address, position=position) for address, position in positions.items()],
+            update_conflicts=True,
+            unique_fields=['address'],
+            update_fields=['position', 'updated_at'],
+        )
+        for address, position in positions.items():
+            self._cache_position(address, position)
+
+    def get_cached_address_to_position(self, query_address:str) -> PositionType:
+        '''
+        주소를 좌표(위도,경도)로 변환합니다.
+        프로세스 LRU 캐시 → DB 캐시(GeocodeCache) → 네이버 API 순서로 찾고, 찾은 결과를 앞 단계 캐시에 저장합니다.
+        좌표를 찾을 수 없는 주소(정상 응답에 결과 없음)도 null로 저장하고, GEOCODE_NOT_FOUND_TTL이 지나면 다시 조회합니다.
+        오류 응답은 저장하지 않습니다. (행정구역 중심 좌표처럼 거의 바뀌지 않는 주소용)
+        Args:
+            query_address (str): 주소
+        Returns:
+            position (PositionType): 좌표
+        '''
+        address = normalize_address(query_address)
+        position = geocode_lru.get(address, MISSING)
+
+        if position is MISSING:
+            cached_positions = list(GeocodeCache.objects.filter(
+                fresh_geocode_cache(),
+                address=address,
+            ).values_list(
+                'position', 'updated_at',
+            )[:1])
+            if cached_positions:
+                position, updated_at = cached_positions[0]
+                self._cache_position(address, position, updated_at)
+            else:
+                position = self._fetch_address_to_position(address)
+                self._save_positions({address: position})
+
+        if position is None:
+            raise NotFound('좌표를 찾을 수 없어요.')
+        return position
+
+    def _fetch_position(self, address:str) -> tuple[str, PositionType|None, bool]:
+        try:
+            return address, self._fetch_address_to_position(address), True
+        except Exception as e:
+            logger.warning(f"지오코딩 실패: {address}, {e}")
+            return address, None, False
+
+    def get_addresses_to_positions(self, query_addresses:list[str]) -> list[PositionType|None]:
+        '''
+        여러 주소를 한 번에 좌표(위도,경도)로 변환합니다. 입력 순서대로 반환하고, 변환하지 못한 주소는 None입니다.
+        캐시(프로세스 LRU → DB)는 한 번에 조회하고, 캐시에 없는 주소만 스레드 풀에서 동시에 네이버 API를 호출하므로
+        전체 시간은 가장 느린 호출 하나와 비슷합니다. 찾은 결과와 찾을 수 없는 주소는 캐시에 한 번에 저장합니다.
+        Args:
+            query_addresses (list[str]): 주소 목록
+        Returns:
+            positions (list[PositionType|None]): 좌표 목록
+        '''
+        addresses = [normalize_address(query_address) for query_address in query_addresses]
+
+        positions = dict()
+        for address in set(addresses):
+            position = geocode_lru.get(address, MISSING)
+            if position is not MISSING:
+                positions[address] = position
+
+        missing_addresses = set(addresses) - positions.keys()
+        if missing_addresses:
+            for address, position, updated_at in GeocodeCache.objects.filter(
+                fresh_geocode_cache(),
+                address__in=missing_addresses,
+            ).values_list(
+                'address', 'position', 'updated_at',
+            ):
+                positions[address] = position
+                self._cache_position(address, position, updated_at)
+            missing_addresses -= positions.keys()
+
+        if missing_addresses:
+            with ThreadPoolExecutor(max_workers=min(GEOCODING_MAX_WORKERS, len(missing_addresses))) as executor:
+                fetched = list(executor.map(self._fetch_position, missing_addresses))
+            # 실패한 주소는 캐시하지 않고 다음 요청에서 다시 시도
+            self._save_positions({address: position for address, position, ok in fetched if ok})
+            positions.update({address: position for address, position, _ in fetched})
+
+        return [positions.get(address) for address in addresses]
+
+    def get_regions_to_positions(self, regions:list[tuple]) -> list[PositionType|None]:
+        '''
+        행정구역 (시도, 시군구, 읍면동) 목록을 중심 좌표 목록으로 변환합니다. 입력 순서대로 반환합니다.
+        행정구역 테이블(Region)에서 먼저 찾고, 테이블에 없는 행정구역만 주소로 지오코딩합니다.
+        Args:
+            regions (list[tuple]): (시도, 시군구|None, 읍면동|None) 목록
+        Returns:
+            positions (list[PositionType|None]): 좌표 목록
+        '''
+        positions = get_region_index().get_positions(regions)
+
+        missing = [index for index, position in enumerate(positions) if position is None]
+        if missing:
+            fetched = self.get_addresses_to_positions([
+                ' '.join(filter(None, regions[index])) for index in missing
+            ])
+            for index, position in zip(missing, fetched):
+                positions[index] = position
+        return positions
+
     def get_address_to_legal(self, query_address:str) -> list[dict]:
         '''
         일부 주소로 법정동 주소와 좌표를 검색합니다.
@@ -204,8 +354,8 @@ class ReverseGeocodingService:
         Returns:
             response (NaverReverseGeocodingAPIType.ResponseType)
         '''
-        response = requests.get(
-            url='https://maps.apigw.ntruss.com/map-reversegeocode/v2/gc',
+        return get_naver_maps_client().get(
+            path='/map-reversegeocode/v2/gc',
             params={
                 'coords': coords,
                 'sourcecrs': sourcecrs,
@@ -213,12 +363,26 @@ class ReverseGeocodingService:
                 'orders': ','.join(orders),
                 'output': 'json'
             },
-            headers={
-                'x-ncp-apigw-api-key-id': settings.NCLOUD_CLIENT_ID,
-                'x-ncp-apigw-api-key': settings.NCLOUD_CLIENT_SECRET,
-            }
         )
-        return response.json()
+
+    def _reverse_geocoding_results(self, response:NaverReverseGeocodingAPIType.ResponseType) -> list:
+        '''
+        역지오코딩 응답의 결과 목록을 반환합니다. 정상 응답에 결과가 없으면 빈 목록입니다.
+        오류 응답(인증 실패, 잘못된 요청 등)은 캐시하지 않고, 호출한 쪽이 다시 시도하도록 MapsServiceUnavailable을 냅니다.
+        '''
+        code = (response.get('status') or {}).get('code')
+        if code == 0:
+            return response.get('results') or []
+        if code == 3: # 검색 결과 없음
+            return []
+        logger.warning(f"역지오코딩 오류 응답: {response}")
+        raise MapsServiceUnavailable('지도 서비스 응답이 올바르지 않아요.')
+
+    def _position_to_xy(self, query_position:PositionType) -> tuple[float, float]:
+        try:
+            return float(query_position['latitude']), float(query_position['longitude'])
+        except (TypeError, ValueError):
+            raise ValidationError('좌표가 올바르지 않아요.')
 
     def get_position_to_legal(self, query_position:PositionType) -> AddressType.LegalType:
         '''
@@ -228,15 +392,33 @@ class ReverseGeocodingService:
         Returns:
             address (AddressType.LegalType): 법정동 주소
         '''
+        x, y = self._position_to_xy(query_position)
+
+        # 법정동 경계 인덱스에서 먼저 찾고, 어느 법정동에도 속하지 않는 좌표만 네이버 지도 API로 찾습니다.
+        legal = get_legal_dong_index().lookup(x, y)
+        if legal is not None:
+            return legal
+
+        legal = reverse_geocode_cache.get('legal', x, y)
+        if legal is MISSING:
+            legal = self._fetch_position_to_legal(x, y)
+            reverse_geocode_cache.set('legal', x, y, legal)
+
+        if legal is None:
+            raise NotFound('주소를 찾을 수 없어요.')
+        return dict(legal)
+
+    def _fetch_position_to_legal(self, x:float, y:float) -> AddressType.LegalType|None:
         response = self.get_reverse_geocoding(
-            coords=f"{query_position['latitude']},{query_position['longitude']}",
+            coords=f"{x},{y}",
             orders=['legalcode']
         )
 
-        if not response.get('results'):
-            raise NotFound('주소를 찾을 수 없어요.')
+        results = self._reverse_geocoding_results(response)
+        if not results:
+            return None
 
-        legalcode = response['results'][0]
+        legalcode = results[0]
         sido = legalcode.get('region', {}).get('area1', {}).get('name') or None
         sigungu = legalcode.get('region', {}).get('area2', {}).get('name') or None
         eupmyundong = legalcode.get('region', {}).get('area3', {}).get('name') or None
@@ -256,24 +438,38 @@ class ReverseGeocodingService:
         Returns:
             address (AddressType.FullType): 전체 주소
         '''
+        x, y = self._position_to_xy(query_position)
+
+        full = full_reverse_geocode_cache.get('full', x, y)
+        if full is MISSING:
+            full = self._fetch_position_to_full(x, y)
+            full_reverse_geocode_cache.set('full', x, y, full)
+
+        if full is None:
+            raise NotFound('주소를 찾을 수 없어요.')
+
+        if filter_address:
+            if not filter_address == ' '.join(filter(None, [full['sido'], full['sigungu'], full['eupmyundong']])):
+                raise NotFound('핀을 우리 동네로 옮겨 주세요.')
+
+        return dict(full)
+
+    def _fetch_position_to_full(self, x:float, y:float) -> AddressType.FullType|None:
         response = self.get_reverse_geocoding(
-            coords=f"{query_position['latitude']},{query_position['longitude']}",
+            coords=f"{x},{y}",
             orders=['legalcode','addr','roadaddr']
         )
 
-        if not response.get('results'):
-            raise NotFound('주소를 찾을 수 없어요.')
+        results = self._reverse_geocoding_results(response)
+        if not results:
+            return None
         
-        legalcode = next((item for item in response['results'] if item['name'] == 'legalcode'), None)
+        legalcode = next((item for item in results if item['name'] == 'legalcode'), None)
         sido = legalcode.get('region', {}).get('area1', {}).get('name') or None
         sigungu = legalcode.get('region', {}).get('area2', {}).get('name') or None
         eupmyundong = legalcode.get('region', {}).get('area3', {}).get('name') or None
 
-        if filter_address:
-            if not filter_address == ' '.join([sido, sigungu, eupmyundong]):
-                raise NotFound('핀을 우리 동네로 옮겨 주세요.')
-
-        addr = next((item for item in response['results'] if item['name'] == 'addr'), None)
+        addr = next((item for item in results if item['name'] == 'addr'), None)
         if addr:
             jibun_detail = ' '.join(
                 filter(None, [
@@ -286,7 +482,7 @@ class ReverseGeocodingService:
         else:
             jibun_detail = None
 
-        roadaddr = next((item for item in response['results'] if item['name'] == 'roadaddr'), None)
+        roadaddr = next((item for item in results if item['name'] == 'roadaddr'), None)
         if roadaddr:
             road_detail = ' '.join(
                 filter(None, [
@@ -304,3 +500,62 @@ class ReverseGeocodingService:
             'jibun_detail': jibun_detail,
             'road_detail': road_detail,
         }
+
+@dataclass
+class GeocodeCacheWarmResult:
+    total: int = 0      # 제안 주소에 있는 시도/시군구/읍면동 주소 수
+    cached: int = 0     # 이미 DB 캐시에 있던 주소 수 (만료된 null 행 제외)
+    fetched: int = 0    # 새로 좌표를 찾아 저장한 주소 수
+    not_found: int = 0  # 좌표를 찾을 수 없어 null로 저장한 주소 수
+    failed: int = 0     # API 호출에 실패하거나 오류 응답을 받은 주소 수 (저장하지 않고 다음 실행에서 다시 시도)
+
+class GeocodeCacheWarmService:
+    """
+    제안 주소에 있는 모든 시도/시군구/읍면동의 중심 좌표를 미리 찾아 DB 캐시에 저장합니다.
+    지도 클러스터 응답이 요청 중에 네이버 API를 호출하지 않도록 배치로 실행합니다.
+    null로 저장한 주소는 GEOCODE_NOT_FOUND_TTL이 지나면 다시 찾고, 오류 응답을 받은 주소는 저장하지 않습니다.
+    """
+    def __init__(self):
+        self.geocoder = GeocodingService()
+
+    def _region_addresses(self) -> set[str]:
+        from proposals.models import Proposal
+
+        addresses = set()
+        for sido, sigungu, eupmyundong in Proposal.objects.values_list(
+            'address__sido', 'address__sigungu', 'address__eupmyundong',
+        ).distinct():
+            if sido:
+                addresses.add(normalize_address(sido))
+                if sigungu:
+                    addresses.add(normalize_address(f"{sido} {sigungu}"))
+                    if eupmyundong:
+                        addresses.add(normalize_address(f"{sido} {sigungu} {eupmyundong}"))
+        return addresses
+
+    def run(self) -> GeocodeCacheWarmResult:
+        result = GeocodeCacheWarmResult()
+        addresses = self._region_addresses()
+        result.total = len(addresses)
+
+        cached_addresses = set(GeocodeCache.objects.filter(
+            fresh_geocode_cache(),
+            address__in=addresses,
+        ).values_list(
+            'address', flat=True,
+        ))
+        result.cached = len(cached_addresses)
+
+        for address in sorted(addresses - cached_addresses):
+            try:
+                position = self.geocoder._fetch_address_to_position(address)
+            except Exception as e:
+                logger.warning(f"지오코딩 캐시 예열 실패: {address}, {e}")
+                result.failed += 1
+                continue
+            self.geocoder._save_positions({address: position})
+            if position is None:
+                result.not_found += 1
+            else:
+                result.fetched += 1
+        return result
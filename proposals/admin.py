@@ -1,7 +1,31 @@
 from django.contrib import admin
+from django.db import transaction
 from .models import Proposal, ProposerLikeProposal, ProposerScrapProposal, FounderScrapProposal
+from .services import record_proposal_region_change
+
+@admin.register(Proposal)
+class ProposalAdmin(admin.ModelAdmin):
+    """
+    관리자에서 제안의 주소/업종을 고치거나 제안을 지울 때 지도 클러스터 집계도 함께 고칩니다.
+    """
+    def save_model(self, request, obj, form, change):
+        before = Proposal.objects.filter(pk=obj.pk).first() if change else None
+        with transaction.atomic():
+            super().save_model(request, obj, form, change)
+            record_proposal_region_change(before, obj)
+
+    def delete_model(self, request, obj):
+        with transaction.atomic():
+            super().delete_model(request, obj)
+            record_proposal_region_change(obj, None)
+
+    def delete_queryset(self, request, queryset):
+        with transaction.atomic():
+            proposals = list(queryset)
+            super().delete_queryset(request, queryset)
+            for proposal in proposals:
+                record_proposal_region_change(proposal, None)
 
-admin.site.register(Proposal)
 admin.site.register(ProposerLikeProposal)
 admin.site.register(ProposerScrapProposal)
 admin.site.register(FounderScrapProposal)
@@ -0,0 +1,8 @@
+import logging
+logger = logging.getLogger("proposals.crons")
+from proposals.management.reconcile_proposal_counters import reconcile_proposal_counters
+
+def reconcile_proposal_counters_job():
+    logger.info("reconcile_proposal_counters_job: 시작")
+    fixed = reconcile_proposal_counters(verbose=False)
+    logger.info(f"reconcile_proposal_counters_job: 완료 - fixed={fixed}")
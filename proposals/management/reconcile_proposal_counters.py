@@ -0,0 +1,22 @@
+from __future__ import annotations
+from proposals.services import reconcile_proposal_counters as reconcile
+import logging
+
+logger = logging.getLogger("proposals.crons")
+
+def reconcile_proposal_counters(verbose: bool = True) -> int:
+    """
+    제안의 좋아요/스크랩 수 컬럼을 실제 행 개수로 맞춥니다.
+
+    Args:
+        verbose: True면 요약 로그를 print
+
+    Returns:
+        고친 제안 수
+    """
+    fixed = reconcile()
+    logger.info("reconciled proposal counters: fixed=%s", fixed)
+
+    if verbose:
+        print(f"reconciled proposal counters: fixed={fixed}")
+    return fixed
@@ -0,0 +1,54 @@
+# Generated by Django 5.2.4 on 2026-10-18 06:14
+
+from django.db import migrations, models
+
+
+def backfill_spatial_columns(apps, schema_editor):
+    from maps import geohash
+
+    Proposal = apps.get_model('proposals', 'Proposal')
+    batch = []
+    for proposal in Proposal.objects.only('id', 'position').iterator(chunk_size=1000):
+        position = proposal.position or {}
+        try:
+            proposal.latitude = float(position.get('latitude'))
+            proposal.longitude = float(position.get('longitude'))
+        except (TypeError, ValueError):
+            continue
+        proposal.geohash = geohash.encode(proposal.latitude, proposal.longitude, 9)
+        batch.append(proposal)
+        if len(batch) >= 1000:
+            Proposal.objects.bulk_update(batch, ['latitude', 'longitude', 'geohash'])
+            batch = []
+    if batch:
+        Proposal.objects.bulk_update(batch, ['latitude', 'longitude', 'geohash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('proposals', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='proposal',
+            name='geohash',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=12, null=True),
+        ),
+        migrations.AddField(
+            model_name='proposal',
+            name='latitude',
+            field=models.FloatField(blank=True, editable=False, help_text='position.latitude (X 좌표, 경도)', null=True),
+        ),
+        migrations.AddField(
+            model_name='proposal',
+            name='longitude',
+            field=models.FloatField(blank=True, editable=False, help_text='position.longitude (Y 좌표, 위도)', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='proposal',
+            index=models.Index(fields=['latitude', 'longitude'], name='proposal_lat_lng_idx'),
+        ),
+        migrations.RunPython(backfill_spatial_columns, migrations.RunPython.noop),
+    ]
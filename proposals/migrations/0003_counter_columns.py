@@ -0,0 +1,44 @@
+# Generated by Django 5.2.4 on 2026-10-18 06:17
+
+from django.db import migrations, models
+
+
+def backfill_counter_columns(apps, schema_editor):
+    from utils.counters import count_subquery, reconcile_counters
+
+    Proposal = apps.get_model('proposals', 'Proposal')
+    ProposerLikeProposal = apps.get_model('proposals', 'ProposerLikeProposal')
+    ProposerScrapProposal = apps.get_model('proposals', 'ProposerScrapProposal')
+    FounderScrapProposal = apps.get_model('proposals', 'FounderScrapProposal')
+    reconcile_counters(Proposal.objects.all(), {
+        'likes_count': count_subquery(ProposerLikeProposal.objects.all(), 'proposal'),
+        'scraps_count': (
+            count_subquery(ProposerScrapProposal.objects.all(), 'proposal')
+            + count_subquery(FounderScrapProposal.objects.all(), 'proposal')
+        ),
+    })
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('proposals', '0002_proposal_spatial_columns'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='proposal',
+            name='likes_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='proposal',
+            name='scraps_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='proposal',
+            index=models.Index(fields=['-likes_count', '-id'], name='proposal_likes_count_idx'),
+        ),
+        migrations.RunPython(backfill_counter_columns, migrations.RunPython.noop),
+    ]
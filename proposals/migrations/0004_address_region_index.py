@@ -0,0 +1,19 @@
+# Generated by Django 5.2.4 on 2026-10-18 06:20
+
+import django.db.models.fields.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_address_region_indexes'),
+        ('proposals', '0003_counter_columns'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='proposal',
+            index=models.Index(django.db.models.fields.json.KeyTransform('sido', 'address'), django.db.models.fields.json.KeyTransform('sigungu', 'address'), django.db.models.fields.json.KeyTransform('eupmyundong', 'address'), name='proposal_address_region_idx'),
+        ),
+    ]
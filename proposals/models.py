@@ -1,7 +1,11 @@
 from django.db import models
+from maps import geohash
 from utils.choices import IndustryChoices, RadiusChoices
+from utils.indexes import address_region_index
 from .querysets import ProposalQuerySet
 
+PROPOSAL_GEOHASH_PRECISION = 9 # 약 4.8m
+
 class Proposal(models.Model):
     user = models.ForeignKey(
         'accounts.Proposer',
@@ -54,9 +58,36 @@ class Proposal(models.Model):
         }
         '''
     )
+    # position에서 파생되는 지도 범위 검색용 컬럼 (save()에서 채움)
+    latitude = models.FloatField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text='position.latitude (X 좌표, 경도)',
+    )
+    longitude = models.FloatField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text='position.longitude (Y 좌표, 위도)',
+    )
+    geohash = models.CharField(
+        max_length=12,
+        null=True,
+        blank=True,
+        editable=False,
+        db_index=True,
+    )
     radius = models.PositiveSmallIntegerField(
         choices=RadiusChoices.choices,
     )
+    # 좋아요/스크랩 수 (좋아요/스크랩 서비스에서 F 식으로 갱신, reconcile_proposal_counters로 보정)
+    likes_count = models.PositiveIntegerField(
+        default=0,
+    )
+    scraps_count = models.PositiveIntegerField(
+        default=0,
+    )
     image1 = models.ImageField(
         upload_to='proposal/image',
         null=True,
@@ -75,9 +106,42 @@ class Proposal(models.Model):
 
     objects = ProposalQuerySet.as_manager()
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['latitude','longitude'],
+                name='proposal_lat_lng_idx',
+            ),
+            models.Index(
+                fields=['-likes_count','-id'],
+                name='proposal_likes_count_idx',
+            ),
+            address_region_index('proposal_address_region_idx'),
+        ]
+
     def __str__(self):
         return self.title
 
+    def sync_position_columns(self) -> None:
+        '''
+        position으로 latitude, longitude, geohash 컬럼을 채웁니다. 좌표가 없거나 잘못되었으면 비웁니다.
+        '''
+        position = self.position or {}
+        try:
+            self.latitude = float(position.get('latitude'))
+            self.longitude = float(position.get('longitude'))
+        except (TypeError, ValueError):
+            self.latitude = self.longitude = self.geohash = None
+            return
+        self.geohash = geohash.encode(self.latitude, self.longitude, PROPOSAL_GEOHASH_PRECISION)
+
+    def save(self, *args, **kwargs):
+        self.sync_position_columns()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'position' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'latitude', 'longitude', 'geohash'}
+        super().save(*args, **kwargs)
+
 class ProposerLikeProposal(models.Model):
     user = models.ForeignKey(
         'accounts.Proposer',
@@ -1,7 +1,9 @@
 from typing import Literal
 from django.db import models
-from django.db.models import  Count, OuterRef, Exists, BooleanField, Case, When, Value, F, Max, Q
+from django.db.models.functions import Coalesce
+from django.db.models import  OuterRef, Exists, BooleanField, Case, When, Value, Max, Q
 from utils.choices import ProfileChoices, IndustryChoices
+from utils.counters import add_counts
 from fundings.models import Funding
 from functools import reduce
 from operator import or_
@@ -13,16 +15,16 @@ class ProposalQuerySet(models.QuerySet):
         )
 
     def with_analytics(self):
-        return (
-            self.annotate(
-                # distinct=True: 여러 관계를 한 쿼리에서 annotate할 때 join 곱셈으로 카운트가 부풀 수 있어요. likes에도 넣는 게 안전합니다.
-                likes_count=Count('proposer_like_proposal', distinct=True),
-                proposer_scraps=Count('proposer_scrap_proposal', distinct=True),
-                founder_scraps=Count('founder_scrap_proposal', distinct=True),
-        )
-        .annotate(scraps_count=F('proposer_scraps') + F('founder_scraps'))
-    )
-    
+        """
+        좋아요/스크랩 수는 likes_count, scraps_count 컬럼에 유지되므로 따로 집계하지 않습니다.
+        """
+        return self
+
+    def add_counts(self, **deltas) -> int:
+        """
+        좋아요/스크랩 수 컬럼에 F 식으로 값을 더합니다. 예: .filter(id=proposal_id).add_counts(likes_count=1)
+        """
+        return add_counts(self, **deltas)
 
     def filter_address(self, sido, sigungu, eupmyundong):
         if not (sido and sigungu and eupmyundong):
@@ -73,14 +75,14 @@ class ProposalQuerySet(models.QuerySet):
     def with_level_area(self, *, sido: str, sigungu: str, eupmyundong: str):
         """해당 동 기준 제안자 레벨(정렬용) 주입"""
         return self.annotate(
-            level_area=Max(
+            level_area=Coalesce(Max(
                 "user__proposer_level__level",
                 filter=Q(
                     user__proposer_level__address__sido=sido,
                     user__proposer_level__address__sigungu=sigungu,
                     user__proposer_level__address__eupmyundong=eupmyundong,
                 ),
-            )
+            ), 0),  # 레벨이 없으면 0 (NULL은 내림차순 맨 앞에 옴)
         )
     def order_by_choice(self, order: str):
         """
@@ -270,8 +270,4 @@ class ProposalIdSerializer(serializers.Serializer):
         min_value=1,
     )
 
-    def validate_proposal_id(self, value):
-        if not Proposal.objects.filter(id=value).exists():
-            raise serializers.ValidationError('존재하지 않는 제안이에요.')
-        return value
 
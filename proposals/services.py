@@ -1,9 +1,16 @@
 from typing import List, Dict, Optional
 from django.http import HttpRequest
-from rest_framework.exceptions import PermissionDenied
-from utils.choices import ProfileChoices, IndustryChoices
+from django.db import transaction
+from rest_framework.exceptions import PermissionDenied, ValidationError
+from utils.choices import ProfileChoices, FundingStatusChoices, RegionCountKindChoices, RegionLevelChoices
 from utils.decorators import require_profile
-from django.db.models import Count
+from utils.toggles import load_toggle_target, toggle_row
+from utils.pagination import paginate_keyset
+from utils.counters import count_subquery, reconcile_counters
+from django.db.models import F
+from maps.rollups import adjust_region_counts, region_counts
+from fundings.models import Funding
+from recommendations.services import invalidate_founder_recommendation_feed
 from .models import Proposal, ProposerLikeProposal, ProposerScrapProposal, FounderScrapProposal
 from .serializers import ProposalListSerializer
 
@@ -11,7 +18,6 @@ class ProposerLikeProposalService:
     def __init__(self, request:HttpRequest):
         self.request = request
 
-    @require_profile(ProfileChoices.proposer)
     def post(self, proposal_id:int) -> bool:
         '''
         Args:
@@ -21,25 +27,25 @@ class ProposerLikeProposalService:
                 - `True`: 좋아요 추가
                 - `False`: 좋아요 삭제
         '''
-        proposal = Proposal.objects.get(id=proposal_id)
-        if proposal.user.user == self.request.user:
+        # 작성자 확인, 존재 확인, 프로필 조회를 한 번의 조회로 합니다.
+        target = load_toggle_target(Proposal.objects.filter(id=proposal_id), 'user__user_id', self.request.user, ProfileChoices.proposer)
+        if target is None:
+            raise ValidationError({'proposal_id': ['존재하지 않는 제안이에요.']})
+        owner_id, proposer_id = target
+        if owner_id == self.request.user.id:
             raise PermissionDenied('자신의 제안을 좋아할 수 없어요.')
 
-        obj, created = ProposerLikeProposal.objects.get_or_create(
-            user=self.request.user.proposer,
-            proposal=proposal,
-        )
-        if created:
-            return True
-        else:
-            obj.delete()
-            return False
+        # 관계 행과 카운터 컬럼을 한 트랜잭션에서 바꿉니다.
+        with transaction.atomic():
+            delta = toggle_row(ProposerLikeProposal, user_id=proposer_id, proposal_id=proposal_id)
+            if delta:
+                Proposal.objects.filter(id=proposal_id).add_counts(likes_count=delta)
+        return delta >= 0
 
 class ProposerScrapProposalService:
     def __init__(self, request:HttpRequest):
         self.request = request
 
-    @require_profile(ProfileChoices.proposer)
     def post(self, proposal_id:int) -> bool:
         '''
         Args:
@@ -49,19 +55,20 @@ class ProposerScrapProposalService:
                 - `True`: 스크랩 추가
                 - `False`: 스크랩 삭제
         '''
-        proposal = Proposal.objects.get(id=proposal_id)
-        if proposal.user.user == self.request.user:
+        # 작성자 확인, 존재 확인, 프로필 조회를 한 번의 조회로 합니다.
+        target = load_toggle_target(Proposal.objects.filter(id=proposal_id), 'user__user_id', self.request.user, ProfileChoices.proposer)
+        if target is None:
+            raise ValidationError({'proposal_id': ['존재하지 않는 제안이에요.']})
+        owner_id, proposer_id = target
+        if owner_id == self.request.user.id:
             raise PermissionDenied('자신의 제안을 스크랩할 수 없어요.')
 
-        obj, created = ProposerScrapProposal.objects.get_or_create(
-            user=self.request.user.proposer,
-            proposal=proposal,
-        )
-        if created:
-            return True
-        else:
-            obj.delete()
-            return False
+        # 관계 행과 카운터 컬럼을 한 트랜잭션에서 바꿉니다.
+        with transaction.atomic():
+            delta = toggle_row(ProposerScrapProposal, user_id=proposer_id, proposal_id=proposal_id)
+            if delta:
+                Proposal.objects.filter(id=proposal_id).add_counts(scraps_count=delta)
+        return delta >= 0
 
     @require_profile(ProfileChoices.proposer)
     def get(self, sido:str|None=None, sigungu:str|None=None, eupmyundong:str|None=None):
@@ -73,17 +80,19 @@ class ProposerScrapProposalService:
             eupmyundong=eupmyundong,
         ).with_analytics(
         ).with_user(
+        ).annotate(
+            scrapped_at=F('proposer_scrap_proposal__created_at'),
         ).order_by(
-            '-proposer_scrap_proposal__created_at',
+            '-scrapped_at', '-id',
         )
-        serializer = ProposalListSerializer(proposals, many=True)
-        return serializer.data
+        page = paginate_keyset(proposals, self.request.query_params)
+        serializer = ProposalListSerializer(page.items, many=True)
+        return page.to_response(serializer.data)
 
 class FounderScrapProposalService:
     def __init__(self, request:HttpRequest):
         self.request = request
 
-    @require_profile(ProfileChoices.founder)
     def post(self, proposal_id:int) -> bool:
         '''
         Args:
@@ -93,19 +102,24 @@ class FounderScrapProposalService:
                 - `True`: 스크랩 추가
                 - `False`: 스크랩 삭제
         '''
-        proposal = Proposal.objects.get(id=proposal_id)
-        if proposal.user.user == self.request.user:
+        # 작성자 확인, 존재 확인, 프로필 조회를 한 번의 조회로 합니다.
+        target = load_toggle_target(Proposal.objects.filter(id=proposal_id), 'user__user_id', self.request.user, ProfileChoices.founder)
+        if target is None:
+            raise ValidationError({'proposal_id': ['존재하지 않는 제안이에요.']})
+        owner_id, founder_id = target
+        if owner_id == self.request.user.id:
             raise PermissionDenied('자신의 제안을 스크랩할 수 없어요.')
 
-        obj, created = FounderScrapProposal.objects.get_or_create(
-            user=self.request.user.founder,
-            proposal=proposal,
-        )
-        if created:
-            return True
-        else:
-            obj.delete()
-            return False
+        # 관계 행과 카운터 컬럼을 한 트랜잭션에서 바꿉니다.
+        with transaction.atomic():
+            delta = toggle_row(FounderScrapProposal, user_id=founder_id, proposal_id=proposal_id)
+            if delta:
+                Proposal.objects.filter(id=proposal_id).add_counts(scraps_count=delta)
+        created = delta >= 0
+
+        # 스크랩 기준 추천 피드는 백그라운드에서 다시 계산
+        invalidate_founder_recommendation_feed(founder_id)
+        return created
 
     @require_profile(ProfileChoices.founder)
     def get(self, sido:str|None=None, sigungu:str|None=None, eupmyundong:str|None=None):
@@ -117,11 +131,14 @@ class FounderScrapProposalService:
             eupmyundong=eupmyundong,
         ).with_analytics(
         ).with_user(
+        ).annotate(
+            scrapped_at=F('founder_scrap_proposal__created_at'),
         ).order_by(
-            '-founder_scrap_proposal__created_at',
+            '-scrapped_at', '-id',
         )
-        serializer = ProposalListSerializer(proposals, many=True)
-        return serializer.data
+        page = paginate_keyset(proposals, self.request.query_params)
+        serializer = ProposalListSerializer(page.items, many=True)
+        return page.to_response(serializer.data)
     
 
 class ProposalMapService:
@@ -130,42 +147,51 @@ class ProposalMapService:
         self.request = request
         self.profile = (profile or "").lower()
 
-    def _group_counts(self, base_qs, group: str, industry: Optional[str]) -> List[Dict]:
-        # 펀딩 없는 것만
-        base = base_qs.filter(funding__isnull=True)
-
-        # industry 유효성 + 필터 (None이면 통과)
-        if industry:
-            valid = {c for c, _ in IndustryChoices.choices}
-            if industry not in valid:
-                base = base.none()
-            else:
-                base = base.filter(industry=industry)
-
-        base = base.exclude(**{f"{group}__isnull": True}).exclude(**{group: ""})
-
-        rows = (
-            base.values(group)
-                .annotate(number=Count("id"))
-                .order_by(group)
-        )
-        return [{"address": r[group], "number": r["number"]} for r in rows]
-
     def cluster_counts_sido(self, industry: Optional[str]) -> List[Dict]:
-        """도(시도) 레벨 클러스터"""
-        group = "address__sido"
-        base = Proposal.objects.all()
-        return self._group_counts(base, group, industry)
+        """도(시도) 레벨 클러스터 (펀딩 없는 제안, 집계 테이블에서 조회)"""
+        return region_counts(RegionCountKindChoices.PROPOSAL, RegionLevelChoices.SIDO, industry)
 
     def cluster_counts_sigungu(self, sido: str, industry: Optional[str]) -> List[Dict]:
         """구(시군구) 레벨 클러스터"""
-        group = "address__sigungu"
-        base = Proposal.objects.filter(address__sido=sido)
-        return self._group_counts(base, group, industry)
+        return region_counts(RegionCountKindChoices.PROPOSAL, RegionLevelChoices.SIGUNGU, industry, sido=sido)
 
     def cluster_counts_eupmyundong(self, sido: str, sigungu: str, industry: Optional[str]) -> List[Dict]:
         """동(읍면동) 레벨 클러스터"""
-        group = "address__eupmyundong"
-        base = Proposal.objects.filter(address__sido=sido, address__sigungu=sigungu)
-        return self._group_counts(base, group, industry)
-    
\ No newline at end of file
+        return region_counts(RegionCountKindChoices.PROPOSAL, RegionLevelChoices.EUPMYUNDONG, industry, sido=sido, sigungu=sigungu)
+
+
+def reconcile_proposal_counters(batch_size: int = 1000) -> int:
+    """
+    좋아요/스크랩 수 컬럼을 실제 좋아요/스크랩 행에서 다시 계산해 어긋난 제안만 고칩니다.
+
+    Returns:
+        고친 제안 수
+    """
+    return reconcile_counters(
+        Proposal.objects.all(),
+        {
+            "likes_count": count_subquery(ProposerLikeProposal.objects.all(), "proposal"),
+            "scraps_count": (
+                count_subquery(ProposerScrapProposal.objects.all(), "proposal")
+                + count_subquery(FounderScrapProposal.objects.all(), "proposal")
+            ),
+        },
+        batch_size=batch_size,
+    )
+
+
+def record_proposal_region_change(before: Proposal | None, after: Proposal | None) -> None:
+    """
+    제안 생성/수정/삭제 전후 상태로 지도 클러스터 집계(maps.RegionCount)를 고칩니다. 같은 트랜잭션 안에서 호출해 주세요.
+    - 펀딩이 없는 제안은 제안 집계에 들어갑니다.
+    - 펀딩이 달린 제안의 주소/업종이 바뀌면, 진행 중(IN_PROGRESS)인 펀딩 집계를 고칩니다.
+    """
+    proposal_id = (before or after).pk
+    funding_status = Funding.objects.filter(proposal_id=proposal_id).values_list("status", flat=True).first()
+    for proposal, sign in ((before, -1), (after, 1)):
+        if proposal is None:
+            continue
+        if funding_status is None:
+            adjust_region_counts(RegionCountKindChoices.PROPOSAL, proposal.address, proposal.industry, sign)
+        elif funding_status == FundingStatusChoices.IN_PROGRESS:
+            adjust_region_counts(RegionCountKindChoices.FUNDING, proposal.address, proposal.industry, sign)
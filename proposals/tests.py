@@ -1,3 +1,17 @@
+from django.db import connection
 from django.test import TestCase
+from maps.management.explain_region_queries import _region_queries
 
-# Create your tests here.
+class RegionQueryIndexTests(TestCase):
+    """
+    지역(주소 JSON 키) 필터 쿼리가 주소 식 인덱스를 타는지 EXPLAIN으로 확인합니다.
+    인덱스 식과 쿼리 식이 어긋나면(키 순서, 연산자 등) 순차 스캔이 나와 실패합니다.
+    """
+    def test_region_queries_use_address_indexes(self):
+        # 테스트 데이터가 없어 플래너가 순차 스캔을 고르므로, 테스트 트랜잭션 안에서만 끕니다.
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+        for name, (queryset, index) in _region_queries("서울특별시", "강남구", "역삼동").items():
+            with self.subTest(name):
+                self.assertIn(index, queryset.explain())
@@ -1,16 +1,30 @@
 from rest_framework.parsers import MultiPartParser, FormParser
 from django.shortcuts import get_object_or_404
 from django.http import HttpRequest
+from django.db import transaction
 from django.utils.decorators import method_decorator
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from utils.choices import ProfileChoices, ZoomChoices
+from utils.choices import ProfileChoices, ZoomChoices, RegionCountKindChoices
 from utils.decorators import validate_path_choices
+from maps.clusters import (
+    MAP_VIEWPORT_ZOOM_PRECISION,
+    parse_cluster_query,
+    parse_sample_size,
+    build_cluster_response,
+    parse_viewport_query,
+    filter_viewport,
+    viewport_cells,
+    viewport_sample_ids,
+)
+from maps.rollups import adjust_region_counts
 from maps.services import GeocodingService
 from utils.helpers import resolve_viewer_addr
+from utils.pagination import paginate_keyset
+from recommendations.services import store_proposal_vectors, invalidate_industry_recommendation_feeds
 from .models import Proposal
 from collections import OrderedDict
 from .serializers import (
@@ -53,16 +67,19 @@ class ProposalsRoot(APIView):
             return Response({"detail": "proposer 프로필이 존재하지 않습니다. 먼저 생성하세요."},
                             status=status.HTTP_403_FORBIDDEN)
 
-        proposal = Proposal.objects.create(
-            user=proposer,
-            title=v["title"],
-            content=v["content"],
-            industry=v["industry"],
-            business_hours=v["business_hours"],
-            address=v["address"],
-            position=v["position"],
-            radius=v["radius"],
-        )
+        # 제안 생성과 지도 클러스터 집계 더하기를 한 트랜잭션으로 (집계 재계산과 겹쳐도 두 번 더해지지 않도록)
+        with transaction.atomic():
+            proposal = Proposal.objects.create(
+                user=proposer,
+                title=v["title"],
+                content=v["content"],
+                industry=v["industry"],
+                business_hours=v["business_hours"],
+                address=v["address"],
+                position=v["position"],
+                radius=v["radius"],
+            )
+            adjust_region_counts(RegionCountKindChoices.PROPOSAL, proposal.address, proposal.industry, 1)
 
         if files:
             if len(files) >= 1: proposal.image1 = files[0]
@@ -70,6 +87,10 @@ class ProposalsRoot(APIView):
             if len(files) >= 3: proposal.image3 = files[2]
             proposal.save(update_fields=["image1", "image2", "image3"])
 
+        # 추천용 제안 벡터 저장(모델이 이미 올라와 있을 때만, 아니면 임베딩 배치 작업) + 같은 업종 창업자의 추천 피드 무효화
+        store_proposal_vectors([proposal])
+        invalidate_industry_recommendation_feeds(proposal.industry)
+
         return Response({"detail": "제안글을 추가했어요."}, status=status.HTTP_201_CREATED)
 
 
@@ -111,13 +132,16 @@ class ProposalsZoom(APIView):
         # 동 이하: 상세 목록
         if zoom == ZoomChoices.M0:
             try:
-                qs = (
+                base = (
                     Proposal.objects
                     .filter_address(sido, sigungu, eupmyundong)
                     .filter(funding__isnull=True)
+                    .filter_industry_choice(industry)
+                )
+                qs = (
+                    base
                     .with_analytics()
                     .with_level_area(sido=sido, sigungu=sigungu, eupmyundong=eupmyundong)
-                    .filter_industry_choice(industry)
                     .with_flags(user=request.user, profile=profile, viewer_addr=viewer_addr)
                     .with_user()
                     .with_has_funding()
@@ -125,11 +149,23 @@ class ProposalsZoom(APIView):
                 )
             except ValueError as e:
                 return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
-            
-            groups: dict[tuple[float, float], dict] = {}
+
             prof = (profile or "").lower()
 
-            for obj in qs:
+            # 격자 묶음: precision(묶음 목록) 또는 cluster(묶음 항목 페이지)가 있으면 geohash 칸으로 묶어 응답
+            cluster_query = parse_cluster_query(request.query_params)
+            if cluster_query is not None:
+                serializer_class = ProposalZoomFounderItemSerializer if prof == "founder" else ProposalListSerializer
+                def serialize(obj):
+                    return serializer_class(obj, context={"request": request}).data
+                data = build_cluster_response(base, qs, cluster_query, request.query_params, serialize, "proposals")
+                return Response(data, status=status.HTTP_200_OK)
+
+            # 좌표 묶음 목록은 정렬 순서대로 커서 페이지 단위로 만듭니다. (같은 좌표가 다음 페이지에 이어질 수 있음)
+            page = paginate_keyset(qs, request.query_params)
+            groups: dict[tuple[float, float], dict] = {}
+
+            for obj in page.items:
                 pos = obj.position or {}
                 try:
                     lat = float(pos.get("latitude"))
@@ -151,7 +187,7 @@ class ProposalsZoom(APIView):
                 # 항목 내부에는 position 없음(명세 준수)
                 groups[key]["proposals"].append(item)
 
-            return Response(list(groups.values()), status=status.HTTP_200_OK)
+            return Response(page.to_response(list(groups.values())), status=status.HTTP_200_OK)
 
 
         # 클러스터(시도/시군구/읍면동)
@@ -183,29 +219,30 @@ class ProposalsZoom(APIView):
                 return _one(viewer)
             return False
 
-        result = []
-        for idx, row in enumerate(grouped, start=1):
+        rows = []
+        for row in grouped:
             addr_text = row["address"]
 
             if zoom == ZoomChoices.M10000:
-                full_addr = addr_text
+                region = (addr_text, None, None)
                 is_address = _match(viewer_addr, sido=addr_text)
             elif zoom == ZoomChoices.M2000:
-                full_addr = f"{sido} {addr_text}"
+                region = (sido, addr_text, None)
                 is_address = _match(viewer_addr, sido=sido, sigungu=addr_text)
             else:  # M500
-                full_addr = f"{sido} {sigungu} {addr_text}"
+                region = (sido, sigungu, addr_text)
                 is_address = _match(viewer_addr, sido=sido, sigungu=sigungu, eup=addr_text)
-            # position 반환
-            try:
-                pos = geocoder.get_address_to_position(query_address=full_addr)
-            except Exception:
-                pos = {"latitude": None, "longitude": None}
+            rows.append((row, region, is_address))
+
+        # position 반환 (행정구역 테이블에 없는 행정구역만 지오코딩)
+        positions = geocoder.get_regions_to_positions([region for _, region, _ in rows])
 
+        result = []
+        for idx, ((row, _, is_address), pos) in enumerate(zip(rows, positions), start=1):
             result.append({
                 "id": idx,
-                "address": addr_text,
-                "position": pos,
+                "address": row["address"],
+                "position": pos or {"latitude": None, "longitude": None},
                 "number": row["number"],
                 "is_address": is_address,
             })
@@ -213,6 +250,61 @@ class ProposalsZoom(APIView):
         ### 응답 송신 ###
         return Response(result, status=status.HTTP_200_OK)
 
+# ── GET /proposals/{profile}/{zoom}/viewport : 지도 범위 조회 ───────────────
+@method_decorator(validate_path_choices(profile=ProfileChoices.values), name="dispatch")
+class ProposalsViewport(APIView):
+    """
+    지도 화면의 경계 상자(min/max_latitude, min/max_longitude) 안의 제안을 geohash 칸으로 묶어 반환합니다.
+    - 줌이 클수록 큰 칸으로 묶고, 0m에서는 칸마다 최신 제안을 sample개까지 함께 반환
+    - latitude/longitude 인덱스로 범위를 검색하고, 묶음 집계도 DB에서 수행
+    """
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request: HttpRequest, profile: str, zoom: int):
+        if zoom not in ZoomChoices.values:
+            return Response(
+                {"detail": f"Invalid zoom. Use one of: {ZoomChoices.values}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        bbox = parse_viewport_query(request.query_params)
+        industry = request.query_params.get("industry")
+        precision = MAP_VIEWPORT_ZOOM_PRECISION[zoom]
+
+        try:
+            base = filter_viewport(
+                Proposal.objects.filter(funding__isnull=True).filter_industry_choice(industry),
+                bbox,
+            )
+        except ValueError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        cells = viewport_cells(base, precision)
+        if zoom != ZoomChoices.M0:
+            return Response(cells, status=status.HTTP_200_OK)
+
+        # 0m: 칸마다 최신 제안 sample개
+        sample = parse_sample_size(request.query_params)
+        samples = viewport_sample_ids(base, precision, [cell["geohash"] for cell in cells], sample)
+        ids = [id for cell_ids in samples.values() for id in cell_ids]
+
+        prof = (profile or "").lower()
+        viewer_addr = resolve_viewer_addr(request.user, profile)
+        serializer_class = ProposalZoomFounderItemSerializer if prof == "founder" else ProposalListSerializer
+        qs = (
+            Proposal.objects
+            .filter(id__in=ids)
+            .with_analytics()
+            .with_flags(user=request.user, profile=profile, viewer_addr=viewer_addr)
+            .with_user()
+            .with_has_funding()
+        )
+        items = {obj.id: serializer_class(obj, context={"request": request}).data for obj in qs}
+        for cell in cells:
+            cell["proposals"] = [items[id] for id in samples.get(cell["geohash"], []) if id in items]
+
+        return Response(cells, status=status.HTTP_200_OK)
+
 # ── GET /proposals/{proposal_id}/{profile} : 상세 ────────────────────────
 class ProposalsPk(APIView):
     """
@@ -251,6 +343,7 @@ class ProposalsMyCreated(APIView):
     GET /proposals/proposer/my-created?sido=...&sigungu=...&eupmyundong=...
     - 로그인한 '제안자(Proposer)'가 해당 동에서 작성한 제안글을 최신순으로 반환
     - 목록 카드 요약 필드만: id, created_at("YYYY.MM.DD."), title
+    - 커서 페이지: {"results": [...], "next_cursor": ...} (cursor, page_size 쿼리 파라미터)
     """
     authentication_classes = [JWTAuthentication]
     permission_classes = [IsAuthenticated]
@@ -285,8 +378,9 @@ class ProposalsMyCreated(APIView):
             .only("id", "title", "created_at")
             .order_by("-created_at", "-id")
         )
-        data = ProposalMyCreatedItemSerializer(qs, many=True).data
-        return Response(data, status=status.HTTP_200_OK)
+        page = paginate_keyset(qs, request.query_params)
+        data = ProposalMyCreatedItemSerializer(page.items, many=True).data
+        return Response(page.to_response(data), status=status.HTTP_200_OK)
 
 class ProposerLike(APIView):
     permission_classes = [IsAuthenticated]
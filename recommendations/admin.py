@@ -1,3 +1,5 @@
 from django.contrib import admin
+from .models import FounderRecommendationFeed, FundingSuccessCentroid
 
-# Register your models here.
+admin.site.register(FounderRecommendationFeed)
+admin.site.register(FundingSuccessCentroid)
@@ -0,0 +1,260 @@
+import fcntl
+import os
+import threading
+from contextlib import contextmanager
+import numpy as np
+from django.conf import settings
+from utils.choices import IndustryChoices
+from .similarity import normalize_rows, normalize_vector
+from .vector_store import VECTOR_DIM, ProposalVectorStore, get_proposal_vector_store
+
+PROPOSAL_ANN_INDEX_ENABLED = getattr(settings, 'PROPOSAL_ANN_INDEX_ENABLED', False)
+PROPOSAL_ANN_INDEX_DIR = getattr(
+    settings,
+    'PROPOSAL_ANN_INDEX_DIR',
+    os.path.join(settings.BASE_DIR, 'recommendations', 'ann'),
+)
+PROPOSAL_ANN_MIN_TRAIN_SIZE = getattr(settings, 'PROPOSAL_ANN_MIN_TRAIN_SIZE', 2_000) # 이보다 적으면 전체 탐색
+PROPOSAL_ANN_NPROBE = getattr(settings, 'PROPOSAL_ANN_NPROBE', 8)
+PROPOSAL_ANN_OVERSAMPLE = getattr(settings, 'PROPOSAL_ANN_OVERSAMPLE', 10)
+
+class IVFIndex:
+    """
+    한 업종의 제안 벡터를 k-means 군집(역색인 목록)으로 나눈 IVF 근사 최근접 이웃 색인입니다.
+    검색할 때는 대표 벡터와 가까운 nprobe개 군집의 제안만 후보로 돌려주고, 정확한 유사도 정렬은 벡터 저장소가 합니다.
+    색인은 `index.npz` 파일 하나(스냅샷)에 저장하고 os.replace로 한 번에 바꾸므로, 읽는 쪽은 항상 한 번 저장한 내용을 통째로 읽습니다.
+    - `centroids`: (군집 개수, dim) 정규화된 군집 중심. 학습 전이면 (0, dim)이고 모든 제안이 후보가 됩니다.
+    - `ids`, `lists`: 제안 id와 그 제안이 속한 군집 번호
+    - `trained_size`: 학습 당시 제안 개수
+    제안을 추가/삭제할 때는 가까운 군집에만 반영하고, 학습 당시의 2배 이상으로 커지면 다시 학습합니다.
+    """
+    def __init__(self, directory:str, dim:int=VECTOR_DIM):
+        self.directory = directory
+        self.dim = dim
+        self.snapshot_path = os.path.join(directory, 'index.npz')
+        self.lock_path = os.path.join(directory, '.lock')
+
+        self._lock = threading.Lock()
+        self._version = None
+        self.trained_size = 0
+        self.centroids = np.empty((0, dim), dtype=np.float32)
+        self.ids = np.empty(0, dtype=np.int64)
+        self.lists = np.empty(0, dtype=np.int32)
+
+    def __len__(self):
+        self._reload()
+        return len(self.ids)
+
+    @staticmethod
+    def _file_version(stat:os.stat_result) -> tuple[int, int]:
+        # os.replace로 바꾸면 inode가 바뀌므로, 같은 시각에 저장해도 구분됩니다.
+        return stat.st_ino, stat.st_mtime_ns
+
+    def _reload(self) -> None:
+        """
+        다른 프로세스가 색인을 저장했으면 다시 읽습니다.
+        열어 둔 파일 하나에서 모든 배열을 읽으므로, 읽는 도중에 새 스냅샷으로 바뀌어도 서로 다른 저장본이 섞이지 않습니다.
+        """
+        try:
+            version = self._file_version(os.stat(self.snapshot_path))
+        except FileNotFoundError:
+            return
+        if version == self._version:
+            return
+
+        with self._lock:
+            if version == self._version:
+                return
+            with open(self.snapshot_path, 'rb') as file:
+                version = self._file_version(os.fstat(file.fileno()))
+                with np.load(file) as snapshot:
+                    centroids = snapshot['centroids']
+                    ids = snapshot['ids']
+                    lists = snapshot['lists']
+                    trained_size = int(snapshot['trained_size'])
+            self.centroids, self.ids, self.lists, self.trained_size = centroids, ids, lists, trained_size
+            self._version = version
+
+    @contextmanager
+    def _file_lock(self):
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self.lock_path, 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                self._reload()
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _save(self) -> None:
+        """
+        색인 전체를 임시 파일에 쓴 뒤 os.replace 한 번으로 스냅샷을 바꿉니다. (파일 잠금 안에서 호출)
+        """
+        path = f'{self.snapshot_path}.tmp'
+        with open(path, 'wb') as file:
+            np.savez(
+                file,
+                centroids=self.centroids,
+                ids=self.ids,
+                lists=self.lists,
+                trained_size=np.int64(self.trained_size),
+            )
+        os.replace(path, self.snapshot_path)
+        with self._lock:
+            self._version = self._file_version(os.stat(self.snapshot_path))
+
+    def _assign(self, vectors:np.ndarray) -> np.ndarray:
+        if not len(self.centroids):
+            return np.zeros(len(vectors), dtype=np.int32)
+        return np.argmax(normalize_rows(vectors) @ self.centroids.T, axis=1).astype(np.int32)
+
+    def _train(self, ids:np.ndarray, vectors:np.ndarray) -> None:
+        self.centroids = np.empty((0, self.dim), dtype=np.float32)
+        if len(ids) >= PROPOSAL_ANN_MIN_TRAIN_SIZE:
+            from sklearn.cluster import MiniBatchKMeans
+
+            n_clusters = int(np.sqrt(len(ids)))
+            kmeans = MiniBatchKMeans(
+                n_clusters=n_clusters,
+                batch_size=max(1024, n_clusters * 4),
+                n_init=3,
+                random_state=0,
+            ).fit(normalize_rows(vectors))
+            self.centroids = normalize_rows(kmeans.cluster_centers_)
+        self.ids = ids.astype(np.int64)
+        self.lists = self._assign(vectors)
+        self.trained_size = len(ids)
+
+    def needs_training(self) -> bool:
+        self._reload()
+        size = len(self.ids)
+        if not len(self.centroids):
+            return size >= PROPOSAL_ANN_MIN_TRAIN_SIZE
+        return size >= self.trained_size * 2
+
+    def rebuild(self, ids, vectors:np.ndarray) -> None:
+        """
+        주어진 제안 전체로 군집을 다시 학습합니다.
+        """
+        with self._file_lock():
+            self._train(np.asarray(ids, dtype=np.int64), np.asarray(vectors, dtype=np.float32))
+            self._save()
+
+    def retrain(self, get_vectors) -> bool:
+        """
+        색인이 학습 당시보다 많이 커졌으면 군집을 다시 학습합니다.
+        색인의 id 목록을 읽는 것부터 저장까지 파일 잠금 안에서 하므로, 그 사이에 다른 프로세스가 추가한 제안을 덮어쓰지 않습니다.
+        Args:
+            get_vectors: 제안 id 목록을 받아 (벡터가 있는 id 목록, 벡터 배열)을 반환하는 함수
+        Returns:
+            retrained (bool): 다시 학습했는지 여부
+        """
+        with self._file_lock():
+            if not self.needs_training():
+                return False
+            ids, vectors = get_vectors(self.ids.tolist())
+            self._train(np.asarray(ids, dtype=np.int64), np.asarray(vectors, dtype=np.float32))
+            self._save()
+            return True
+
+    def add(self, ids, vectors:np.ndarray) -> int:
+        """
+        제안을 가장 가까운 군집에 추가합니다. 이미 있는 id는 건너뜁니다.
+        """
+        with self._file_lock():
+            ids = np.asarray(ids, dtype=np.int64)
+            new = ~np.isin(ids, self.ids)
+            if not new.any():
+                return 0
+            self.ids = np.concatenate([self.ids, ids[new]])
+            self.lists = np.concatenate([self.lists, self._assign(np.asarray(vectors, dtype=np.float32)[new])])
+            self._save()
+            return int(new.sum())
+
+    def remove(self, ids) -> int:
+        """
+        제안을 색인에서 제외합니다. (펀딩이 생긴 제안 등)
+        """
+        with self._file_lock():
+            keep = ~np.isin(self.ids, np.asarray(list(ids), dtype=np.int64))
+            removed = len(self.ids) - int(keep.sum())
+            if removed:
+                self.ids = self.ids[keep]
+                self.lists = self.lists[keep]
+                self._save()
+            return removed
+
+    def candidates(self, source_vector, nprobe:int=PROPOSAL_ANN_NPROBE) -> np.ndarray:
+        """
+        대표 벡터와 가장 가까운 nprobe개 군집에 속한 제안 id를 반환합니다.
+        """
+        self._reload()
+        with self._lock:
+            centroids, ids, lists = self.centroids, self.ids, self.lists
+        if len(centroids) <= nprobe:
+            return ids
+        scores = centroids @ normalize_vector(source_vector)
+        probe = np.argpartition(-scores, nprobe - 1)[:nprobe]
+        return ids[np.isin(lists, probe)]
+
+class ProposalAnnIndex:
+    """
+    업종(IndustryChoices)별 IVF 색인 묶음입니다. 추천 후보가 이미 사용자의 업종으로 걸러지므로 업종마다 따로 색인합니다.
+    펀딩이 없는 제안만 색인하고, 색인 결과는 검색 후 DB 조건으로 한 번 더 확인합니다.
+    """
+    def __init__(self, directory:str=PROPOSAL_ANN_INDEX_DIR, store:ProposalVectorStore|None=None):
+        self.store = store or get_proposal_vector_store()
+        self.indexes = {
+            industry: IVFIndex(os.path.join(directory, industry), dim=self.store.dim)
+            for industry in IndustryChoices.values
+        }
+
+    def add(self, industry:str, ids) -> int:
+        """
+        벡터 저장소에 유효한 벡터가 있는 제안을 업종 색인에 추가합니다. 다시 학습은 sync에서 합니다.
+        """
+        found_ids, vectors = self.store.get_vectors(ids)
+        if not found_ids:
+            return 0
+        return self.indexes[industry].add(found_ids, vectors)
+
+    def remove(self, industry:str, ids) -> int:
+        return self.indexes[industry].remove(ids)
+
+    def sync(self, industry:str, ids) -> tuple[int, int]:
+        """
+        업종 색인을 주어진 제안 id 목록(펀딩이 없는 제안 전체)과 맞추고, 많이 커졌으면 다시 학습합니다.
+        Returns:
+            (added, removed)
+        """
+        index = self.indexes[industry]
+        index._reload()
+        ids = np.asarray(list(ids), dtype=np.int64)
+        removed = index.remove(np.setdiff1d(index.ids, ids))
+        added = self.add(industry, np.setdiff1d(ids, index.ids).tolist())
+        index.retrain(self.store.get_vectors)
+        return added, removed
+
+    def search(self, source_vector, industries, exclude_ids=(), top_k:int=3) -> list[int]:
+        """
+        업종 색인에서 후보를 좁힌 뒤 벡터 저장소로 정확한 유사도 상위 (top_k * oversample)개 id를 반환합니다.
+        """
+        candidates = [self.indexes[industry].candidates(source_vector) for industry in industries if industry in self.indexes]
+        if not candidates:
+            return list()
+        ids = np.setdiff1d(np.concatenate(candidates), np.asarray(list(exclude_ids), dtype=np.int64))
+        return self.store.find_top_similar(source_vector, ids.tolist(), top_k=top_k * PROPOSAL_ANN_OVERSAMPLE)
+
+_proposal_ann_index = None
+_proposal_ann_index_lock = threading.Lock()
+
+def get_proposal_ann_index() -> ProposalAnnIndex:
+    """
+    프로세스마다 하나의 업종별 제안 색인을 반환합니다.
+    """
+    global _proposal_ann_index
+    if _proposal_ann_index is None:
+        with _proposal_ann_index_lock:
+            if _proposal_ann_index is None:
+                _proposal_ann_index = ProposalAnnIndex()
+    return _proposal_ann_index
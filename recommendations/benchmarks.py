@@ -0,0 +1,265 @@
+"""
+추천 엔진 성능 측정용 함수 모음입니다.
+Examples:
+    python manage.py shell -c "from recommendations.benchmarks import benchmark_find_top_similar; benchmark_find_top_similar()"
+"""
+import heapq
+import time
+from types import SimpleNamespace
+import numpy as np
+from sklearn.metrics.pairwise import cosine_similarity
+from .similarity import rank_items
+
+def _find_top_similar_heap(source_vector, items_and_vectors:list[tuple], top_k:int=3):
+    """
+    후보마다 cosine_similarity를 호출하고 힙으로 상위 k개를 고르는 기존 구현입니다. (비교 기준)
+    """
+    min_heap = list()
+
+    for item, vector in items_and_vectors:
+        similarity = cosine_similarity(
+            source_vector.reshape(1, -1),
+            vector.reshape(1, -1),
+        )[0][0]
+
+        if len(min_heap) < top_k:
+            heapq.heappush(min_heap, (similarity, item.id, item))
+        elif similarity > min_heap[0][0]:
+            heapq.heapreplace(min_heap, (similarity, item.id, item))
+
+    return [item.id for score, item_id, item in sorted(min_heap, key=lambda x: x[0], reverse=True)]
+
+def _elapsed(func, repeat:int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def benchmark_find_top_similar(sizes=(1_000, 10_000, 100_000), dim:int=300, top_k:int=3, repeat:int=3, seed:int=0) -> list[dict]:
+    """
+    기존 힙 방식과 행렬 방식의 유사도 상위 k개 계산 시간을 비교합니다.
+    Args:
+        sizes: 후보 개수 목록
+        dim: 벡터 차원 (fastText 기본값 300)
+        top_k: 상위 몇 개를 고를지
+        repeat: 반복 측정 횟수 (가장 빠른 값을 사용)
+    Returns:
+        result (list[dict]): 후보 개수별 소요 시간(초)과 결과 일치 여부
+    """
+    rng = np.random.default_rng(seed)
+    result = list()
+
+    for size in sizes:
+        source_vector = rng.standard_normal(dim).astype(np.float32)
+        items_and_vectors = [
+            (SimpleNamespace(id=index), vector)
+            for index, vector in enumerate(rng.standard_normal((size, dim)).astype(np.float32))
+        ]
+
+        heap_ids = _find_top_similar_heap(source_vector, items_and_vectors, top_k)
+        batch_ids = rank_items(source_vector, items_and_vectors, top_k)
+
+        heap_seconds = _elapsed(lambda: _find_top_similar_heap(source_vector, items_and_vectors, top_k), repeat)
+        batch_seconds = _elapsed(lambda: rank_items(source_vector, items_and_vectors, top_k), repeat)
+
+        row = {
+            'size': size,
+            'heap_seconds': heap_seconds,
+            'batch_seconds': batch_seconds,
+            'speedup': heap_seconds / batch_seconds if batch_seconds else None,
+            'same_ids': heap_ids == batch_ids,
+        }
+        print(
+            f"n={size:>7}: heap={heap_seconds*1000:9.2f}ms "
+            f"batch={batch_seconds*1000:7.2f}ms "
+            f"x{row['speedup']:.1f} same_ids={row['same_ids']}"
+        )
+        result.append(row)
+
+    return result
+
+def _read_rss_kb() -> dict:
+    rss = dict()
+    with open('/proc/self/status') as file:
+        for line in file:
+            key, _, value = line.partition(':')
+            if key in ('VmRSS', 'RssAnon', 'RssFile'):
+                rss[key] = int(value.split()[0])
+    return rss
+
+def _measure_fasttext_model_load(mode:str, path:str, words:list[str]) -> dict:
+    before = _read_rss_kb()
+    start = time.perf_counter()
+    if mode == 'mmap':
+        from .word_vectors import MmapFastTextModel
+        model = MmapFastTextModel(path)
+    else:
+        import fasttext
+        model = fasttext.load_model(path)
+    load_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for word in words:
+        model.get_word_vector(word)
+    lookup_seconds = time.perf_counter() - start
+
+    after = _read_rss_kb()
+    return {
+        'mode': mode,
+        'load_seconds': load_seconds,
+        'lookup_seconds': lookup_seconds,
+        'private_rss_mb': (after.get('RssAnon', 0) - before.get('RssAnon', 0)) / 1024,
+        'shared_rss_mb': (after.get('RssFile', 0) - before.get('RssFile', 0)) / 1024,
+    }
+
+def benchmark_fasttext_model_load(model_path:str|None=None, mmap_dir:str|None=None, words:list[str]|None=None) -> list[dict]:
+    """
+    fastText .bin 모델 전체 로드와 메모리 맵 로드의 로드 시간, 단어 조회 시간, 워커당 RSS를 비교합니다.
+    각 방식은 새 프로세스에서 측정합니다. (Linux /proc 기준)
+    - private_rss_mb: 워커마다 따로 차지하는 메모리(RssAnon)
+    - shared_rss_mb: 워커끼리 공유되는 파일 페이지(RssFile)
+    """
+    import multiprocessing
+    from .word_vectors import FASTTEXT_MODEL_PATH, FASTTEXT_MMAP_DIR
+
+    words = words or ['카페', '디저트', '반려동물', '동네', '헬스장', '떡볶이', '주차장', '없는단어']
+    targets = [('bin', model_path or FASTTEXT_MODEL_PATH), ('mmap', mmap_dir or FASTTEXT_MMAP_DIR)]
+
+    result = list()
+    context = multiprocessing.get_context('spawn')
+    for mode, path in targets:
+        with context.Pool(1) as pool:
+            row = pool.apply(_measure_fasttext_model_load, (mode, path, words))
+        print(
+            f"{row['mode']:>4}: load={row['load_seconds']*1000:9.1f}ms "
+            f"lookup={row['lookup_seconds']*1000:7.2f}ms "
+            f"private_rss={row['private_rss_mb']:8.1f}MB shared_rss={row['shared_rss_mb']:8.1f}MB"
+        )
+        result.append(row)
+    return result
+
+_SAMPLE_SENTENCES = [
+    '동네에 조용히 공부할 수 있는 스터디 카페가 생기면 좋겠어요.',
+    '아이와 함께 갈 수 있는 키즈 카페와 놀이 공간이 부족해요!',
+    '반려동물 동반이 가능한 식당이나 애견 카페가 필요합니다.',
+    '퇴근 후 늦게까지 운영하는 헬스장, 필라테스 센터를 원해요.',
+    '건강한 샐러드와 비건 메뉴를 파는 가게가 근처에 없어요.',
+    '주말 아침에 브런치를 먹을 수 있는 베이커리가 있으면 좋겠습니다.',
+    '시장 근처에 주차장이 있는 떡볶이 분식집을 제안합니다 :)',
+    '어르신들이 편하게 이용할 수 있는 동네 사랑방 같은 공간이 필요해요.',
+]
+
+def _sample_texts(size:int, seed:int) -> list[str]:
+    rng = np.random.default_rng(seed)
+    return [
+        ' '.join(rng.choice(_SAMPLE_SENTENCES, size=rng.integers(2, 6)))
+        for _ in range(size)
+    ]
+
+def benchmark_vectorize_many(texts:list[str]|None=None, sizes=(100, 1_000), repeat:int=3, seed:int=0) -> list[dict]:
+    """
+    텍스트마다 AI.vectorize를 호출하는 방식과 AI.vectorize_many로 한 번에 처리하는 방식의 처리량(docs/sec)을 비교합니다.
+    texts가 없으면 예시 문장을 섞어 sizes 개수만큼 만들고, 있으면 그 텍스트들로 한 번 측정합니다.
+    """
+    from .services import AI, get_kiwi
+    from .word_vectors import get_fasttext_model
+
+    fasttext_model = get_fasttext_model()
+    if not fasttext_model:
+        raise RuntimeError('AI 모델을 불러오지 못했어요.')
+    ai = AI(fasttext_model)
+    get_kiwi().tokenize('')  # Kiwi 초기화 시간은 측정에서 제외
+
+    text_sets = [texts] if texts else [_sample_texts(size, seed) for size in sizes]
+    result = list()
+    for docs in text_sets:
+        single_vectors = [ai.vectorize(text) for text in docs]
+        batch_vectors = ai.vectorize_many(docs)
+        same_vectors = all(
+            np.allclose(batch_vector, 0 if single_vector is None else single_vector, atol=1e-5)
+            for single_vector, batch_vector in zip(single_vectors, batch_vectors)
+        )
+
+        single_seconds = _elapsed(lambda: [ai.vectorize(text) for text in docs], repeat)
+        batch_seconds = _elapsed(lambda: ai.vectorize_many(docs), repeat)
+
+        row = {
+            'size': len(docs),
+            'single_docs_per_sec': len(docs) / single_seconds,
+            'batch_docs_per_sec': len(docs) / batch_seconds,
+            'speedup': single_seconds / batch_seconds if batch_seconds else None,
+            'same_vectors': same_vectors,
+        }
+        print(
+            f"n={row['size']:>6}: single={row['single_docs_per_sec']:9.1f} docs/sec "
+            f"batch={row['batch_docs_per_sec']:9.1f} docs/sec "
+            f"x{row['speedup']:.1f} same_vectors={row['same_vectors']}"
+        )
+        result.append(row)
+    return result
+
+def _clustered_vectors(rng, size:int, dim:int, n_topics:int) -> np.ndarray:
+    """
+    실제 제안처럼 주제별로 모인 벡터를 만듭니다. (균일 난수는 군집 구조가 없어 IVF 측정에 맞지 않음)
+    """
+    topics = rng.standard_normal((n_topics, dim)).astype(np.float32)
+    labels = rng.integers(0, n_topics, size=size)
+    return topics[labels] + 0.6 * rng.standard_normal((size, dim)).astype(np.float32)
+
+def benchmark_ann_index(sizes=(10_000, 100_000), dim:int=300, top_k:int=3, queries:int=100, nprobe_list=(4, 8, 16), seed:int=0) -> list[dict]:
+    """
+    한 업종 IVF 색인 검색과 벡터 저장소 전체 정확 검색의 recall@k와 질의당 평균 지연 시간을 비교합니다.
+    임시 디렉토리에 저장소와 색인을 만들어 측정하므로 실제 데이터에는 영향을 주지 않습니다.
+    """
+    import tempfile
+    from .ann_index import IVFIndex
+    from .vector_store import ProposalVectorStore
+
+    rng = np.random.default_rng(seed)
+    result = list()
+
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            vectors = _clustered_vectors(rng, size, dim, n_topics=max(10, size // 500))
+            ids = list(range(1, size + 1))
+            store = ProposalVectorStore(f'{directory}/vectors', dim=dim)
+            store.append(list(zip(ids, vectors)))
+
+            index = IVFIndex(f'{directory}/ann', dim=dim)
+            start = time.perf_counter()
+            index.rebuild(ids, vectors)
+            build_seconds = time.perf_counter() - start
+
+            query_vectors = vectors[rng.integers(0, size, size=queries)] + 0.3 * rng.standard_normal((queries, dim)).astype(np.float32)
+
+            start = time.perf_counter()
+            exact = [store.find_top_similar(query, ids, top_k) for query in query_vectors]
+            exact_ms = (time.perf_counter() - start) / queries * 1000
+
+            for nprobe in nprobe_list:
+                start = time.perf_counter()
+                approx = [
+                    store.find_top_similar(query, index.candidates(query, nprobe).tolist(), top_k)
+                    for query in query_vectors
+                ]
+                ann_ms = (time.perf_counter() - start) / queries * 1000
+                recall = np.mean([len(set(a) & set(e)) / top_k for a, e in zip(approx, exact)])
+
+                row = {
+                    'size': size,
+                    'n_lists': len(index.centroids),
+                    'nprobe': nprobe,
+                    'build_seconds': build_seconds,
+                    'exact_ms': exact_ms,
+                    'ann_ms': ann_ms,
+                    f'recall@{top_k}': float(recall),
+                }
+                print(
+                    f"n={size:>7} lists={row['n_lists']:>4} nprobe={nprobe:>3}: "
+                    f"exact={exact_ms:7.2f}ms ann={ann_ms:7.2f}ms "
+                    f"recall@{top_k}={recall:.3f} build={build_seconds:.1f}s"
+                )
+                result.append(row)
+    return result
@@ -0,0 +1,45 @@
+from __future__ import annotations
+import logging
+logger = logging.getLogger("recommendations.crons")
+from recommendations.ann_index import PROPOSAL_ANN_INDEX_ENABLED
+from recommendations.management.embed_proposals import embed_proposals
+from recommendations.management.sync_proposal_ann_index import sync_proposal_ann_index
+from recommendations.management.refresh_recommendation_feeds import refresh_recommendation_feeds
+
+def embed_proposals_job() -> None:
+    """
+    - 벡터가 없는 제안의 벡터를 계산하여 벡터 저장소와 캐시에 저장합니다.
+    """
+    logger.info("embed_proposals_job: 시작")
+    result = embed_proposals(verbose=False)
+    logger.info(
+        "embed_proposals_job: 완료 - "
+        f"pending={result.pending}, embedded={result.embedded}, "
+        f"empty={result.empty}, failed={result.failed}"
+    )
+
+def sync_proposal_ann_index_job() -> None:
+    """
+    - 새로 벡터가 생긴 제안을 업종별 색인에 추가하고, 펀딩이 생긴 제안을 색인에서 제외합니다.
+    """
+    if not PROPOSAL_ANN_INDEX_ENABLED:
+        return
+    logger.info("sync_proposal_ann_index_job: 시작")
+    result = sync_proposal_ann_index(verbose=False)
+    logger.info(
+        "sync_proposal_ann_index_job: 완료 - "
+        f"added={sum(added for added, _ in result.values())}, "
+        f"removed={sum(removed for _, removed in result.values())}"
+    )
+
+def refresh_recommendation_feeds_job() -> None:
+    """
+    - 스크랩, 제안 생성, 펀딩으로 무효화된 창업자 추천 피드를 다시 계산합니다.
+    """
+    logger.info("refresh_recommendation_feeds_job: 시작")
+    result = refresh_recommendation_feeds(verbose=False)
+    logger.info(
+        "refresh_recommendation_feeds_job: 완료 - "
+        f"invalidated={result.invalidated}, refreshed={result.refreshed}, "
+        f"skipped={result.skipped}, remaining={result.remaining}"
+    )
@@ -0,0 +1,40 @@
+from __future__ import annotations
+import logging
+from recommendations.services import (
+    ProposalEmbeddingService,
+    PROPOSAL_EMBEDDING_CHUNK_SIZE,
+    PROPOSAL_EMBEDDING_WORKERS,
+)
+
+logger = logging.getLogger("recommendations.crons")
+
+def embed_proposals(chunk_size: int | None = None, workers: int | None = None, verbose: bool = True):
+    """
+    벡터 저장소에 벡터가 없는 제안의 벡터를 미리 계산합니다.
+    추천 요청에서는 후보 제안의 벡터를 계산하지 않으므로, 배포 직후나 제안이 몰린 뒤 바로 실행할 수 있어요.
+
+    Args:
+        chunk_size: 워커 하나에 넘길 제안 개수(없으면 settings.PROPOSAL_EMBEDDING_CHUNK_SIZE)
+        workers: 프로세스 풀 크기(없으면 settings.PROPOSAL_EMBEDDING_WORKERS)
+        verbose: True면 요약 로그를 print
+
+    Returns:
+        ProposalEmbeddingResult  (pending/embedded/empty/chunks/failed 필드 포함)
+    """
+    svc = ProposalEmbeddingService(
+        chunk_size=chunk_size or PROPOSAL_EMBEDDING_CHUNK_SIZE,
+        workers=workers or PROPOSAL_EMBEDDING_WORKERS,
+    )
+    result = svc.run()
+
+    logger.info(
+        "embedded: pending=%s, embedded=%s, empty=%s, chunks=%s, failed=%s",
+        result.pending, result.embedded, result.empty, result.chunks, result.failed
+    )
+
+    if verbose:
+        print(
+            f"embedded: {result.embedded}/{result.pending} "
+            f"(empty={result.empty}, chunks={result.chunks}, failed={result.failed})"
+        )
+    return result
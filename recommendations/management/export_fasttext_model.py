@@ -0,0 +1,44 @@
+from __future__ import annotations
+import logging
+import os
+from recommendations.word_vectors import (
+    FASTTEXT_MODEL_PATH,
+    FASTTEXT_MMAP_DIR,
+    MmapFastTextModel,
+    download_fasttext_model,
+)
+
+logger = logging.getLogger("recommendations.crons")
+
+def export_fasttext_model(model_path: str | None = None, output_dir: str | None = None, verbose: bool = True) -> str | None:
+    """
+    fastText .bin 모델을 워커들이 메모리 맵으로 공유할 수 있는 파일들로 내보냅니다.
+    배포 시 한 번 실행하면 되고, 모델 파일이 없으면 먼저 다운로드합니다. (약 7GB)
+
+    Args:
+        model_path: .bin 모델 경로(없으면 settings.FASTTEXT_MODEL_PATH)
+        output_dir: 내보낼 디렉토리(없으면 settings.FASTTEXT_MMAP_DIR)
+        verbose: True면 진행 상황을 print
+
+    Returns:
+        내보낸 디렉토리 경로, 실패하면 None
+    """
+    import fasttext
+
+    model_path = model_path or FASTTEXT_MODEL_PATH
+    output_dir = output_dir or FASTTEXT_MMAP_DIR
+
+    if not os.path.exists(model_path):
+        model_path = download_fasttext_model('ko')
+        if not model_path:
+            return None
+
+    if verbose:
+        print(f"{model_path} → {output_dir} 내보내는 중...")
+    model = fasttext.load_model(model_path)
+    MmapFastTextModel.export(model, output_dir)
+
+    logger.info("exported fasttext model: %s -> %s", model_path, output_dir)
+    if verbose:
+        print("내보내기 완료")
+    return output_dir
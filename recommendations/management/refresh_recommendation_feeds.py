@@ -0,0 +1,33 @@
+from __future__ import annotations
+import logging
+from recommendations.services import (
+    refresh_recommendation_feeds as refresh_feeds,
+    RECOMMENDATION_FEED_REFRESH_LIMIT,
+)
+
+logger = logging.getLogger("recommendations.crons")
+
+def refresh_recommendation_feeds(limit: int | None = None, verbose: bool = True):
+    """
+    무효화된 창업자 추천 피드를 다시 계산합니다.
+
+    Args:
+        limit: 한 번에 다시 계산할 최대 피드 개수(없으면 settings.RECOMMENDATION_FEED_REFRESH_LIMIT)
+        verbose: True면 요약 로그를 print
+
+    Returns:
+        RecommendationFeedRefreshResult  (invalidated/refreshed/skipped/remaining 필드 포함)
+    """
+    result = refresh_feeds(limit=limit or RECOMMENDATION_FEED_REFRESH_LIMIT)
+
+    logger.info(
+        "refreshed feeds: invalidated=%s, refreshed=%s, skipped=%s, remaining=%s",
+        result.invalidated, result.refreshed, result.skipped, result.remaining
+    )
+
+    if verbose:
+        print(
+            f"refreshed: {result.refreshed} "
+            f"(invalidated={result.invalidated}, skipped={result.skipped}, remaining={result.remaining})"
+        )
+    return result
@@ -0,0 +1,29 @@
+from __future__ import annotations
+import logging
+from recommendations.services import sync_proposal_ann_index as sync_index
+
+logger = logging.getLogger("recommendations.crons")
+
+def sync_proposal_ann_index(verbose: bool = True) -> dict[str, tuple[int, int]]:
+    """
+    업종별 근사 최근접 이웃 색인을 펀딩이 없는 제안 목록과 맞춥니다.
+    settings.PROPOSAL_ANN_INDEX_ENABLED를 켜기 전에 한 번 실행하여 색인을 만들어 두세요.
+
+    Args:
+        verbose: True면 요약 로그를 print
+
+    Returns:
+        업종별 (추가한 개수, 제외한 개수)
+    """
+    result = sync_index()
+    added = sum(added for added, _ in result.values())
+    removed = sum(removed for _, removed in result.values())
+
+    logger.info("synced proposal ann index: added=%s, removed=%s", added, removed)
+
+    if verbose:
+        for industry, (industry_added, industry_removed) in result.items():
+            if industry_added or industry_removed:
+                print(f"{industry}: added={industry_added}, removed={industry_removed}")
+        print(f"synced: added={added}, removed={removed}")
+    return result
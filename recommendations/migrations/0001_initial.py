@@ -0,0 +1,30 @@
+# Generated by Django 5.2.4 on 2026-10-18 06:01
+
+import django.contrib.postgres.fields
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FounderRecommendationFeed',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('proposal_ids', django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), blank=True, default=list, help_text='스크랩 유사도 내림차순 추천 제안 id', size=None)),
+                ('is_stale', models.BooleanField(default=False, help_text='스크랩, 제안 생성, 펀딩으로 다시 계산이 필요한지 여부')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('founder', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='recommendation_feed', to='accounts.founder')),
+            ],
+            options={
+                'indexes': [models.Index(condition=models.Q(('is_stale', True)), fields=['updated_at'], name='feed_stale_updated_at_idx')],
+            },
+        ),
+    ]
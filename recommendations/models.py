@@ -1,3 +1,59 @@
+from django.contrib.postgres.fields import ArrayField
 from django.db import models
+from utils.choices import IndustryChoices
 
-# Create your models here.
+class FounderRecommendationFeed(models.Model):
+    founder = models.OneToOneField(
+        "accounts.Founder",
+        on_delete=models.CASCADE,
+        related_name="recommendation_feed",
+    )
+    proposal_ids = ArrayField(
+        base_field=models.BigIntegerField(),
+        default=list,
+        blank=True,
+        help_text='스크랩 유사도 내림차순 추천 제안 id',
+    )
+    is_stale = models.BooleanField(
+        default=False,
+        help_text='스크랩, 제안 생성, 펀딩으로 다시 계산이 필요한지 여부',
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["updated_at"],
+                condition=models.Q(is_stale=True),
+                name="feed_stale_updated_at_idx",
+            )
+        ]
+
+    def __str__(self):
+        return f'{self.founder.user.email} 님의 추천 제안'
+
+class FundingSuccessCentroid(models.Model):
+    industry = models.CharField(
+        max_length=24,
+        choices=IndustryChoices.choices,
+        null=True,
+        blank=True,
+        unique=True,
+        help_text='업종 (null이면 전체 업종)',
+    )
+    vector = models.JSONField(
+        default=list,
+        help_text='성공한 펀딩 제안 벡터들의 정규화된 평균 (dim 길이의 실수 목록)',
+    )
+    proposal_count = models.PositiveIntegerField(
+        default=0,
+        help_text='평균에 사용한 제안 수',
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+    )
+
+    def __str__(self):
+        return f'{self.get_industry_display() or "전체"} 펀딩 성공 중심 벡터'
@@ -1,25 +1,46 @@
+import logging
+import multiprocessing
 import os
-from typing import Literal
-import heapq
 import re
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
 import numpy as np
 from django.conf import settings
 from django.core.cache import cache
+from django.contrib.postgres.expressions import ArraySubquery
+from django.db import connections, transaction
 from django.db.models import Q, Case, When, Value
 from django.http import HttpRequest
+from django.utils import timezone
 from rest_framework.exceptions import ValidationError, NotFound, APIException
 from kiwipiepy import Kiwi
-import fasttext
-import fasttext.util
-from sklearn.metrics.pairwise import cosine_similarity
-from utils.choices import ProfileChoices
+from utils.choices import ProfileChoices, IndustryChoices, FundingStatusChoices
 from utils.constants import CacheKey
 from utils.decorators import require_profile
-from proposals.models import Proposal
+from accounts.models import ProposerLevel
+from proposals.models import Proposal, ProposerLikeProposal
 from proposals.serializers import ProposalListSerializer
-
-kiwi = Kiwi()
-korean_stopwords = [
+from .models import FounderRecommendationFeed, FundingSuccessCentroid
+from .ann_index import PROPOSAL_ANN_INDEX_ENABLED, get_proposal_ann_index
+from .similarity import rank_items, normalize_rows, normalize_vector
+from .vector_store import get_proposal_vector_store
+from .word_vectors import get_fasttext_model
+
+logger = logging.getLogger(__name__)
+
+PROPOSAL_VECTOR_CACHE_TIMEOUT = 365*24*60*60*1 # 수정 불가능하여 데이터가 변경되는 경우가 없으므로 1년 캐싱
+PROPOSAL_EMBEDDING_WORKERS = getattr(settings, 'PROPOSAL_EMBEDDING_WORKERS', min(4, os.cpu_count() or 1))
+PROPOSAL_EMBEDDING_CHUNK_SIZE = getattr(settings, 'PROPOSAL_EMBEDDING_CHUNK_SIZE', 200)
+RECOMMENDATION_FEED_REFRESH_LIMIT = getattr(settings, 'RECOMMENDATION_FEED_REFRESH_LIMIT', 200)
+RECOMMENDATION_CALC_WEIGHTS = getattr(settings, 'RECOMMENDATION_CALC_WEIGHTS', {
+    'level': 0.4,
+    'local_likes': 0.4,
+    'business_hours': 0.2,
+})
+KIWI_NUM_WORKERS = getattr(settings, 'KIWI_NUM_WORKERS', -1) # -1이면 가용한 모든 코어 사용
+
+korean_stopwords = frozenset([
     # 의미 없는 의존명사 및 단위
     '것', '수', '때', '곳', '점', '바', '위', '아래', '중', '등', '등등', '전', '후', 
     '내', '외', '말', '개', '분', '개인', '가지', '분', '건', '일', '이',
@@ -33,67 +54,55 @@ korean_stopwords = [
     # 기타 자주 사용되는 불용어
     '나', '저', '저희', '우리', '자신', '누구', '무엇', '어디', '언제', '어떻게', '왜', 
     '하나', '둘', '셋', '넷', '다섯'
-]
-
-def download_fasttext_model(lang='ko'):
-    """
-    FastText 사전훈련 모델을 다운로드합니다.
-    """
-    try:
-        # 모델 저장 경로 설정
-        model_dir = os.path.join(settings.BASE_DIR, 'recommendations')
-        os.makedirs(model_dir, exist_ok=True)
+])
 
-        # 현재 작업 디렉토리를 모델 디렉토리로 변경
-        original_dir = os.getcwd()
-        os.chdir(model_dir)
+non_korean_pattern = re.compile(r'[^가-힣\s]')
 
-        # 모델 다운로드 (약 7GB for Korean)
-        print(f"{lang} 모델 다운로드 중...")
-        fasttext.util.download_model(lang, if_exists='ignore')
+_kiwi = None
+_kiwi_lock = threading.Lock()
 
-        # 원래 디렉토리로 복원
-        os.chdir(original_dir)
-
-        # 모델 파일 경로 반환
-        model_path = os.path.join(model_dir, f'cc.{lang}.300.bin')
-        return model_path
-
-    except Exception as e:
-        print(f"모델 다운로드 실패: {e}")
-        os.chdir(original_dir)  # 오류 시에도 디렉토리 복원
-        return None
-
-try:
-    model_path = os.path.join(settings.BASE_DIR, 'recommendations', 'cc.ko.300.bin')
-    if not os.path.exists(model_path):
-        model_path = download_fasttext_model('ko')
-    fasttext_model = fasttext.load_model(model_path)
-except Exception as e:
-    print(f"모델 로드 실패: {e}")
-    fasttext_model = None
+def get_kiwi() -> Kiwi:
+    """
+    Kiwi 형태소 분석기를 처음 사용할 때 한 번만 불러옵니다.
+    """
+    global _kiwi
+    if _kiwi is None:
+        with _kiwi_lock:
+            if _kiwi is None:
+                _kiwi = Kiwi(num_workers=KIWI_NUM_WORKERS)
+    return _kiwi
 
 class AI:
     def __init__(self, model):
         self.model = model
 
+    def _filter_tokens(self, tokens) -> list[str]:
+        """
+        명사이면서 두 글자 이상이고 불용어가 아닌 토큰만 남깁니다.
+        """
+        return [
+            token.form
+            for token in tokens
+            if (token.tag.startswith('N')
+                and len(token.form) > 1
+                and token.form not in korean_stopwords)
+        ]
+
     def _preprocess_and_tokenize(self, text:str):
         """
         한국어 텍스트를 전처리하고 명사만 추출하여 토큰화합니다.
         """
         # 한글과 띄어쓰기 외 모든 문자 제거
-        text = re.sub(r'[^가-힣\s]', '', text)
-        # 명사 추출
-        tokens = kiwi.tokenize(text)
-        # 불용어 제거
-        filtered_tokens = list()
-        for token in tokens:
-            if ((token.tag.startswith('N'))
-                and (len(token.form) > 1)
-                and (token.form not in korean_stopwords)):
-                filtered_tokens.append(token.form)
-
-        return filtered_tokens
+        text = non_korean_pattern.sub('', text)
+        # 명사 추출 후 불용어 제거
+        return self._filter_tokens(get_kiwi().tokenize(text))
+
+    def _preprocess_and_tokenize_many(self, texts:list[str]) -> list[list[str]]:
+        """
+        여러 텍스트를 한 번에 전처리하고, Kiwi의 멀티스레드 분석으로 한 번에 토큰화합니다.
+        """
+        cleaned_texts = [non_korean_pattern.sub('', text) for text in texts]
+        return [self._filter_tokens(tokens) for tokens in get_kiwi().tokenize(cleaned_texts)]
 
     def vectorize(self, text:str):
         """
@@ -109,101 +118,232 @@ class AI:
         # 단어 벡터들의 평균을 게시물 벡터로 사용
         return np.mean(vectors, axis=0)
 
-    def find_top_similar(self, source_vector, items_and_vectors:list[tuple], top_k:int=3):
-        min_heap = list()
-
-        for item, vector in items_and_vectors:
-            similarity = cosine_similarity(
-                source_vector.reshape(1, -1),
-                vector.reshape(1, -1),
-            )[0][0]
+    def vectorize_many(self, texts:list[str]) -> np.ndarray:
+        """
+        여러 내용을 한 번에 FastText 벡터로 변환하여 (텍스트 개수, dim) float32 행렬로 반환합니다.
+        묶음 안에서 중복된 단어는 한 번만 조회하고, 분석할 단어가 없는 텍스트는 0 벡터 행이 됩니다.
+        """
+        dim = self.model.get_dimension()
+        if not texts:
+            return np.empty((0, dim), dtype=np.float32)
+
+        tokens_list = self._preprocess_and_tokenize_many(texts)
+
+        word_ids = dict()
+        rows, lengths = list(), list()
+        for tokens in tokens_list:
+            rows.extend(word_ids.setdefault(word, len(word_ids)) for word in tokens)
+            lengths.append(len(tokens))
+
+        result = np.zeros((len(texts), dim), dtype=np.float32)
+        if not rows:
+            return result
+
+        word_vectors = np.empty((len(word_ids), dim), dtype=np.float32)
+        for word, index in word_ids.items():
+            word_vectors[index] = self.model.get_word_vector(word)
+
+        # 텍스트별 단어 벡터 구간을 한 번에 합산하여 평균을 구합니다.
+        lengths = np.asarray(lengths)
+        non_empty = lengths > 0
+        offsets = np.concatenate([[0], np.cumsum(lengths)[:-1]])[non_empty]
+        sums = np.add.reduceat(word_vectors[np.asarray(rows)], offsets, axis=0)
+        result[non_empty] = sums / lengths[non_empty, None]
+        return result
 
-            if len(min_heap) < top_k:
-                heapq.heappush(min_heap, (similarity, item))
-            elif similarity > min_heap[0][0]:
-                heapq.heapreplace(min_heap, (similarity, item))
+    def find_top_similar(self, source_vector, items_and_vectors:list[tuple], top_k:int=3):
+        """
+        대표 벡터와 코사인 유사도가 가장 높은 상위 k개 항목의 id를 유사도 내림차순으로 반환합니다.
+        """
+        return rank_items(source_vector, items_and_vectors, top_k)
 
-        return [item.id for score, item in sorted(min_heap, reverse=True)]
+@dataclass
+class VectorResolveResult:
+    store_hits: int = 0  # 벡터 저장소에 있던 게시물 수
+    cache_hits: int = 0  # 캐시에서 가져온 게시물 수
+    misses: int = 0      # 새로 벡터를 계산한 게시물 수
+    skipped: int = 0     # 계산하지 않고 건너뛴 게시물 수
 
 class RecommendationScrapService:
-    def __init__(self, request:HttpRequest):
+    def __init__(self, request:HttpRequest|None=None):
         self.request = request
+        self.store = get_proposal_vector_store()
+        self._ai = None
+
+    @property
+    def ai(self) -> AI:
+        # 저장된 추천 피드를 응답할 때는 모델이 필요 없으므로, 계산할 때 처음 불러옵니다.
+        if self._ai is None:
+            fasttext_model = get_fasttext_model()
+            if not fasttext_model:
+                raise APIException('AI 모델을 불러오지 못했어요. 관리자에게 문의하세요.')
+            self._ai = AI(fasttext_model)
+        return self._ai
 
-        if not fasttext_model:
-            raise APIException('AI 모델을 불러오지 못했어요. 관리자에게 문의하세요.')
-        self.ai = AI(fasttext_model)
-    
     def _cache_key_proposal(self, proposal_id):
         return CacheKey.PROPOSAL_VECTOR.format(proposal_id=proposal_id)
 
-    def _calc_vectors(self, cache_key_method, posts, option:Literal['vector']|None=None):
-        valid_vectors = list()
-        for post in posts:
-            vector = cache.get(cache_key_method(post.id))
-            if not vector:
-                # 각 게시물 벡터 계산
-                vector = self.ai.vectorize(post.title + post.content)
-                cache.set(cache_key_method(post.id), vector, timeout=365*24*60*60*1) # 수정 불가능하여 데이터가 변경되는 경우가 없으므로 1년 캐싱
-            # 유효한 벡터만 필터링
-            if vector is not None:
-                if option == 'vector':
-                    valid_vectors.append(vector)
-                else:
-                    valid_vectors.append((post, vector))
-        return valid_vectors
+    def _calc_vectors(self, cache_key_method, post_ids:list[int], calculate_missing:bool=True) -> VectorResolveResult:
+        """
+        벡터 저장소에 벡터가 없는 게시물의 벡터를 캐시에서 한 번에 가져오고,
+        캐시에도 없는 게시물만 벡터를 계산하여 캐시와 저장소에 한 번에 저장합니다.
+        calculate_missing이 False면 캐시에도 없는 게시물은 계산하지 않고 건너뜁니다. (임베딩 배치 작업에서 계산)
+        """
+        result = VectorResolveResult()
+        missing_ids = self.store.missing(post_ids)
+        result.store_hits = len(post_ids) - len(missing_ids)
+        if not missing_ids:
+            return result
+
+        cache_keys = {cache_key_method(post_id): post_id for post_id in missing_ids}
+        vectors = {
+            cache_keys[key]: vector
+            for key, vector in cache.get_many(cache_keys.keys()).items()
+        }
+        result.cache_hits = len(vectors)
+
+        calculated_vectors = dict()
+        if calculate_missing:
+            posts = Proposal.objects.filter(
+                id__in=[post_id for post_id in missing_ids if post_id not in vectors],
+            ).only(
+                'id', 'title', 'content',
+            )
+            posts = list(posts)
+            calculated_vectors = dict(zip(
+                [post.id for post in posts],
+                self.ai.vectorize_many([post.title + post.content for post in posts]),
+            ))
+        result.misses = len(calculated_vectors)
+        result.skipped = len(missing_ids) - result.cache_hits - result.misses
+
+        if calculated_vectors:
+            cache.set_many(
+                {cache_key_method(post_id): vector for post_id, vector in calculated_vectors.items()},
+                timeout=PROPOSAL_VECTOR_CACHE_TIMEOUT,
+            )
+        vectors.update(calculated_vectors)
+        self.store.append(list(vectors.items()))
+
+        logger.info(
+            f"proposal vectors: requested={len(post_ids)}, store_hits={result.store_hits}, "
+            f"cache_hits={result.cache_hits}, misses={result.misses}, skipped={result.skipped}"
+        )
+        return result
 
-    @require_profile(ProfileChoices.founder)
-    def recommend_founder_scrap_proposal(self):
-        cached_result = cache.get(CacheKey.RECOMMENDED_PROPOSALS.format(
-            profile=ProfileChoices.founder.value,
-            user_id=self.request.user.id,
-        ))
-        if cached_result:
-            return cached_result
+    def _candidate_proposals(self, founder):
+        # 스크랩한 제안 또는 펀딩 있는 제안 제외 + 업종 필터링
+        return Proposal.objects.exclude(
+            Q(founder_scrap_proposal__user=founder)
+            | Q(funding__isnull=False)
+        ).filter_user_industry(
+            founder.user,
+            ProfileChoices.founder.value,
+        )
+
+    def _search_exact(self, founder, source_vector, top_k:int=3) -> list[int]:
+        proposal_ids = list(self._candidate_proposals(founder).values_list('id', flat=True))
 
+        # 추천 후보군 제안 벡터 가져오기 (벡터가 아직 없는 제안은 임베딩 배치 작업이 계산할 때까지 제외)
+        self._calc_vectors(
+            cache_key_method=self._cache_key_proposal,
+            post_ids=proposal_ids,
+            calculate_missing=False,
+        )
+
+        # 코사인 유사도 계산 및 유사도 상위 3개 제안 구하기
+        return self.store.find_top_similar(
+            source_vector=source_vector,
+            ids=proposal_ids,
+            top_k=top_k,
+        )
+
+    def _search_ann_index(self, founder, source_vector, scrapped_proposal_ids:list[int], top_k:int=3) -> list[int]:
+        """
+        업종별 근사 최근접 이웃 색인에서 후보를 좁힌 뒤, 색인이 아직 반영하지 못한 스크랩/펀딩 여부를 DB로 확인합니다.
+        """
+        ann_ids = get_proposal_ann_index().search(
+            source_vector=source_vector,
+            industries=founder.industry,
+            exclude_ids=scrapped_proposal_ids,
+            top_k=top_k,
+        )
+        valid_ids = set(self._candidate_proposals(founder).filter(id__in=ann_ids).values_list('id', flat=True))
+        return [id for id in ann_ids if id in valid_ids][:top_k]
+
+    def calc_founder_scrap_proposal_ids(self, founder) -> list[int]:
+        """
+        창업자가 스크랩한 제안과 비슷한 제안 id를 유사도 내림차순으로 계산합니다.
+        """
         # 사용자가 스크랩한 최신 제안 10개 가져오기
-        scrapped_proposals = Proposal.objects.filter(
-            founder_scrap_proposal__user=self.request.user.founder,
+        scrapped_proposal_ids = list(Proposal.objects.filter(
+            founder_scrap_proposal__user=founder,
         ).order_by(
             '-created_at',
-        )[:10]
-        if not scrapped_proposals:
+        ).values_list(
+            'id', flat=True,
+        )[:10])
+        if not scrapped_proposal_ids:
             raise NotFound('스크랩한 제안이 없어요.')
 
         # 스크랩한 제안 벡터 계산하기
-        valid_scrapped_proposals_vectors = self._calc_vectors(
+        self._calc_vectors(
             cache_key_method=self._cache_key_proposal,
-            posts=scrapped_proposals,
-            option='vector',
+            post_ids=scrapped_proposal_ids,
         )
-        if not valid_scrapped_proposals_vectors:
+        _, valid_scrapped_proposals_vectors = self.store.get_vectors(scrapped_proposal_ids)
+        if not len(valid_scrapped_proposals_vectors):
             raise ValidationError('스크랩한 제안의 내용이 유효하지 않아요.')
 
         # 모든 유효한 벡터를 평균하여 대표 벡터 생성
         source_vector = np.mean(valid_scrapped_proposals_vectors, axis=0)
 
-        # 스크랩한 제안 또는 펀딩 있는 제안 제외 + 업종 필터링
-        proposals = Proposal.objects.exclude(
-            Q(founder_scrap_proposal__user=self.request.user.founder)
-            | Q(funding__isnull=False)
-        ).filter_user_industry(
-            self.request.user,
-            ProfileChoices.founder.value,
-        )
-
-        # 추천 후보군 제안 벡터 계산하기
-        valid_proposals_and_vectors = self._calc_vectors(
-            cache_key_method=self._cache_key_proposal,
-            posts=proposals,
-        )
+        top_recommended_proposal_id_list = list()
+        if PROPOSAL_ANN_INDEX_ENABLED:
+            top_recommended_proposal_id_list = self._search_ann_index(founder, source_vector, scrapped_proposal_ids)
+        if len(top_recommended_proposal_id_list) < 3:
+            top_recommended_proposal_id_list = self._search_exact(founder, source_vector)
+        return top_recommended_proposal_id_list
 
-        # 코사인 유사도 계산 및 유사도 상위 3개 제안 구하기
-        top_recommended_proposal_id_list = self.ai.find_top_similar(
-            source_vector=source_vector,
-            items_and_vectors=valid_proposals_and_vectors,
-        )
+    def refresh_feed(self, feed:FounderRecommendationFeed) -> bool:
+        """
+        추천 피드를 다시 계산하여 저장합니다.
+        계산하는 동안 피드가 다시 무효화되었으면 덮어쓰지 않고 다음 실행에서 다시 계산합니다.
+        """
+        try:
+            proposal_ids = self.calc_founder_scrap_proposal_ids(feed.founder)
+        except (NotFound, ValidationError):
+            proposal_ids = list()
+        return bool(FounderRecommendationFeed.objects.filter(
+            pk=feed.pk,
+            updated_at=feed.updated_at,
+        ).update(
+            proposal_ids=proposal_ids,
+            is_stale=False,
+            updated_at=timezone.now(),
+        ))
 
-        top_recommended_proposals = Proposal.objects.filter(
+    @require_profile(ProfileChoices.founder)
+    def recommend_founder_scrap_proposal(self):
+        founder = self.request.user.founder
+
+        # 저장된 추천 피드 응답 (무효화된 피드도 백그라운드에서 다시 계산될 때까지 그대로 사용)
+        feed = FounderRecommendationFeed.objects.filter(founder=founder).first()
+        if feed:
+            top_recommended_proposal_id_list = feed.proposal_ids
+            if not top_recommended_proposal_id_list and not founder.founder_scrap_proposal.exists():
+                raise NotFound('스크랩한 제안이 없어요.')
+        else:
+            top_recommended_proposal_id_list = self.calc_founder_scrap_proposal_ids(founder)
+            FounderRecommendationFeed.objects.get_or_create(
+                founder=founder,
+                defaults={'proposal_ids': top_recommended_proposal_id_list},
+            )
+
+        # 피드를 저장한 뒤 스크랩했거나 펀딩이 생긴 제안은 제외
+        top_recommended_proposals = self._candidate_proposals(
+            founder,
+        ).filter(
             id__in=top_recommended_proposal_id_list
         ).annotate(
             similarity_order=Case(*[When(id=pk, then=Value(pos)) for pos, pk in enumerate(top_recommended_proposal_id_list)])
@@ -214,30 +354,490 @@ class RecommendationScrapService:
         )
 
         serializer = ProposalListSerializer(top_recommended_proposals, many=True)
-        result = serializer.data
+        return serializer.data
+
+def _parse_minutes(value) -> float:
+    """
+    "HH:MM" 문자열을 자정부터의 분으로 바꿉니다. 형식이 올바르지 않으면 NaN을 반환합니다.
+    """
+    try:
+        hour, minute = str(value).split(':')
+        return float(int(hour) * 60 + int(minute))
+    except (TypeError, ValueError):
+        return float('nan')
+
+def _business_hours_to_minutes(business_hours) -> tuple[float, float]:
+    """
+    영업시간을 (시작, 종료) 분으로 바꿉니다. 종료가 시작보다 이르면 다음 날로 넘어가는 영업시간으로 봅니다.
+    """
+    business_hours = business_hours or dict()
+    start = _parse_minutes(business_hours.get('start'))
+    end = _parse_minutes(business_hours.get('end'))
+    if end <= start:
+        end += 24 * 60
+    return start, end
+
+def _address_key(address) -> tuple:
+    address = address or dict()
+    return (address.get('sido'), address.get('sigungu'), address.get('eupmyundong'))
 
-        cache.set(
-            CacheKey.RECOMMENDED_PROPOSALS.format(
-                profile=ProfileChoices.founder.value,
-                user_id=self.request.user.id,
-            ),
-            result,
-            timeout=60*60*1, # 1시간 캐싱
+class RecommendationCalcService:
+    """
+    창업자의 업종/주소에 맞는 펀딩 없는 제안 전체를 특징 행렬로 만들어 한 번에 점수를 계산합니다.
+    - level: 제안자가 제안한 동네에서 가진 레벨 (1~3 → 0~1)
+    - local_likes: 좋아요 중 그 동네에 레벨이 있는(동네 주민인) 제안자의 비율
+    - business_hours: 제안자가 원하는 영업시간 중 창업자의 영업시간과 겹치는 비율
+    제안별로 쿼리하지 않고, 후보 전체에 대해 묶음 쿼리 3번으로 특징을 가져옵니다.
+    """
+    MAX_LEVEL = 3
+
+    def __init__(self, request:HttpRequest):
+        self.request = request
+        self.weights = RECOMMENDATION_CALC_WEIGHTS
+
+    def _candidate_proposals(self, founder):
+        # 펀딩 있는 제안 제외 + 창업자의 업종과 주소로 필터링
+        return Proposal.objects.filter(
+            funding__isnull=True,
+        ).filter_user_industry(
+            founder.user,
+            ProfileChoices.founder.value,
+        ).filter_user_address(
+            founder.user,
+            ProfileChoices.founder.value,
         )
+
+    def _load_levels(self, user_ids) -> dict[tuple, int]:
+        """
+        제안자들의 동네별 레벨을 {(제안자 id, 시도, 시군구, 읍면동): 레벨}로 한 번에 가져옵니다.
+        """
+        levels = ProposerLevel.objects.filter(
+            user_id__in=user_ids,
+        ).values_list(
+            'user_id', 'address__sido', 'address__sigungu', 'address__eupmyundong', 'level',
+        )
+        result = dict()
+        for user_id, sido, sigungu, eupmyundong, level in levels:
+            key = (user_id, sido, sigungu, eupmyundong)
+            result[key] = max(level, result.get(key, 0))
         return result
 
-class RecommendationCalcService:
+    def _calc_level(self, author_ids:list, area_keys:list[tuple], levels:dict) -> np.ndarray:
+        return np.fromiter(
+            (levels.get((author_id, *area_key), 0) for author_id, area_key in zip(author_ids, area_keys)),
+            dtype=np.float32,
+            count=len(author_ids),
+        ) / self.MAX_LEVEL
+
+    def _calc_likes_ratio(self, likes:list[tuple], index:dict, area_keys:list[tuple], levels:dict) -> np.ndarray:
+        if not likes:
+            return np.zeros(len(area_keys), dtype=np.float32)
+        rows = np.fromiter((index[proposal_id] for proposal_id, _ in likes), dtype=np.intp, count=len(likes))
+        is_local = np.fromiter(
+            ((user_id, *area_keys[index[proposal_id]]) in levels for proposal_id, user_id in likes),
+            dtype=np.float32,
+            count=len(likes),
+        )
+        total = np.bincount(rows, minlength=len(area_keys))
+        local = np.bincount(rows, weights=is_local, minlength=len(area_keys))
+        return np.divide(local, total, out=np.zeros(len(area_keys)), where=total > 0).astype(np.float32)
+
+    def _calc_business_hours(self, business_hours_list:list, founder_business_hours) -> np.ndarray:
+        founder_start, founder_end = _business_hours_to_minutes(founder_business_hours)
+        hours = np.array([_business_hours_to_minutes(business_hours) for business_hours in business_hours_list], dtype=np.float32).reshape(-1, 2)
+        start, end = hours[:, 0], hours[:, 1]
+
+        # 자정을 넘기는 영업시간도 겹치도록 창업자 영업시간을 하루 앞뒤로 옮겨 가장 많이 겹치는 값을 사용
+        overlap = np.zeros(len(hours), dtype=np.float32)
+        for shift in (-24 * 60, 0, 24 * 60):
+            overlap = np.fmax(overlap, np.minimum(end, founder_end + shift) - np.maximum(start, founder_start + shift))
+        duration = end - start
+        with np.errstate(invalid='ignore', divide='ignore'):
+            ratio = np.where(duration > 0, np.clip(overlap, 0, None) / duration, 0)
+        return np.nan_to_num(ratio, nan=0.0).astype(np.float32)
+
+    def calc_scores(self, founder) -> tuple[list[int], np.ndarray]:
+        """
+        후보 제안 id 목록과 (후보 개수,) 가중 점수를 반환합니다.
+        """
+        candidates = self._candidate_proposals(founder)
+        rows = list(candidates.values_list('id', 'user_id', 'address', 'business_hours'))
+        if not rows:
+            return list(), np.empty(0, dtype=np.float32)
+
+        proposal_ids, author_ids, addresses, business_hours_list = zip(*rows)
+        index = {proposal_id: row for row, proposal_id in enumerate(proposal_ids)}
+        area_keys = [_address_key(address) for address in addresses]
+
+        likes = list(ProposerLikeProposal.objects.filter(
+            proposal__in=candidates,
+        ).values_list(
+            'proposal_id', 'user_id',
+        ))
+        levels = self._load_levels(set(author_ids) | {user_id for _, user_id in likes})
+
+        features = np.column_stack([
+            self._calc_level(author_ids, area_keys, levels),
+            self._calc_likes_ratio(likes, index, area_keys, levels),
+            self._calc_business_hours(business_hours_list, founder.business_hours),
+        ])
+        weights = np.array([
+            self.weights.get('level', 0),
+            self.weights.get('local_likes', 0),
+            self.weights.get('business_hours', 0),
+        ], dtype=np.float32)
+        return list(proposal_ids), features @ weights
+
+    @require_profile(ProfileChoices.founder)
+    def recommend_calc(self, top_k:int=3):
+        founder = self.request.user.founder
+        proposal_ids, scores = self.calc_scores(founder)
+        if not proposal_ids:
+            raise NotFound('조건에 맞는 제안이 없어요.')
+
+        # 점수 내림차순, 같은 점수면 최신 제안 우선
+        order = np.lexsort((-np.asarray(proposal_ids), -scores))[:top_k]
+        top_proposal_ids = [proposal_ids[row] for row in order]
+
+        top_proposals = Proposal.objects.filter(
+            id__in=top_proposal_ids,
+        ).annotate(
+            score_order=Case(*[When(id=pk, then=Value(pos)) for pos, pk in enumerate(top_proposal_ids)])
+        ).order_by(
+            'score_order'
+        ).with_analytics(
+        ).with_user(
+        ).with_flags(
+            user=self.request.user,
+            profile=ProfileChoices.founder.value,
+            viewer_addr=founder.address,
+        )
+
+        serializer = ProposalListSerializer(top_proposals, many=True)
+        return serializer.data
+
+class RecommendationFundingSuccessService:
+    """
+    펀딩에 성공한 제안들의 업종별 중심 벡터와 비슷한 펀딩 없는 제안을 추천합니다.
+    중심 벡터는 펀딩 정산 작업에서 미리 계산하고, 요청마다 후보 벡터 행렬과 중심 벡터 행렬의 곱 한 번으로 점수를 구합니다.
+    """
     def __init__(self, request:HttpRequest):
         self.request = request
+        self.store = get_proposal_vector_store()
+
+    def _load_centroids(self, industries) -> tuple[dict[str, int], np.ndarray]:
+        """
+        업종별 중심 벡터를 쌓은 행렬과 {업종: 행 번호}를 반환합니다. 중심 벡터가 없는 업종은 전체 중심 벡터를 사용합니다.
+        """
+        centroids = {
+            centroid.industry: centroid.vector
+            for centroid in FundingSuccessCentroid.objects.filter(
+                Q(industry__in=industries) | Q(industry__isnull=True),
+            )
+        }
+        rows, vectors = dict(), list()
+        for industry in industries:
+            vector = centroids.get(industry) or centroids.get(None)
+            if vector:
+                rows[industry] = len(vectors)
+                vectors.append(vector)
+        return rows, np.asarray(vectors, dtype=np.float32).reshape(len(vectors), -1)
+
+    @require_profile(ProfileChoices.founder)
+    def recommend_funding_success_proposal(self, top_k:int=3):
+        founder = self.request.user.founder
+        centroid_rows, centroids = self._load_centroids(founder.industry)
+        if not centroid_rows:
+            raise NotFound('아직 펀딩에 성공한 제안이 없어요.')
+
+        # 펀딩 없는 제안 + 업종 필터링
+        candidates = dict(Proposal.objects.filter(
+            funding__isnull=True,
+        ).filter_user_industry(
+            founder.user,
+            ProfileChoices.founder.value,
+        ).values_list(
+            'id', 'industry',
+        ))
+
+        # 후보 벡터 (n, dim) @ 중심 벡터 (dim, 업종 수) 한 번으로 모든 점수를 구하고, 각 제안은 자기 업종 열을 사용
+        proposal_ids, scores = self.store.cosine_scores(candidates.keys(), centroids)
+        if not proposal_ids:
+            raise NotFound('추천할 제안이 없어요.')
+        columns = np.fromiter(
+            (centroid_rows.get(candidates[proposal_id], -1) for proposal_id in proposal_ids),
+            dtype=np.intp,
+            count=len(proposal_ids),
+        )
+        valid = columns >= 0
+        proposal_scores = np.full(len(proposal_ids), -np.inf, dtype=np.float32)
+        proposal_scores[valid] = scores[np.flatnonzero(valid), columns[valid]]
 
-    def _calc_level(self):
-        pass
+        top = np.argsort(-proposal_scores, kind='stable')[:top_k]
+        top_proposal_ids = [proposal_ids[row] for row in top if valid[row]]
 
-    def _calc_likes_ratio(self):
-        pass
+        top_proposals = Proposal.objects.filter(
+            id__in=top_proposal_ids,
+        ).annotate(
+            similarity_order=Case(*[When(id=pk, then=Value(pos)) for pos, pk in enumerate(top_proposal_ids)])
+        ).order_by(
+            'similarity_order'
+        ).with_analytics(
+        ).with_user(
+        ).with_flags(
+            user=self.request.user,
+            profile=ProfileChoices.founder.value,
+            viewer_addr=founder.address,
+        )
+
+        serializer = ProposalListSerializer(top_proposals, many=True)
+        return serializer.data
+
+def store_proposal_vectors(proposals) -> int:
+    """
+    제안 벡터를 계산하여 벡터 저장소에 추가합니다. 제안을 생성한 뒤 요청 안에서 호출해 주세요.
+    요청 안에서 모델을 불러오지 않도록, 이 프로세스에 fastText 모델과 Kiwi가 이미 올라와 있을 때만 바로 계산합니다.
+    모델이 없거나 저장에 실패해도 제안 생성은 막지 않고, 임베딩 배치 작업에서 계산합니다.
+    근사 최근접 이웃 색인에는 색인 동기화 배치 작업이 추가하고, 그 전까지는 정확한 검색으로 찾습니다.
+    """
+    fasttext_model = get_fasttext_model(load=False)
+    if not fasttext_model or _kiwi is None:
+        return 0
+
+    ai = AI(fasttext_model)
+    try:
+        vectors = ai.vectorize_many([proposal.title + proposal.content for proposal in proposals])
+        count = get_proposal_vector_store().append(list(zip(
+            [proposal.id for proposal in proposals],
+            vectors,
+        )))
+        return count
+    except Exception as e:
+        logger.warning(f"제안 벡터 저장 실패: {e}")
+        return 0
+
+def _vectorize_texts(texts:list[str]) -> np.ndarray:
+    """
+    임베딩 프로세스 풀의 워커에서 실행됩니다. 워커마다 모델과 Kiwi를 처음 한 번만 불러옵니다.
+    """
+    fasttext_model = get_fasttext_model()
+    if not fasttext_model:
+        raise RuntimeError('AI 모델을 불러오지 못했어요.')
+    return AI(fasttext_model).vectorize_many(texts)
+
+@dataclass
+class ProposalEmbeddingResult:
+    pending: int = 0   # 벡터가 없던 제안 수
+    embedded: int = 0  # 저장소에 새로 추가한 제안 수
+    empty: int = 0     # 내용을 분석할 수 없어 0 벡터로 저장한 제안 수
+    chunks: int = 0    # 처리한 묶음 수
+    failed: int = 0    # 실패한 묶음 수
+
+class ProposalEmbeddingService:
+    """
+    벡터 저장소에 벡터가 없는 제안을 찾아 묶음 단위로 프로세스 풀에서 벡터를 계산하고,
+    묶음마다 저장소와 캐시에 한 번에 저장합니다.
+    추천 요청에서는 후보 제안의 벡터를 계산하지 않으므로, 이 작업이 주기적으로 실행되어야 해요.
+    """
+    def __init__(self, chunk_size:int=PROPOSAL_EMBEDDING_CHUNK_SIZE, workers:int=PROPOSAL_EMBEDDING_WORKERS):
+        self.chunk_size = max(1, chunk_size)
+        self.workers = max(1, workers)
+        self.store = get_proposal_vector_store()
+
+    def _chunks(self, proposal_ids:list[int]):
+        for start in range(0, len(proposal_ids), self.chunk_size):
+            chunk_ids = proposal_ids[start:start + self.chunk_size]
+            rows = Proposal.objects.filter(
+                id__in=chunk_ids,
+            ).values_list(
+                'id', 'title', 'content',
+            )
+            ids, texts = list(), list()
+            for id, title, content in rows:
+                ids.append(id)
+                texts.append(title + content)
+            yield ids, texts
+
+    def _save(self, ids:list[int], vectors:np.ndarray, result:ProposalEmbeddingResult) -> None:
+        cache.set_many(
+            {CacheKey.PROPOSAL_VECTOR.format(proposal_id=id): vector for id, vector in zip(ids, vectors)},
+            timeout=PROPOSAL_VECTOR_CACHE_TIMEOUT,
+        )
+        result.embedded += self.store.append(list(zip(ids, vectors)))
+        result.empty += int((~vectors.any(axis=1)).sum())
+        result.chunks += 1
+
+    def run(self) -> ProposalEmbeddingResult:
+        result = ProposalEmbeddingResult()
+        proposal_ids = self.store.missing(
+            Proposal.objects.order_by('id').values_list('id', flat=True).iterator(chunk_size=2000)
+        )
+        result.pending = len(proposal_ids)
+        if not proposal_ids:
+            return result
+        if not get_fasttext_model():
+            logger.error("AI 모델을 불러오지 못해 제안 벡터를 계산하지 않았어요.")
+            return result
+
+        chunks = self._chunks(proposal_ids)
+        if self.workers == 1 or result.pending <= self.chunk_size:
+            for ids, texts in chunks:
+                self._save(ids, _vectorize_texts(texts), result)
+            return result
+
+        # 워커는 DB를 사용하지 않으므로, fork 전에 연결을 닫아 부모의 연결을 물려받지 않도록 합니다.
+        chunks = list(chunks)
+        connections.close_all()
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context('fork'),
+        ) as executor:
+            futures = {executor.submit(_vectorize_texts, texts): ids for ids, texts in chunks}
+            for future in as_completed(futures):
+                ids = futures[future]
+                try:
+                    vectors = future.result()
+                except Exception as e:
+                    logger.error(f"제안 벡터 계산 실패: ids={ids[0]}~{ids[-1]}, {e}")
+                    result.failed += 1
+                    continue
+                self._save(ids, vectors, result)
+        return result
 
-    def _calc_business_hours(self):
-        pass
+def sync_proposal_ann_index() -> dict[str, tuple[int, int]]:
+    """
+    업종별 근사 최근접 이웃 색인을 펀딩이 없는 제안 목록과 맞춥니다.
+    새 제안은 군집에 추가하고, 펀딩이 생긴 제안은 제외하며, 많이 커진 색인은 다시 학습합니다.
+    Returns:
+        result (dict): 업종별 (추가한 개수, 제외한 개수)
+    """
+    ann_index = get_proposal_ann_index()
+    result = dict()
+    for industry in IndustryChoices.values:
+        proposal_ids = Proposal.objects.filter(
+            industry=industry,
+            funding__isnull=True,
+        ).values_list(
+            'id', flat=True,
+        )
+        result[industry] = ann_index.sync(industry, proposal_ids)
+    return result
 
-    def recommend_calc(self):
-        pass
+def invalidate_founder_recommendation_feed(founder) -> int:
+    """
+    창업자가 제안을 스크랩하거나 스크랩을 취소하면 추천 피드를 무효화합니다. (founder는 Founder 또는 id)
+    """
+    return FounderRecommendationFeed.objects.filter(
+        founder=founder,
+    ).update(
+        is_stale=True,
+        updated_at=timezone.now(),
+    )
+
+def invalidate_industry_recommendation_feeds(industry:str) -> int:
+    """
+    해당 업종의 제안이 생성되거나 펀딩되면, 그 업종을 선택한 창업자들의 추천 피드를 무효화합니다.
+    이미 무효화된 피드도 updated_at을 올려, 지금 다시 계산 중인 결과(새 제안이 빠진 결과)가 저장되지 않게 합니다.
+    """
+    return FounderRecommendationFeed.objects.filter(
+        founder__industry__contains=[industry],
+    ).update(
+        is_stale=True,
+        updated_at=timezone.now(),
+    )
+
+def invalidate_funded_recommendation_feeds() -> int:
+    """
+    추천 피드에 담긴 제안 중 펀딩이 생긴 제안이 있는 피드만 무효화합니다. (proposal_ids && 펀딩된 제안 id 배열, 한 문장)
+    펀딩 생성 API가 없어 피드 갱신 작업에서 주기적으로 확인합니다.
+    """
+    return FounderRecommendationFeed.objects.filter(
+        is_stale=False,
+        proposal_ids__overlap=ArraySubquery(
+            Proposal.objects.filter(
+                funding__isnull=False,
+            ).values(
+                'id',
+            )
+        ),
+    ).update(
+        is_stale=True,
+        updated_at=timezone.now(),
+    )
+
+@dataclass
+class RecommendationFeedRefreshResult:
+    invalidated: int = 0  # 펀딩으로 무효화한 피드 수
+    refreshed: int = 0    # 다시 계산한 피드 수
+    skipped: int = 0      # 계산 중 다시 무효화되어 건너뛴 피드 수
+    remaining: int = 0    # 다음 실행으로 넘긴 피드 수
+
+def refresh_recommendation_feeds(limit:int=RECOMMENDATION_FEED_REFRESH_LIMIT) -> RecommendationFeedRefreshResult:
+    """
+    무효화된 추천 피드를 오래된 순서로 최대 limit개 다시 계산합니다.
+    """
+    result = RecommendationFeedRefreshResult()
+    result.invalidated = invalidate_funded_recommendation_feeds()
+
+    stale_feeds = FounderRecommendationFeed.objects.filter(
+        is_stale=True,
+    ).select_related(
+        'founder__user',
+    ).order_by(
+        'updated_at',
+    )
+    result.remaining = max(0, stale_feeds.count() - limit)
+
+    service = RecommendationScrapService()
+    for feed in stale_feeds[:limit]:
+        if service.refresh_feed(feed):
+            result.refreshed += 1
+        else:
+            result.skipped += 1
+    return result
+
+def refresh_funding_success_centroids() -> int:
+    """
+    펀딩에 성공한 제안 벡터들의 정규화된 평균을 업종별, 전체로 다시 계산하여 저장합니다.
+    펀딩 정산 작업에서 새로 성공한 펀딩이 있을 때 호출합니다.
+    Returns:
+        count (int): 저장한 중심 벡터 수
+    """
+    proposals = dict(Proposal.objects.filter(
+        funding__status=FundingStatusChoices.SUCCEEDED,
+    ).values_list(
+        'id', 'industry',
+    ))
+    if not proposals:
+        return 0
+
+    # 성공한 제안 중 아직 벡터가 없는 제안은 계산하여 저장
+    service = RecommendationScrapService()
+    service._calc_vectors(
+        cache_key_method=service._cache_key_proposal,
+        post_ids=list(proposals),
+    )
+    proposal_ids, vectors = service.store.get_vectors(list(proposals))
+    if not proposal_ids:
+        return 0
+
+    vectors = normalize_rows(vectors)
+    industries = np.array([proposals[proposal_id] for proposal_id in proposal_ids])
+    groups = [(None, np.ones(len(proposal_ids), dtype=bool))]
+    groups += [(industry, industries == industry) for industry in np.unique(industries)]
+
+    with transaction.atomic():
+        for industry, mask in groups:
+            FundingSuccessCentroid.objects.update_or_create(
+                industry=industry,
+                defaults={
+                    'vector': normalize_vector(vectors[mask].mean(axis=0)).tolist(),
+                    'proposal_count': int(mask.sum()),
+                },
+            )
+        FundingSuccessCentroid.objects.exclude(
+            industry__in=np.unique(industries).tolist(),
+        ).exclude(
+            industry__isnull=True,
+        ).delete()
+    return len(groups)
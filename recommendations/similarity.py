@@ -0,0 +1,47 @@
+import numpy as np
+
+def normalize_rows(matrix) -> np.ndarray:
+    """
+    행렬의 각 행을 L2 정규화한 float32 행렬을 반환합니다.
+    크기가 0인 행은 0으로 유지되어 어떤 벡터와도 유사도가 0이 됩니다.
+    """
+    matrix = np.asarray(matrix, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+def normalize_vector(vector) -> np.ndarray:
+    """
+    벡터를 L2 정규화한 float32 1차원 벡터를 반환합니다.
+    """
+    return normalize_rows(vector)[0]
+
+def top_k_indices(normalized_matrix:np.ndarray, source_vector, top_k:int=3) -> np.ndarray:
+    """
+    정규화된 후보 행렬에서 대표 벡터와 코사인 유사도가 가장 높은 행 번호를 유사도 내림차순으로 반환합니다.
+    행렬-벡터 곱 한 번으로 전체 유사도를 구하고, argpartition으로 상위 k개만 정렬합니다.
+    """
+    n = normalized_matrix.shape[0]
+    if n == 0 or top_k <= 0:
+        return np.empty(0, dtype=np.intp)
+
+    scores = normalized_matrix @ normalize_vector(source_vector)
+
+    if top_k < n:
+        candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+    else:
+        candidates = np.arange(n)
+    return candidates[np.argsort(-scores[candidates], kind='stable')]
+
+def rank_items(source_vector, items_and_vectors:list[tuple], top_k:int=3) -> list:
+    """
+    (항목, 벡터) 목록을 하나의 정규화된 float32 행렬로 쌓아 유사도 상위 k개 항목의 id를 반환합니다.
+    """
+    if not items_and_vectors:
+        return list()
+
+    items, vectors = zip(*items_and_vectors)
+    matrix = normalize_rows(np.vstack(vectors))
+    return [items[index].id for index in top_k_indices(matrix, source_vector, top_k)]
@@ -0,0 +1,207 @@
+import fcntl
+import os
+import threading
+from contextlib import contextmanager
+import numpy as np
+from django.conf import settings
+from .similarity import normalize_rows
+
+VECTOR_DIM = 300  # cc.ko.300.bin 벡터 차원
+
+PROPOSAL_VECTOR_STORE_DIR = getattr(
+    settings,
+    'PROPOSAL_VECTOR_STORE_DIR',
+    os.path.join(settings.BASE_DIR, 'recommendations', 'vectors'),
+)
+
+class ProposalVectorStore:
+    """
+    제안 벡터를 디스크에 연속된 float32 행렬로 저장하고, 모든 워커가 읽기 전용 메모리 맵으로 공유합니다.
+    - `vectors.f32`: (행 개수, dim) float32 행렬. 행 단위로 뒤에 이어 붙입니다.
+    - `ids.i64`: 각 행에 대응하는 제안 id(int64). 벡터를 먼저 쓰고 id를 나중에 쓰므로 id가 있는 행만 유효합니다.
+    내용을 분석할 수 없는 제안은 0 벡터로 저장하여 다시 계산하지 않고, 유사도 계산에서는 제외합니다.
+    """
+    def __init__(self, directory:str=PROPOSAL_VECTOR_STORE_DIR, dim:int=VECTOR_DIM):
+        self.directory = directory
+        self.dim = dim
+        self.row_bytes = dim * np.dtype(np.float32).itemsize
+        self.vectors_path = os.path.join(directory, 'vectors.f32')
+        self.ids_path = os.path.join(directory, 'ids.i64')
+        self.lock_path = os.path.join(directory, '.lock')
+
+        self._lock = threading.Lock()
+        self._size = 0
+        self._vectors = np.empty((0, dim), dtype=np.float32)
+        self._norms = np.empty(0, dtype=np.float32)
+        self._index = dict()
+
+    def __len__(self):
+        self._refresh()
+        return self._size
+
+    def _disk_size(self) -> int:
+        try:
+            vector_rows = os.path.getsize(self.vectors_path) // self.row_bytes
+            id_rows = os.path.getsize(self.ids_path) // np.dtype(np.int64).itemsize
+        except FileNotFoundError:
+            return 0
+        return min(vector_rows, id_rows)
+
+    def _refresh(self) -> None:
+        """
+        다른 프로세스가 추가한 행이 있으면 메모리 맵을 다시 열고 새 행만 인덱스에 반영합니다.
+        """
+        size = self._disk_size()
+        if size <= self._size:
+            return
+
+        with self._lock:
+            if size <= self._size:
+                return
+            vectors = np.memmap(self.vectors_path, dtype=np.float32, mode='r', shape=(size, self.dim))
+            ids = np.memmap(self.ids_path, dtype=np.int64, mode='r', shape=(size,))
+
+            new_rows = range(self._size, size)
+            self._index.update(zip(ids[self._size:size].tolist(), new_rows))
+            self._norms = np.concatenate([
+                self._norms,
+                np.linalg.norm(vectors[self._size:size], axis=1).astype(np.float32),
+            ])
+            self._vectors = vectors
+            self._size = size
+
+    @contextmanager
+    def _file_lock(self):
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self.lock_path, 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def missing(self, ids) -> list[int]:
+        """
+        저장소에 벡터가 없는 id 목록을 반환합니다.
+        """
+        self._refresh()
+        return [id for id in ids if id not in self._index]
+
+    def _rows(self, ids, valid_only:bool=True) -> tuple[list[int], np.ndarray]:
+        self._refresh()
+        found_ids, rows = list(), list()
+        for id in ids:
+            row = self._index.get(id)
+            if row is None:
+                continue
+            if valid_only and not self._norms[row]:
+                continue
+            found_ids.append(id)
+            rows.append(row)
+        return found_ids, np.asarray(rows, dtype=np.intp)
+
+    def get_vectors(self, ids) -> tuple[list[int], np.ndarray]:
+        """
+        유효한 벡터가 저장된 id 목록과 그 벡터들을 쌓은 (n, dim) 행렬을 반환합니다.
+        """
+        found_ids, rows = self._rows(ids)
+        return found_ids, np.asarray(self._vectors[rows])
+
+    def find_top_similar(self, source_vector, ids, top_k:int=3) -> list[int]:
+        """
+        후보 id 중 대표 벡터와 코사인 유사도가 가장 높은 상위 k개의 id를 유사도 내림차순으로 반환합니다.
+        후보가 저장소의 절반 이상이면 공유 행렬 전체에 행렬-벡터 곱을 한 번 수행하여 복사 없이 점수를 구합니다.
+        """
+        found_ids, rows = self._rows(ids)
+        if not found_ids or top_k <= 0:
+            return list()
+
+        source_vector = np.asarray(source_vector, dtype=np.float32)
+        source_norm = np.linalg.norm(source_vector)
+        if not source_norm:
+            return list()
+
+        if len(rows) * 2 >= self._size:
+            scores = (self._vectors[:self._size] @ source_vector)[rows]
+        else:
+            scores = self._vectors[rows] @ source_vector
+        scores /= self._norms[rows] * source_norm
+
+        if top_k < len(rows):
+            candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+        else:
+            candidates = np.arange(len(rows))
+        ranked = candidates[np.argsort(-scores[candidates], kind='stable')]
+        return [found_ids[index] for index in ranked]
+
+    def cosine_scores(self, ids, query_vectors) -> tuple[list[int], np.ndarray]:
+        """
+        유효한 벡터가 저장된 id 목록과, 그 벡터들과 질의 벡터들의 코사인 유사도 (n, 질의 개수) 행렬을 반환합니다.
+        find_top_similar처럼 후보가 많으면 공유 행렬 전체에 행렬 곱을 한 번 수행합니다.
+        """
+        found_ids, rows = self._rows(ids)
+        query_vectors = normalize_rows(query_vectors)
+        if not found_ids:
+            return found_ids, np.empty((0, len(query_vectors)), dtype=np.float32)
+
+        if len(rows) * 2 >= self._size:
+            scores = (self._vectors[:self._size] @ query_vectors.T)[rows]
+        else:
+            scores = self._vectors[rows] @ query_vectors.T
+        scores /= self._norms[rows, None]
+        return found_ids, scores
+
+    def append(self, ids_and_vectors:list[tuple]) -> int:
+        """
+        (id, 벡터) 목록을 저장소 끝에 추가합니다. 이미 있는 id는 건너뛰고, 벡터가 None이면 0 벡터로 저장합니다.
+        Returns:
+            count (int): 새로 추가한 행 개수
+        """
+        if not ids_and_vectors:
+            return 0
+
+        with self._file_lock():
+            self._refresh()
+            size = self._disk_size()
+
+            new_ids, new_vectors, seen = list(), list(), set()
+            for id, vector in ids_and_vectors:
+                if id in self._index or id in seen:
+                    continue
+                seen.add(id)
+                new_ids.append(id)
+                if vector is None:
+                    new_vectors.append(np.zeros(self.dim, dtype=np.float32))
+                else:
+                    new_vectors.append(np.asarray(vector, dtype=np.float32).reshape(self.dim))
+            if not new_ids:
+                return 0
+
+            # 이전 쓰기가 중간에 끊겨 id 없이 남은 벡터 행을 잘라낸 뒤 이어 씁니다.
+            with open(self.vectors_path, 'ab') as file:
+                file.truncate(size * self.row_bytes)
+                file.write(np.vstack(new_vectors).astype(np.float32).tobytes())
+                file.flush()
+                os.fsync(file.fileno())
+            with open(self.ids_path, 'ab') as file:
+                file.truncate(size * np.dtype(np.int64).itemsize)
+                file.write(np.asarray(new_ids, dtype=np.int64).tobytes())
+                file.flush()
+                os.fsync(file.fileno())
+
+        self._refresh()
+        return len(new_ids)
+
+_proposal_vector_store = None
+_proposal_vector_store_lock = threading.Lock()
+
+def get_proposal_vector_store() -> ProposalVectorStore:
+    """
+    프로세스마다 하나의 제안 벡터 저장소를 반환합니다.
+    """
+    global _proposal_vector_store
+    if _proposal_vector_store is None:
+        with _proposal_vector_store_lock:
+            if _proposal_vector_store is None:
+                _proposal_vector_store = ProposalVectorStore()
+    return _proposal_vector_store
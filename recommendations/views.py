@@ -2,12 +2,19 @@ from django.http import HttpRequest
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from .services import RecommendationScrapService
+from .services import (
+    RecommendationScrapService,
+    RecommendationCalcService,
+    RecommendationFundingSuccessService,
+)
 
 class ProposalCalc(APIView):
     def get(self, request:HttpRequest, format=None):
+        service = RecommendationCalcService(request)
+        data = service.recommend_calc()
+
         return Response(
-            '',
+            data,
             status=status.HTTP_200_OK,
         )
 
@@ -23,7 +30,10 @@ class ProposalScrapSimilarity(APIView):
 
 class ProposalFundingSuccessSimilarity(APIView):
     def get(self, request:HttpRequest, format=None):
+        service = RecommendationFundingSuccessService(request)
+        data = service.recommend_funding_success_proposal()
+
         return Response(
-            '',
+            data,
             status=status.HTTP_200_OK,
         )
@@ -0,0 +1,212 @@
+import json
+import os
+import threading
+import logging
+import numpy as np
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+FASTTEXT_MODEL_PATH = getattr(
+    settings,
+    'FASTTEXT_MODEL_PATH',
+    os.path.join(settings.BASE_DIR, 'recommendations', 'cc.ko.300.bin'),
+)
+FASTTEXT_MMAP_DIR = getattr(
+    settings,
+    'FASTTEXT_MMAP_DIR',
+    os.path.join(settings.BASE_DIR, 'recommendations', 'cc.ko.300'),
+)
+
+BOW = '<'
+EOW = '>'
+EOS = '</s>'
+
+def download_fasttext_model(lang='ko'):
+    """
+    FastText 사전훈련 모델을 다운로드합니다.
+    """
+    import fasttext.util
+
+    try:
+        # 모델 저장 경로 설정
+        model_dir = os.path.join(settings.BASE_DIR, 'recommendations')
+        os.makedirs(model_dir, exist_ok=True)
+
+        # 현재 작업 디렉토리를 모델 디렉토리로 변경
+        original_dir = os.getcwd()
+        os.chdir(model_dir)
+
+        # 모델 다운로드 (약 7GB for Korean)
+        print(f"{lang} 모델 다운로드 중...")
+        fasttext.util.download_model(lang, if_exists='ignore')
+
+        # 원래 디렉토리로 복원
+        os.chdir(original_dir)
+
+        # 모델 파일 경로 반환
+        model_path = os.path.join(model_dir, f'cc.{lang}.300.bin')
+        return model_path
+
+    except Exception as e:
+        print(f"모델 다운로드 실패: {e}")
+        os.chdir(original_dir)  # 오류 시에도 디렉토리 복원
+        return None
+
+def fasttext_hash(data:bytes) -> int:
+    """
+    fastText 사전과 같은 32비트 FNV-1a 해시입니다. (각 바이트를 부호 있는 char로 취급)
+    """
+    h = 2166136261
+    for byte in data:
+        h ^= (byte - 256 if byte >= 128 else byte) & 0xFFFFFFFF
+        h = (h * 16777619) & 0xFFFFFFFF
+    return h
+
+class MmapFastTextModel:
+    """
+    fastText 모델을 내보낸 파일들을 읽기 전용 메모리 맵으로 열어 단어 벡터를 계산합니다.
+    여러 워커가 같은 파일을 열면 운영체제 페이지 캐시를 공유하므로 워커마다 모델을 복사하지 않습니다.
+    - `meta.json`: dim, minn, maxn, bucket, nwords
+    - `input_matrix.npy`: (nwords + bucket, dim) float32 입력 행렬 (단어 행 + 서브워드 해시 버킷 행)
+    - `words.bin`, `word_offsets.npy`: UTF-8 단어를 이어 붙인 바이트열과 각 단어의 시작 위치
+    - `word_table.npy`: 단어 해시 → 단어 id 개방 주소법 해시 테이블 (빈 칸은 -1)
+    `get_word_vector`는 fasttext 라이브러리와 같은 결과를 반환합니다.
+    """
+    def __init__(self, directory:str):
+        with open(os.path.join(directory, 'meta.json')) as file:
+            meta = json.load(file)
+        self.dim = meta['dim']
+        self.minn = meta['minn']
+        self.maxn = meta['maxn']
+        self.bucket = meta['bucket']
+        self.nwords = meta['nwords']
+
+        self.input_matrix = np.load(os.path.join(directory, 'input_matrix.npy'), mmap_mode='r')
+        self.word_offsets = np.load(os.path.join(directory, 'word_offsets.npy'), mmap_mode='r')
+        self.word_table = np.load(os.path.join(directory, 'word_table.npy'), mmap_mode='r')
+        self.words = np.memmap(os.path.join(directory, 'words.bin'), dtype=np.uint8, mode='r')
+
+    def get_dimension(self) -> int:
+        return self.dim
+
+    def _word(self, word_id:int) -> bytes:
+        return self.words[self.word_offsets[word_id]:self.word_offsets[word_id + 1]].tobytes()
+
+    def get_word_id(self, word:str) -> int:
+        data = word.encode('utf-8')
+        size = len(self.word_table)
+        slot = fasttext_hash(data) % size
+        while True:
+            word_id = int(self.word_table[slot])
+            if word_id < 0:
+                return -1
+            if self._word(word_id) == data:
+                return word_id
+            slot = (slot + 1) % size
+
+    def _subword_rows(self, word:str) -> list[int]:
+        if word == EOS:
+            return list()
+        data = (BOW + word + EOW).encode('utf-8')
+        rows = list()
+        for i in range(len(data)):
+            if (data[i] & 0xC0) == 0x80:
+                continue
+            j, n = i, 1
+            while j < len(data) and n <= self.maxn:
+                j += 1
+                while j < len(data) and (data[j] & 0xC0) == 0x80:
+                    j += 1
+                if n >= self.minn and not (n == 1 and (i == 0 or j == len(data))):
+                    rows.append(self.nwords + fasttext_hash(data[i:j]) % self.bucket)
+                n += 1
+        return rows
+
+    def get_word_vector(self, word:str) -> np.ndarray:
+        word_id = self.get_word_id(word)
+        rows = ([word_id] if word_id >= 0 else []) + self._subword_rows(word)
+        if not rows:
+            return np.zeros(self.dim, dtype=np.float32)
+        return np.asarray(self.input_matrix[rows], dtype=np.float32).mean(axis=0)
+
+    @classmethod
+    def export(cls, model, directory:str) -> None:
+        """
+        불러온 fasttext 모델을 메모리 맵용 파일들로 내보냅니다.
+        """
+        os.makedirs(directory, exist_ok=True)
+        args = model.f.getArgs()
+        words = model.get_words(on_unicode_error='replace')
+
+        encoded_words = [word.encode('utf-8') for word in words]
+        word_offsets = np.zeros(len(encoded_words) + 1, dtype=np.int64)
+        word_offsets[1:] = np.cumsum([len(word) for word in encoded_words])
+
+        # 단어 수의 2배 이상인 2의 거듭제곱 크기로 해시 테이블을 만듭니다.
+        size = 1 << max(1, (2 * len(encoded_words) - 1).bit_length())
+        word_table = np.full(size, -1, dtype=np.int32)
+        for word_id, data in enumerate(encoded_words):
+            slot = fasttext_hash(data) % size
+            while word_table[slot] >= 0:
+                slot = (slot + 1) % size
+            word_table[slot] = word_id
+
+        input_matrix = np.lib.format.open_memmap(
+            os.path.join(directory, 'input_matrix.npy'),
+            mode='w+',
+            dtype=np.float32,
+            shape=(len(words) + args.bucket, args.dim),
+        )
+        input_matrix[:] = model.get_input_matrix()
+        input_matrix.flush()
+        del input_matrix
+
+        np.save(os.path.join(directory, 'word_offsets.npy'), word_offsets)
+        np.save(os.path.join(directory, 'word_table.npy'), word_table)
+        with open(os.path.join(directory, 'words.bin'), 'wb') as file:
+            file.write(b''.join(encoded_words))
+        # meta.json을 마지막에 써서, 내보내기가 끝난 디렉토리만 사용되도록 합니다.
+        with open(os.path.join(directory, 'meta.json'), 'w') as file:
+            json.dump({
+                'dim': args.dim,
+                'minn': args.minn,
+                'maxn': args.maxn,
+                'bucket': args.bucket,
+                'nwords': len(words),
+            }, file)
+
+def _load_fasttext_model():
+    try:
+        if os.path.exists(os.path.join(FASTTEXT_MMAP_DIR, 'meta.json')):
+            return MmapFastTextModel(FASTTEXT_MMAP_DIR)
+        if os.path.exists(FASTTEXT_MODEL_PATH):
+            import fasttext
+            logger.warning(
+                "메모리 맵용 fastText 파일이 없어 .bin 모델 전체를 불러와요. "
+                "recommendations.management.export_fasttext_model로 내보내 주세요."
+            )
+            return fasttext.load_model(FASTTEXT_MODEL_PATH)
+        logger.error(f"fastText 모델 파일이 없어요: {FASTTEXT_MODEL_PATH}")
+    except Exception as e:
+        logger.error(f"모델 로드 실패: {e}")
+    return None
+
+_fasttext_model = None
+_fasttext_model_loaded = False
+_fasttext_model_lock = threading.Lock()
+
+def get_fasttext_model(load:bool=True):
+    """
+    fastText 모델을 처음 사용할 때 한 번만 불러와 프로세스 안에서 공유합니다.
+    모델을 불러오지 못하면 None을 반환합니다.
+    Args:
+        load: False면 아직 불러오지 않은 모델을 새로 불러오지 않고 None을 반환합니다.
+    """
+    global _fasttext_model, _fasttext_model_loaded
+    if not _fasttext_model_loaded and load:
+        with _fasttext_model_lock:
+            if not _fasttext_model_loaded:
+                _fasttext_model = _load_fasttext_model()
+                _fasttext_model_loaded = True
+    return _fasttext_model
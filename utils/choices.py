@@ -54,6 +54,15 @@ class ZoomChoices(IntegerChoices):
     M2000  =  2_000,  '2km'
     M10000 = 10_000, '10km'
 
+class RegionCountKindChoices(TextChoices):
+    PROPOSAL = 'PROPOSAL', '제안'
+    FUNDING  = 'FUNDING',  '펀딩'
+
+class RegionLevelChoices(TextChoices):
+    SIDO        = 'SIDO',        '시도'
+    SIGUNGU     = 'SIGUNGU',     '시군구'
+    EUPMYUNDONG = 'EUPMYUNDONG', '읍면동'
+
 class FounderTargetChoices(TextChoices):
     LOCAL    = 'LOCAL',    '동네주민'
     STRANGER = 'STRANGER', '외부인'
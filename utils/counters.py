@@ -0,0 +1,50 @@
+from functools import reduce
+from operator import or_
+from django.db.models import Count, F, IntegerField, OuterRef, Q, QuerySet, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+
+def add_counts(queryset:QuerySet, **deltas:int) -> int:
+    """
+    카운터 컬럼에 F 식으로 값을 더합니다. 동시에 요청이 와도 DB에서 원자적으로 계산되고, 0 아래로 내려가지 않습니다.
+    Examples:
+        add_counts(Proposal.objects.filter(id=proposal_id), likes_count=1)
+    """
+    return queryset.update(**{
+        name: Greatest(F(name) + delta, Value(0))
+        for name, delta in deltas.items()
+    })
+
+def count_subquery(queryset:QuerySet, field:str):
+    """
+    바깥 쿼리의 행(pk)을 field로 참조하는 행 개수 서브쿼리 (없으면 0)
+    """
+    return Coalesce(
+        Subquery(
+            queryset.filter(**{field: OuterRef('pk')})
+            .order_by()
+            .values(field)
+            .annotate(number=Count('*'))
+            .values('number'),
+            output_field=IntegerField(),
+        ),
+        0,
+    )
+
+def reconcile_counters(queryset:QuerySet, expected:dict, batch_size:int=1000) -> int:
+    """
+    카운터 컬럼이 실제 값(expected의 식)과 다른 행을 찾아 실제 값으로 고칩니다.
+    Args:
+        expected: {카운터 컬럼: 실제 값을 계산하는 식(서브쿼리)}
+    Returns:
+        count (int): 고친 행 개수
+    """
+    drifted = reduce(or_, [~Q(**{name: F(f'expected_{name}')}) for name in expected])
+    ids = list(
+        queryset
+        .annotate(**{f'expected_{name}': expression for name, expression in expected.items()})
+        .filter(drifted)
+        .values_list('pk', flat=True)
+    )
+    for start in range(0, len(ids), batch_size):
+        queryset.model.objects.filter(pk__in=ids[start:start + batch_size]).update(**expected)
+    return len(ids)
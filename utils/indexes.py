@@ -0,0 +1,16 @@
+from django.db import models
+from django.db.models.fields.json import KeyTransform
+
+# 지역 필터/그룹에 쓰는 주소 JSON 키 (filter_address, with_level_area, _group_counts 등)
+ADDRESS_REGION_KEYS = ('sido', 'sigungu', 'eupmyundong')
+
+def address_region_index(name:str, field:str='address') -> models.Index:
+    '''
+    주소 JSON의 (sido, sigungu, eupmyundong) 키 식 복합 인덱스
+    `address__sido=...` 조회는 `("address" -> 'sido') = '"..."'::jsonb` 로 컴파일되므로 같은 식에 인덱스를 겁니다.
+    앞쪽 키만 쓰는 조회(시도, 시도+시군구)와 GROUP BY에도 쓸 수 있습니다.
+    '''
+    return models.Index(
+        *(KeyTransform(key, field) for key in ADDRESS_REGION_KEYS),
+        name=name,
+    )
@@ -0,0 +1,113 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from django.conf import settings
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import ValidationError
+
+PAGINATION_PAGE_SIZE = getattr(settings, 'PAGINATION_PAGE_SIZE', 20)
+PAGINATION_MAX_PAGE_SIZE = getattr(settings, 'PAGINATION_MAX_PAGE_SIZE', 100)
+
+def _json_default(value):
+    # DjangoJSONEncoder는 마이크로초를 밀리초로 자르므로, 같은 밀리초 안의 행을 건너뛰지 않도록 전체 값을 씁니다.
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f'{type(value).__name__} 값은 커서에 넣을 수 없어요.')
+
+def encode_cursor(ordering:tuple[str, ...], values:list) -> str:
+    '''
+    정렬 키와 마지막 행의 정렬 키 값을 불투명한 문자열(URL-safe base64)로 만듭니다.
+    '''
+    payload = json.dumps({'o': list(ordering), 'v': values}, default=_json_default, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+def decode_cursor(cursor:str, ordering:tuple[str, ...]) -> list:
+    '''
+    커서를 정렬 키 값 목록으로 되돌립니다. 정렬이 바뀌었거나 잘못된 커서면 ValidationError를 냅니다.
+    '''
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        values = payload['v']
+        valid = payload['o'] == list(ordering) and isinstance(values, list) and len(values) == len(ordering)
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        valid = False
+    if not valid:
+        raise ValidationError({'cursor': '올바르지 않은 커서예요. 첫 페이지부터 다시 조회해 주세요.'})
+    return values
+
+def _keyset_filter(ordering:tuple[str, ...], values:list) -> Q:
+    '''
+    (k1, k2, ...) 순서에서 커서 행 "다음"에 오는 행의 조건을 만듭니다.
+    PostgreSQL 기본값처럼 내림차순은 NULL이 앞, 오름차순은 NULL이 뒤에 온다고 봅니다.
+    '''
+    condition = Q(pk__in=[])
+    equal = Q()
+    for key, value in zip(ordering, values):
+        descending = key.startswith('-')
+        name = key.lstrip('-')
+        if value is None:
+            after = Q(**{f'{name}__isnull': False}) if descending else Q(pk__in=[])
+            same = Q(**{f'{name}__isnull': True})
+        else:
+            after = Q(**{f'{name}__lt': value}) if descending else Q(**{f'{name}__gt': value}) | Q(**{f'{name}__isnull': True})
+            same = Q(**{name: value})
+        condition |= equal & after
+        equal &= same
+    return condition
+
+def parse_page_size(query_params) -> int:
+    value = query_params.get('page_size', PAGINATION_PAGE_SIZE)
+    try:
+        page_size = int(value)
+    except (TypeError, ValueError):
+        raise ValidationError({'page_size': '정수를 입력해 주세요.'})
+    if not 1 <= page_size <= PAGINATION_MAX_PAGE_SIZE:
+        raise ValidationError({'page_size': f'1~{PAGINATION_MAX_PAGE_SIZE} 사이의 값을 입력해 주세요.'})
+    return page_size
+
+@dataclass
+class KeysetPage:
+    '''
+    Attributes:
+        items (list): 이번 페이지 행 (모델 객체 또는 values() 딕셔너리)
+        next_cursor (str|None): 다음 페이지 커서 (마지막 페이지면 None)
+    '''
+    items: list
+    next_cursor: str|None
+
+    def to_response(self, results:list) -> dict:
+        '''
+        직렬화한 결과로 목록 응답 본문을 만듭니다.
+        '''
+        return {'results': results, 'next_cursor': self.next_cursor}
+
+def paginate_keyset(queryset:QuerySet, query_params, cursor_param:str='cursor') -> KeysetPage:
+    '''
+    queryset의 정렬 키(order_by)를 기준으로 키셋(커서) 페이지를 가져옵니다.
+    OFFSET 없이 "마지막 행 다음" 조건으로 읽으므로, 뒤 페이지도 첫 페이지와 같은 비용입니다.
+    - 정렬 키는 필드/annotate 이름이어야 하고, 마지막 키는 유일한 값(id)이어야 합니다. 예: ('-created_at', '-id')
+    - query_params: cursor(이전 응답의 next_cursor), page_size(최대 PAGINATION_MAX_PAGE_SIZE)
+    '''
+    ordering = tuple(dict.fromkeys(queryset.query.order_by))
+    if not ordering or not all(isinstance(key, str) for key in ordering) or ordering[-1].lstrip('-') not in ('id', 'pk'):
+        raise ValueError('키셋 페이지네이션에는 id로 끝나는 order_by가 필요해요.')
+
+    page_size = parse_page_size(query_params)
+    cursor = query_params.get(cursor_param)
+    if cursor:
+        queryset = queryset.filter(_keyset_filter(ordering, decode_cursor(cursor, ordering)))
+
+    rows = list(queryset.order_by(*ordering)[:page_size + 1])
+    items = rows[:page_size]
+    next_cursor = None
+    if len(rows) > page_size:
+        last = items[-1]
+        names = [key.lstrip('-') for key in ordering]
+        if isinstance(last, dict):
+            values = [last[name] for name in names]
+        else:
+            values = [last.pk if name == 'pk' else getattr(last, name) for name in names]
+        next_cursor = encode_cursor(ordering, values)
+    return KeysetPage(items, next_cursor)
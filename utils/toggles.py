@@ -0,0 +1,72 @@
+from django.db import connections, router
+from django.db.models import Model, QuerySet, Subquery
+from rest_framework.exceptions import PermissionDenied
+from utils.choices import ProfileChoices
+
+def _insert_ignore_conflict(model:type[Model], values:dict, using:str) -> bool:
+    """
+    INSERT ... ON CONFLICT DO NOTHING RETURNING pk 로 한 행을 추가합니다.
+    auto_now_add 같은 기본값은 모델 필드의 pre_save로 채웁니다.
+    Returns:
+        inserted (bool): 실제로 추가했으면 True, 유니크 제약에 걸려 이미 있던 행이면 False
+    """
+    connection = connections[using]
+    opts = model._meta
+    obj = model(**values)
+    fields = [field for field in opts.concrete_fields if not field.primary_key]
+    quote = connection.ops.quote_name
+    sql = (
+        f'INSERT INTO {quote(opts.db_table)} ({", ".join(quote(field.column) for field in fields)}) '
+        f'VALUES ({", ".join(["%s"] * len(fields))}) '
+        f'ON CONFLICT DO NOTHING RETURNING {quote(opts.pk.column)}'
+    )
+    params = [
+        field.get_db_prep_save(field.pre_save(obj, add=True), connection=connection)
+        for field in fields
+    ]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.fetchone() is not None
+
+def toggle_row(model:type[Model], **values) -> int:
+    """
+    유니크 제약이 있는 관계 행(좋아요, 스크랩)을 켜고 끕니다. 최대 두 문장으로 끝나고, 같은 요청이 동시에 와도 안전합니다.
+    1. 조건부 DELETE: 지운 행이 있으면 끈 것입니다.
+    2. 지운 행이 없으면 INSERT ... ON CONFLICT DO NOTHING 으로 켭니다.
+    Args:
+        values: 행을 찾고 만들 때 쓸 값 (예: user_id=1, proposal_id=2)
+    Returns:
+        delta (int):
+            - `1`: 행 추가
+            - `-1`: 행 삭제
+            - `0`: 동시에 들어온 다른 요청이 먼저 추가해 바뀐 것이 없음 (켜진 상태)
+    """
+    using = router.db_for_write(model)
+    deleted, _ = model._default_manager.using(using).filter(**values).delete()
+    if deleted:
+        return -1
+    return 1 if _insert_ignore_conflict(model, values, using) else 0
+
+def load_toggle_target(queryset:QuerySet, owner_field:str, user, profile:ProfileChoices) -> tuple|None:
+    """
+    토글 대상의 작성자와 요청한 사용자의 프로필 id를 한 번의 조회로 가져옵니다. (require_profile의 프로필 조회를 대신합니다)
+    Args:
+        queryset: 토글 대상 한 행을 고른 쿼리셋 (예: Proposal.objects.filter(id=proposal_id))
+        owner_field: 작성자 user id 경로 (예: 'user__user_id')
+        profile: 요청한 사용자에게 필요한 프로필
+    Returns:
+        (owner_id, profile_id): 대상이 없으면 None
+    Raises:
+        PermissionDenied: 대상은 있지만 요청한 사용자에게 profile 프로필이 없는 경우
+    """
+    profile_model = user._meta.get_field(profile.value).related_model
+    row = queryset.annotate(
+        viewer_profile_id=Subquery(profile_model._default_manager.filter(user_id=user.pk).values('pk')[:1]),
+    ).values_list(
+        owner_field, 'viewer_profile_id',
+    ).first()
+    if row is None:
+        return None
+    if row[1] is None:
+        raise PermissionDenied(f"{profile.label} 프로필을 생성해 주세요.")
+    return row